@@ -0,0 +1,179 @@
+"""Tighten the bounds of a linear inclusion by optimization-based bound tightening"""
+
+__all__ = ["tighten_bounds"]
+
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+from typing import Callable
+
+import numpy as np
+
+from lp_nn_robustness_verification.data_types import (
+    IntervalArray,
+    LPMatrices,
+    NNParams,
+    RealVector,
+)
+from lp_nn_robustness_verification.linear_program import assemble_lp_matrices
+from lp_nn_robustness_verification.lp_backends import (
+    HiGHSBackend,
+    LPBackend,
+    SolveLimits,
+)
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+_BOUND_TOLERANCE = 1e-7
+"""The relative amount, by which the solver's bounds are relaxed to cover its
+feasibility tolerance"""
+
+
+def tighten_bounds(
+    linear_inclusion: LinearInclusion,
+    n_workers: int = 1,
+    time_budget: float | None = None,
+    backend_factory: Callable[[], LPBackend] = HiGHSBackend,
+) -> LinearInclusion:
+    r"""Minimize and maximize each hidden and output neuron's pre-activation
+
+    Layer by layer, starting with the second, the linear optimization problem of
+    the network up to layer :math:`i` is assembled by
+    :func:`~.linear_program.assemble_lp_matrices` from the already tightened bounds
+    of the previous layers. Each :math:`z^{(i)}_k` is minimized and maximized over
+    it and the results are written back by :meth:`.LinearInclusion.tighten_layer`
+    before the next layer is tightened. The first layer is skipped, since its
+    intervals are the exact affine image of the input region's box. The bounds
+    found are relaxed by a relative tolerance of ``1e-7`` to cover the solver's
+    feasibility tolerance.
+
+    The tightening is most effective for piecewise linear activations and for
+    linear inclusions with ``min_residual=True``, since the residual terms around
+    the midpoints of smooth activations' images often span these images entirely.
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        the linear inclusion to tighten
+    n_workers : int, optional
+        if greater than 1, each layer's neurons are distributed over as many worker
+        processes, each of which receives the layer's problem once, defaults to 1
+    time_budget : float, optional
+        the seconds available per layer, after which the remaining neurons keep
+        their bounds and running solves contribute their dual bounds, defaults to
+        no limit
+    backend_factory : Callable[[], LPBackend], optional
+        creates the backend solving the problems, defaults to
+        :class:`~.lp_backends.HiGHSBackend`
+
+    Returns
+    -------
+    LinearInclusion
+        a new linear inclusion with bounds at least as tight as the given one's
+    """
+    nn_params = linear_inclusion.nn_params
+    for layer_idx in range(2, len(nn_params.weights) + 1):
+        prefix = LinearInclusion.from_bounds(
+            linear_inclusion.uncertain_inputs,
+            linear_inclusion.activation,
+            NNParams(nn_params.biases[:layer_idx], nn_params.weights[:layer_idx]),
+            (
+                linear_inclusion.z_arrays[:layer_idx],
+                linear_inclusion.theta_arrays[: layer_idx + 1],
+                linear_inclusion.xi_is[:layer_idx],
+                linear_inclusion.r_arrays[:layer_idx],
+            ),
+            linear_inclusion.symbolic,
+            linear_inclusion.min_residual,
+        )
+        lo, hi = _bound_pre_activations(
+            assemble_lp_matrices(prefix), n_workers, time_budget, backend_factory
+        )
+        linear_inclusion = linear_inclusion.tighten_layer(
+            layer_idx,
+            IntervalArray(
+                lo - _BOUND_TOLERANCE * (1.0 + np.abs(lo)),
+                hi + _BOUND_TOLERANCE * (1.0 + np.abs(hi)),
+                linear_inclusion.sound,
+            ),
+        )
+    return linear_inclusion
+
+
+def _bound_pre_activations(
+    lp_matrices: LPMatrices,
+    n_workers: int,
+    time_budget: float | None,
+    backend_factory: Callable[[], LPBackend],
+) -> tuple[RealVector, RealVector]:
+    """Bound the last layer's pre-activations, infinite for neurons out of time"""
+    columns = lp_matrices.z_is[-1]
+    lo = np.full(len(columns), -np.inf)
+    hi = np.full(len(columns), np.inf)
+    deadline = None if time_budget is None else time() + time_budget
+    if n_workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_initialize_bounds_worker,
+            initargs=(lp_matrices, backend_factory),
+        ) as executor:
+            # The deadline limits each solve's time, so that the solves running when
+            # it passes end soon after with their dual bounds, and later ones return
+            # at once.
+            futures = [
+                executor.submit(_bound_column_in_worker, column, deadline)
+                for column in columns.tolist()
+            ]
+            for position, future in enumerate(futures):
+                lo[position], hi[position] = future.result()
+        return lo, hi
+    problem = _ColumnBounds(lp_matrices, backend_factory())
+    for position, column in enumerate(columns.tolist()):
+        lo[position], hi[position] = problem.bound(column, deadline)
+    return lo, hi
+
+
+class _ColumnBounds:
+    """Minimize and maximize single variables of one optimization problem"""
+
+    def __init__(self, lp_matrices: LPMatrices, backend: LPBackend):
+        self.n_columns = lp_matrices.shape[1]
+        self.backend = backend
+        self.backend.build(lp_matrices)
+
+    def bound(self, column: int, deadline: float | None) -> tuple[float, float]:
+        """Return the dual bounds of the variable's minimum and maximum"""
+        bounds = [-np.inf, np.inf]
+        for bound_idx, sign in enumerate((1.0, -1.0)):
+            if deadline is not None:
+                remaining = deadline - time()
+                if remaining <= 0:
+                    break
+                self.backend.set_limits(SolveLimits(time=remaining))
+            objective = np.zeros(self.n_columns)
+            objective[column] = sign
+            self.backend.set_objective(objective)
+            self.backend.solve()
+            _, dual_bound = self.backend.get_bounds()
+            if np.isfinite(dual_bound):
+                bounds[bound_idx] = sign * dual_bound
+        return bounds[0], bounds[1]
+
+
+_bounds_worker_problem: _ColumnBounds | None = None
+"""The optimization problem set up once per worker process of the process pool"""
+
+
+def _initialize_bounds_worker(
+    lp_matrices: LPMatrices, backend_factory: Callable[[], LPBackend]
+) -> None:
+    """Set up the optimization problem once when starting a worker process"""
+    global _bounds_worker_problem
+    _bounds_worker_problem = _ColumnBounds(lp_matrices, backend_factory())
+
+
+def _bound_column_in_worker(column: int, deadline: float | None) -> tuple[float, float]:
+    """Bound one variable on the worker process' optimization problem"""
+    assert _bounds_worker_problem is not None, (
+        "Somehow bounds were requested from a worker process, which has not been "
+        "initialized"
+    )
+    return _bounds_worker_problem.bound(column, deadline)
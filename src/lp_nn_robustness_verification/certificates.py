@@ -0,0 +1,131 @@
+"""Re-verify robustness by checking dual certificates instead of solving"""
+
+__all__ = ["certified_margins", "check_certificate"]
+
+import numpy as np
+
+from lp_nn_robustness_verification.data_types import (
+    DualCertificate,
+    IntervalArray,
+    RealVector,
+)
+from lp_nn_robustness_verification.linear_program import assemble_lp_matrices
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+def certified_margins(
+    linear_inclusion: LinearInclusion, certificate: DualCertificate
+) -> RealVector:
+    r"""Bound the margins from below by the certificate's dual values
+
+    The optimization problem is assembled for the given linear inclusion by
+    :func:`~.linear_program.assemble_lp_matrices`, which may differ from the one
+    the certificate was computed for, e.g. by a smaller input region. For dual
+    values :math:`y` and the margin's objective :math:`c` weak duality yields
+
+    .. math::
+
+        c^T v \geq \sum_j \min \{ y_j lhs_j, y_j rhs_j \} + \sum_k \min_{lb_k \leq
+        v_k \leq ub_k} (c - A^T y)_k v_k
+
+    for all feasible :math:`v`, where the :math:`z^{(i)}` are bounded by the linear
+    inclusion's intervals. All operations round outwards, such that the bounds are
+    valid despite the solver's tolerances, which only loosen them slightly.
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        the network and its input region to re-verify
+    certificate : DualCertificate
+        the dual values computed by :meth:`.RobustVerifier.dual_certificate`
+
+    Returns
+    -------
+    RealVector
+        the certified lower bounds of the margins per output neuron, ``np.nan`` for
+        the label and ``-np.inf`` for all competitors, if the problem's constraints
+        do not match the certificate, which may happen for piecewise linear
+        activations whose neurons' stability changed
+    """
+    lp_matrices = assemble_lp_matrices(linear_inclusion)
+    margins = np.full(len(lp_matrices.x_is[-1]), np.nan)
+    if certificate.row_duals.shape[1] != lp_matrices.shape[0]:
+        margins[certificate.competitors] = -np.inf
+        return margins
+    n_x_columns = lp_matrices.x_is[-1][-1] + 1
+    lb = np.concatenate(
+        [lp_matrices.lb[:n_x_columns]]
+        + [
+            z_i.lo[neurons_i]
+            for z_i, neurons_i in zip(
+                linear_inclusion.z_arrays, lp_matrices.neurons[1:]
+            )
+        ]
+    )
+    ub = np.concatenate(
+        [lp_matrices.ub[:n_x_columns]]
+        + [
+            z_i.hi[neurons_i]
+            for z_i, neurons_i in zip(
+                linear_inclusion.z_arrays, lp_matrices.neurons[1:]
+            )
+        ]
+    )
+    variables = IntervalArray(lb, ub)
+    transposed_constraint_matrix = lp_matrices.constraint_matrix.T.tocsr()
+    for competitor, row_duals in zip(
+        certificate.competitors.tolist(), certificate.row_duals
+    ):
+        objective = np.zeros(lp_matrices.shape[1])
+        objective[lp_matrices.x_is[-1][certificate.label]] = 1.0
+        objective[lp_matrices.x_is[-1][competitor]] = -1.0
+        reduced_costs = objective - transposed_constraint_matrix @ IntervalArray(
+            row_duals, row_duals
+        )
+        active_sides = np.where(
+            row_duals > 0,
+            lp_matrices.lhs,
+            np.where(row_duals < 0, lp_matrices.rhs, 0.0),
+        )
+        terms = np.concatenate(
+            (
+                IntervalArray(active_sides, active_sides).scale(row_duals).lo,
+                np.minimum(
+                    variables.scale(reduced_costs.lo).lo,
+                    variables.scale(reduced_costs.hi).lo,
+                ),
+            )
+        )
+        margins[competitor] = (
+            np.ones((1, len(terms))) @ IntervalArray(terms, terms)
+        ).lo[0]
+    margins[certificate.competitors] = np.nan_to_num(
+        margins[certificate.competitors], nan=-np.inf, posinf=np.inf, neginf=-np.inf
+    )
+    return margins
+
+
+def check_certificate(
+    linear_inclusion: LinearInclusion, certificate: DualCertificate
+) -> bool:
+    """Decide whether the certificate proves robustness of the linear inclusion
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        the network and its input region to re-verify
+    certificate : DualCertificate
+        the dual values computed by :meth:`.RobustVerifier.dual_certificate`
+
+    Returns
+    -------
+    bool
+        True if all margins certified by :func:`certified_margins` are positive,
+        False if robustness needs to be verified by solving again
+    """
+    return bool(
+        np.all(
+            certified_margins(linear_inclusion, certificate)[certificate.competitors]
+            > 0
+        )
+    )
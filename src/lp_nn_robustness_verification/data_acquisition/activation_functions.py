@@ -1,42 +1,163 @@
 """The activation functions ready to be used in the optimization problem"""
 
 __all__ = [
+    "identity",
     "Identity",
+    "identity_prime",
+    "identity_and_prime",
     "sigmoid",
     "Sigmoid",
     "sigmoid_prime",
+    "sigmoid_and_prime",
+    "sigmoid_chord_point",
     "quadlu",
     "QuadLU",
     "quadlu_prime",
+    "quadlu_and_prime",
+    "quadlu_chord_point",
+    "relu",
+    "ReLU",
+    "relu_prime",
+    "relu_and_prime",
 ]
 
 import numpy as np
 
 from ..data_types import ActivationFunc, RealVector
 
+_SIGMOID_PRIME_CANCELLATION = 4.0
+r"""The argument above which :math:`1 - \sigma(x)` loses more than five bits"""
 
-def sigmoid(val: np.float64 | RealVector) -> np.float64 | RealVector:
-    r"""Real-valued implementation of :math:`\sigma (x) := \frac{1}{1 + e^{-x}}`"""
-    return 1.0 / (1.0 + np.exp(-val))
 
+def sigmoid(
+    val: np.float64 | RealVector, out: RealVector | None = None
+) -> np.float64 | RealVector:
+    r"""Real-valued implementation of :math:`\sigma (x) := \frac{1}{1 + e^{-x}}`
 
-def sigmoid_prime(val: np.float64 | RealVector) -> np.float64 | RealVector:
-    r"""Real-valued implementation of :math:`\sigma'(x):=\frac{e^x}{(1+e^{x})^2}`"""
-    return sigmoid(val) * (1.0 - sigmoid(val))
+    The evaluation is numerically stable for large :math:`|x|`, where the
+    exponential overflows to infinity, and writes into ``out``, if provided.
+    """
+    return _unwrap(_reciprocal_of_one_plus_exp(np.negative(val, out=_buffer(val, out))))
 
 
-Sigmoid = ActivationFunc(sigmoid, sigmoid_prime)
-"""Provides an interface to the sigmoid activation function and its derivative
+def sigmoid_prime(
+    val: np.float64 | RealVector, out: RealVector | None = None
+) -> np.float64 | RealVector:
+    r"""Real-valued implementation of :math:`\sigma'(x):=\frac{e^x}{(1+e^{x})^2}`
 
-func : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
-    the real-valued :func:`sigmoid` activation function
-deriv : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
-    the first derivative :func:`sigmoid_prime` of the real-valued activation function
-"""
+    It is evaluated as :math:`\frac{1}{2 + 2 \cosh x}`, which does not cancel and
+    is computed in place in ``out``, if provided. See :func:`sigmoid_and_prime` to
+    obtain the values as well.
+    """
+    deriv = _buffer(val, out)
+    with np.errstate(over="ignore"):
+        np.cosh(val, out=deriv)
+    deriv *= 2.0
+    deriv += 2.0
+    np.reciprocal(deriv, out=deriv)
+    return _unwrap(deriv)
+
+
+def sigmoid_and_prime(
+    val: np.float64 | RealVector, out: tuple[RealVector, RealVector] | None = None
+) -> tuple[np.float64 | RealVector, np.float64 | RealVector]:
+    r"""Evaluate :math:`\sigma (x)` and :math:`\sigma' (x)` in one pass
+
+    Parameters
+    ----------
+    val : np.float64 or RealVector
+        the arguments
+    out : tuple[RealVector, RealVector], optional
+        the arrays to write the values and derivatives into, which must not share
+        memory with ``val``, defaults to newly allocated arrays
+
+    Returns
+    -------
+    tuple[np.float64 | RealVector, np.float64 | RealVector]
+        the values and the derivatives
+    """
+    value, deriv = _buffers(val, out)
+    _reciprocal_of_one_plus_exp(np.negative(val, out=value))
+    np.subtract(1.0, value, out=deriv)
+    deriv *= value
+    cancels = np.greater(val, _SIGMOID_PRIME_CANCELLATION)
+    np.negative(val, out=deriv, where=cancels)
+    with np.errstate(under="ignore"):
+        np.exp(deriv, out=deriv, where=cancels)
+        np.multiply(deriv, value, out=deriv, where=cancels)
+        np.multiply(deriv, value, out=deriv, where=cancels)
+    return _unwrap(value), _unwrap(deriv)
+
+
+def sigmoid_chord_point(lo: RealVector, hi: RealVector) -> RealVector:
+    r"""Find the points in intervals, where :math:`\sigma'` equals the chords' slopes
+
+    On intervals of non-positive arguments the point :math:`\xi` solves
+    :math:`\sigma(\xi) (1 - \sigma(\xi)) = m` for the chord's slope :math:`m`, i.e.
+    :math:`\sigma(\xi) = \frac{2 m}{1 + \sqrt{1 - 4 m}}`. Intervals of non-negative
+    arguments are reflected onto those by the symmetry of :math:`\sigma'`, such that
+    only the small values of :math:`\sigma` are subtracted from each other. The
+    intervals must not contain zero in their interior.
+    """
+    is_positive = np.add(lo, hi) > 0
+    left = np.where(is_positive, np.negative(hi), lo)
+    right = np.where(is_positive, np.negative(lo), hi)
+    width = right - left
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(
+            width > 0, (sigmoid(right) - sigmoid(left)) / width, sigmoid_prime(left)
+        )
+        value = 2.0 * slope / (1.0 + np.sqrt(np.maximum(1.0 - 4.0 * slope, 0.0)))
+        point = np.clip(np.log(value) - np.log1p(-value), left, right)
+    chord_point: RealVector = np.where(is_positive, np.negative(point), point)
+    return chord_point
+
+
+def identity(
+    val: np.float64 | RealVector, out: RealVector | None = None
+) -> np.float64 | RealVector:
+    r"""Real-valued implementation of :math:`y(x) := x`"""
+    if out is None:
+        return val
+    np.copyto(out, val)
+    return out
+
+
+def identity_prime(
+    val: np.float64 | RealVector, out: RealVector | None = None
+) -> np.float64 | RealVector:
+    r"""Real-valued implementation of :math:`y'(x) := 1`"""
+    if out is None:
+        return np.float64(1.0) if isinstance(val, float) else np.ones_like(val)
+    out.fill(1.0)
+    return out
+
+
+def identity_and_prime(
+    val: np.float64 | RealVector, out: tuple[RealVector, RealVector] | None = None
+) -> tuple[np.float64 | RealVector, np.float64 | RealVector]:
+    r"""Evaluate :math:`y(x) = x` and :math:`y'(x) = 1` in one pass
+
+    Parameters
+    ----------
+    val : np.float64 or RealVector
+        the arguments
+    out : tuple[RealVector, RealVector], optional
+        the arrays to write the values and derivatives into, defaults to the
+        arguments themselves and a newly allocated array
+
+    Returns
+    -------
+    tuple[np.float64 | RealVector, np.float64 | RealVector]
+        the values and the derivatives
+    """
+    if out is None:
+        return val, identity_prime(val)
+    return identity(val, out[0]), identity_prime(val, out[1])
 
 
 Identity = ActivationFunc(
-    lambda x: x, lambda x: 1.0 if isinstance(x, float) else np.ones_like(x)
+    identity, identity_prime, convexity=(0,), fused=identity_and_prime
 )
 """Provides an interface to the identity activation function and its derivative
 
@@ -44,11 +165,15 @@ func : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
     the real-valued identity activation function :math:`y(x) = x`
 deriv : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
     the first derivative of the real-valued identity function :math:`y(x) = 1`
+fused
+    the fused kernel :func:`identity_and_prime`
+monotone, breakpoints, convexity
+    increasing and affine on the whole real line
 """
 
 
 def quadlu(
-    val: np.float64 | RealVector, alpha: float = 0.25
+    val: np.float64 | RealVector, alpha: float = 0.25, out: RealVector | None = None
 ) -> np.float64 | RealVector:
     r"""Real-valued implementation of :math:`\operatorname{QuaLU} (x)`
 
@@ -64,59 +189,218 @@ def quadlu(
               4\alpha x, &\quad \text{for } x \geq \alpha \\
             \end{cases}
 
-        with :math:`\alpha \in \mathbb{R}_+`.
+        with :math:`\alpha \in \mathbb{R}_+`. The values are written into ``out``, if
+        provided, which must not share memory with ``val``.
     """
-    less_or_equal_mask = val <= -alpha
-    greater_or_equal_mask = val >= alpha
-    if isinstance(val, float):
-        if less_or_equal_mask:
-            return 0.0
-        if greater_or_equal_mask:
-            return 4.0 * alpha * val
-        return np.square(val + alpha)
-    assert isinstance(val, np.ndarray)
-    result = np.zeros_like(val)
-    result[greater_or_equal_mask] = 4.0 * alpha * val[greater_or_equal_mask]
-    in_between_mask = ~(less_or_equal_mask | greater_or_equal_mask)
-    result[in_between_mask] = np.square(val[in_between_mask] + alpha)
-    return result
+    value = _buffer(val, out)
+    np.add(val, alpha, out=value)
+    np.clip(value, 0.0, 2.0 * alpha, out=value)
+    np.square(value, out=value)
+    np.multiply(val, 4.0 * alpha, out=value, where=np.greater_equal(val, alpha))
+    return _unwrap(value)
 
 
 def quadlu_prime(
-    val: np.float64 | RealVector, alpha: float = 0.25
+    val: np.float64 | RealVector, alpha: float = 0.25, out: RealVector | None = None
+) -> np.float64 | RealVector:
+    r"""Real-valued implementation of :math:`\operatorname{QuaLU}' (x)`
+
+    It is evaluated as :math:`2 \min(\max(x + \alpha, 0), 2 \alpha)` into ``out``,
+    if provided.
+    """
+    deriv = _buffer(val, out)
+    np.add(val, alpha, out=deriv)
+    np.clip(deriv, 0.0, 2.0 * alpha, out=deriv)
+    deriv *= 2.0
+    return _unwrap(deriv)
+
+
+def quadlu_and_prime(
+    val: np.float64 | RealVector,
+    alpha: float = 0.25,
+    out: tuple[RealVector, RealVector] | None = None,
+) -> tuple[np.float64 | RealVector, np.float64 | RealVector]:
+    r"""Evaluate :math:`\operatorname{QuadLU}_\alpha` and its derivative in one pass
+
+    Both share the clipped shifted argument :math:`\min(\max(x + \alpha, 0),
+    2 \alpha)`, such that besides the results only the mask of the linear part is
+    allocated.
+
+    Parameters
+    ----------
+    val : np.float64 or RealVector
+        the arguments
+    alpha : float, optional
+        the parameter :math:`\alpha`, defaults to 0.25
+    out : tuple[RealVector, RealVector], optional
+        the arrays to write the values and derivatives into, which must not share
+        memory with ``val``, defaults to newly allocated arrays
+
+    Returns
+    -------
+    tuple[np.float64 | RealVector, np.float64 | RealVector]
+        the values and the derivatives
+    """
+    value, deriv = _buffers(val, out)
+    np.add(val, alpha, out=deriv)
+    np.clip(deriv, 0.0, 2.0 * alpha, out=deriv)
+    np.square(deriv, out=value)
+    np.multiply(val, 4.0 * alpha, out=value, where=np.greater_equal(val, alpha))
+    deriv *= 2.0
+    return _unwrap(value), _unwrap(deriv)
+
+
+def quadlu_chord_point(
+    lo: RealVector, hi: RealVector, alpha: float = 0.25
+) -> RealVector:
+    r"""Find the points in intervals, where the derivative equals the chords' slopes
+
+    Since :math:`\operatorname{QuadLU}_\alpha' (x) = 2 (x + \alpha)` between the
+    breakpoints, the point is :math:`\frac{m}{2} - \alpha` for the chord's slope
+    :math:`m` clipped into the interval.
+    """
+    width = np.subtract(hi, lo)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(
+            width > 0,
+            (quadlu(hi, alpha) - quadlu(lo, alpha)) / width,
+            quadlu_prime(lo, alpha),
+        )
+    chord_point: RealVector = np.clip(0.5 * slope - alpha, lo, hi)
+    return chord_point
+
+
+def relu(
+    val: np.float64 | RealVector, out: RealVector | None = None
 ) -> np.float64 | RealVector:
-    r"""Real-valued implementation of :math:`\operatorname{QuaLU}' (x)"""
-    if isinstance(val, float):
-        if val <= -alpha:
-            return 0
-        if val >= alpha:
-            return 4.0 * alpha
-        return 2 * (val + alpha)
-    assert isinstance(val, np.ndarray)
-    result = np.zeros_like(val)
-    less_or_equal_mask = val <= -alpha
-    greater_or_equal_mask = val >= alpha
-    result[greater_or_equal_mask] = 4.0 * alpha
-    in_between_mask = ~(less_or_equal_mask | greater_or_equal_mask)
-    result[in_between_mask] = 2 * (val[in_between_mask] + alpha)
+    r"""Real-valued implementation of :math:`\operatorname{ReLU} (x) := \max(x, 0)`"""
+    return _unwrap(np.maximum(val, 0.0, out=_buffer(val, out)))
+
+
+def relu_prime(
+    val: np.float64 | RealVector, out: RealVector | None = None
+) -> np.float64 | RealVector:
+    r"""Real-valued implementation of :math:`\operatorname{ReLU}' (x)`
+
+    The derivative is 1 for positive and 0 for non-positive arguments, i.e. at the
+    kink the left-hand derivative is chosen.
+    """
+    deriv = _buffer(val, out)
+    np.greater(val, 0.0, out=deriv, casting="unsafe")
+    return _unwrap(deriv)
+
+
+def relu_and_prime(
+    val: np.float64 | RealVector, out: tuple[RealVector, RealVector] | None = None
+) -> tuple[np.float64 | RealVector, np.float64 | RealVector]:
+    r"""Evaluate :math:`\operatorname{ReLU}` and its derivative in one pass
+
+    Parameters
+    ----------
+    val : np.float64 or RealVector
+        the arguments
+    out : tuple[RealVector, RealVector], optional
+        the arrays to write the values and derivatives into, defaults to newly
+        allocated arrays
+
+    Returns
+    -------
+    tuple[np.float64 | RealVector, np.float64 | RealVector]
+        the values and the derivatives
+    """
+    value, deriv = _buffers(val, out)
+    return relu(val, value), relu_prime(val, deriv)
+
+
+def _reciprocal_of_one_plus_exp(buffer: RealVector) -> RealVector:
+    r"""Replace :math:`y` by :math:`\frac{1}{1 + e^y}` in place silently overflowing"""
+    with np.errstate(over="ignore", under="ignore"):
+        np.exp(buffer, out=buffer)
+    buffer += 1.0
+    np.reciprocal(buffer, out=buffer)
+    return buffer
+
+
+def _buffer(val: np.float64 | RealVector, out: RealVector | None) -> RealVector:
+    """Provide an array of the arguments' shape to write results into"""
+    return np.empty(np.shape(val)) if out is None else out
+
+
+def _buffers(
+    val: np.float64 | RealVector, out: tuple[RealVector, RealVector] | None
+) -> tuple[RealVector, RealVector]:
+    """Provide two arrays of the arguments' shape to write results into"""
+    return (np.empty(np.shape(val)), np.empty(np.shape(val))) if out is None else out
+
+
+def _unwrap(result: RealVector) -> np.float64 | RealVector:
+    """Return results for scalar arguments as scalars"""
+    if result.ndim == 0:
+        return np.float64(result[()])
     return result
 
 
-Sigmoid = ActivationFunc(sigmoid, sigmoid_prime)
+Sigmoid = ActivationFunc(
+    sigmoid,
+    sigmoid_prime,
+    breakpoints=(0.0,),
+    convexity=(1, -1),
+    fused=sigmoid_and_prime,
+    chord_point=sigmoid_chord_point,
+)
 """Provides an interface to the sigmoid activation function and its derivative
 
 func : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
     the real-valued :func:`sigmoid` activation function
 deriv : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
     the first derivative :func:`sigmoid_prime` of the real-valued activation function
+fused
+    the fused kernel :func:`sigmoid_and_prime`
+monotone, breakpoints, convexity
+    increasing, convex for negative and concave for positive arguments
+chord_point
+    the closed form :func:`sigmoid_chord_point`
 """
 
 
-QuadLU = ActivationFunc(quadlu, quadlu_prime)
+QuadLU = ActivationFunc(
+    quadlu,
+    quadlu_prime,
+    breakpoints=(-0.25, 0.25),
+    convexity=(0, 1, 0),
+    fused=quadlu_and_prime,
+    chord_point=quadlu_chord_point,
+)
 """Provides an interface to the QuadLU activation function and its derivative
 
 func : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
     the real-valued :func:`quadlu` activation function
 deriv : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
     the first derivative :func:`quadlu_prime` of the real-valued activation function
+fused
+    the fused kernel :func:`quadlu_and_prime`
+monotone, breakpoints, convexity
+    non-decreasing, constant below :math:`-\\alpha`, quadratic in between and linear
+    above :math:`\\alpha` for the default :math:`\\alpha = 0.25`
+chord_point
+    the closed form :func:`quadlu_chord_point`
+"""
+
+
+ReLU = ActivationFunc(
+    relu, relu_prime, breakpoints=(0.0,), convexity=(0, 0), fused=relu_and_prime
+)
+"""Provides an interface to the ReLU activation function and its derivative
+
+Since it is piecewise linear with a single kink, :class:`~.RobustVerifier` encodes
+it exactly for stable neurons and by the triangle relaxation for unstable ones.
+
+func : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
+    the real-valued :func:`relu` activation function
+deriv : :data:`~lp_nn_robustness_verification.type_aliases.RealScalarFunction`
+    the first derivative :func:`relu_prime` of the real-valued activation function
+fused
+    the fused kernel :func:`relu_and_prime`
+monotone, breakpoints, convexity
+    non-decreasing, constant for negative and linear for positive arguments
 """
@@ -3,45 +3,77 @@
 __all__ = ["UncertainInputs"]
 
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
-from interval import interval
+from scipy.sparse import csr_matrix  # type: ignore[import]
 
-from ..data_types import Intervals, RealMatrix, RealVector, UncertainArray
+from ..data_types import (
+    IntervalArray,
+    Intervals,
+    RealMatrix,
+    RealVector,
+    UncertainArray,
+)
 
 
 @dataclass
 class UncertainInputs:
     r"""A unified interface to a collection of uncertain inputs
 
+    For uncertainties given as a vector, the input region is the box
+    :math:`\Theta^{(0)}` of the values plus or minus their uncertainties. For
+    uncertainties given as a covariance matrix :math:`\Sigma`, the input region is
+    the ellipsoid :math:`\{x + G v \colon \|v\|_2 \leq 1\}` of one standard
+    uncertainty with a factor :math:`G G^T = \Sigma`. It is enclosed by the box
+    :math:`\Theta^{(0)}` with radii :math:`\sqrt{\Sigma_{kk}}` and by the zonotope
+    :math:`x + G \varepsilon, \varepsilon \in [-1, 1]^m`, which keeps the
+    correlation between the inputs.
+
     Parameters
     ----------
-    uncertain_values : UncertainArray, optional
+    uncertain_values : UncertainArray or IntervalArray, optional
         Values with associated uncertainties, defaults to the 2-d point :math:`x = (
         \frac{1}{2}, \frac{1}{2})` with uncertainties :math:`u(x) = (\frac{1}{2},
-        \frac{1}{2})`
+        \frac{1}{2})`. The uncertainties are either a vector or a symmetric positive
+        semidefinite covariance matrix. If an :class:`~.data_types.IntervalArray` is
+        provided instead, it is used as input region directly and the values and
+        uncertainties are set to its midpoints and radii.
+    generators : RealMatrix, optional
+        the factor :math:`G` of shape ``(n_inputs, n_generators)`` of the covariance
+        matrix, defaults to its principal axes scaled by the square roots of the
+        positive eigenvalues
     """
 
     uncertain_values: UncertainArray
-    theta_0: Intervals
+    theta_0_array: IntervalArray
 
-    def __init__(self, uncertain_values: UncertainArray | None = None) -> None:
+    def __init__(
+        self,
+        uncertain_values: UncertainArray | IntervalArray | None = None,
+        generators: RealMatrix | None = None,
+    ) -> None:
         """Uncertain inputs i.e. an array of values and an array of uncertainties"""
         if uncertain_values is None:
             self.uncertain_values = UncertainArray(
                 np.array([0.5, 0.5]), np.array([0.5, 0.5])
             )
+        elif isinstance(uncertain_values, IntervalArray):
+            self.uncertain_values = UncertainArray(
+                uncertain_values.midpoint, uncertain_values.radius
+            )
         else:
             self.uncertain_values = uncertain_values
-        assert (
-            len(self.uncertain_values.values.shape)
-            == len(self.uncertain_values.uncertainties.shape)
-            == 1
+        uncertainties_shape = self.uncertain_values.uncertainties.shape
+        assert len(self.uncertain_values.values.shape) == 1 and (
+            len(uncertainties_shape) == 1
+            or len(uncertainties_shape) == 2
+            and uncertainties_shape[0] == uncertainties_shape[1]
         ), (
-            f"Either one or both of the values and the uncertainties are not given "
-            f"as a vector but the values are of shape "
-            f"{self.uncertain_values.values.shape} and the uncertainties of "
-            f"shape {self.uncertain_values.uncertainties.shape}"
+            f"Either the values are not given as a vector or the uncertainties are "
+            f"neither a vector nor a square covariance matrix but the values are of "
+            f"shape {self.uncertain_values.values.shape} and the uncertainties of "
+            f"shape {uncertainties_shape}"
         )
         assert len(self.uncertain_values.values) == len(
             self.uncertain_values.uncertainties
@@ -50,13 +82,46 @@ class UncertainInputs:
             f"but the values are of length {len(self.uncertain_values.values)} and "
             f"the uncertainties of length {len(self.uncertain_values.uncertainties)}"
         )
-        self.theta_0 = self._build_theta_0()
-        assert len(self.theta_0) == len(self.uncertain_values.values), (
+        if generators is not None:
+            assert self.correlated and generators.shape[0] == len(
+                self.uncertain_values.values
+            ), (
+                f"Somehow generators of shape {generators.shape} are provided for "
+                f"uncertainties of shape {uncertainties_shape}, but they are only "
+                f"used as factor of a covariance matrix of one row per input"
+            )
+            self.generators = generators
+        if isinstance(uncertain_values, IntervalArray):
+            self.theta_0_array = uncertain_values
+        else:
+            self.theta_0_array = self._build_theta_0()
+        assert len(self.theta_0_array) == len(self.uncertain_values.values), (
             f"Somehow there were not as many intervals calculated as there are values, "
-            f"but there are {len(self.theta_0)} intervals and each "
+            f"but there are {len(self.theta_0_array)} intervals and each "
             f"{len(self.uncertain_values.values)} values and uncertainties"
         )
 
+    @classmethod
+    def from_covariance_factor(
+        cls, values: RealVector, generators: RealMatrix
+    ) -> "UncertainInputs":
+        """Construct correlated inputs from a factor of their covariance matrix
+
+        Parameters
+        ----------
+        values : RealVector
+            the values
+        generators : RealMatrix
+            the factor :math:`G` of the covariance matrix :math:`G G^T` of shape
+            ``(n_inputs, n_generators)``
+
+        Returns
+        -------
+        UncertainInputs
+            the inputs with the zonotope spanned by the factor as input region
+        """
+        return cls(UncertainArray(values, generators @ generators.T), generators)
+
     @property
     def values(self) -> RealVector:
         """the corresponding values"""
@@ -67,9 +132,41 @@ class UncertainInputs:
         """... and their associated uncertainties"""
         return self.uncertain_values.uncertainties
 
-    def _build_theta_0(self) -> Intervals:
-        """Construct the interval arithmetically enabled datastructure"""
-        return Intervals(
-            interval[value - uncertainty, value + uncertainty]
-            for value, uncertainty in zip(*self.uncertain_values)
+    @property
+    def correlated(self) -> bool:
+        """whether the uncertainties are given as a covariance matrix"""
+        return self.uncertain_values.uncertainties.ndim == 2
+
+    @cached_property
+    def generators(self) -> RealMatrix | csr_matrix:
+        r"""the generators :math:`G` of the zonotope enclosing the input region
+
+        For uncertainties given as a vector these are the columns of the diagonal
+        matrix of the positive uncertainties, which is returned in sparse format.
+        """
+        if not self.correlated:
+            uncertainties = self.uncertain_values.uncertainties
+            uncertain = np.flatnonzero(uncertainties > 0)
+            return csr_matrix(
+                (uncertainties[uncertain], (uncertain, np.arange(len(uncertain)))),
+                shape=(len(uncertainties), len(uncertain)),
+            )
+        eigenvalues, eigenvectors = np.linalg.eigh(self.uncertain_values.uncertainties)
+        positive = eigenvalues > 0
+        generators: RealMatrix = eigenvectors[:, positive] * np.sqrt(
+            eigenvalues[positive]
         )
+        return generators
+
+    @cached_property
+    def theta_0(self) -> Intervals:
+        """the input intervals as tuple of interval arithmetically enabled objects"""
+        return self.theta_0_array.to_intervals()
+
+    def _build_theta_0(self) -> IntervalArray:
+        """Construct the interval arithmetically enabled datastructure"""
+        if self.correlated:
+            return IntervalArray.from_center_and_radius(
+                self.values, np.sqrt(np.diag(self.uncertain_values.uncertainties))
+            )
+        return IntervalArray.from_center_and_radius(*self.uncertain_values)
@@ -2,27 +2,36 @@
 
 __all__ = [
     "ActivationFunc",
+    "ChordPointFunction",
+    "DualCertificate",
+    "FusedScalarFunction",
+    "IntervalArray",
+    "IntervalArrayCollection",
     "Intervals",
     "IntervalCollection",
+    "IndexVector",
     "LayerIdx",
+    "LPMatrices",
     "NeuronIdx",
     "NNParams",
     "RealMatrix",
-    "RealVars",
     "RealVector",
     "RealScalarFunction",
     "UncertainArray",
     "VectorOfRealMatrices",
+    "VerificationResult",
     "VectorOfRealVectors",
+    "WeightMatrix",
 ]
 
 from dataclasses import dataclass
-from typing import Callable, cast, Iterator, NamedTuple, TypeAlias
+from pathlib import Path
+from typing import Any, Callable, cast, Iterator, NamedTuple, TypeAlias
 
 import numpy as np
-from interval import interval
+from interval import fpu, interval
 from numpy._typing import NDArray
-from pyscipopt.scip import Variable  # type: ignore[import]
+from scipy.sparse import csr_matrix, issparse  # type: ignore[import]
 
 RealMatrix: TypeAlias = NDArray[np.float64]
 """A real matrix represented by a :class:`np.ndarray <numpy.ndarray>`"""
@@ -36,6 +45,14 @@ RealScalarFunction: TypeAlias = Callable[
     [np.float64 | RealVector], np.float64 | RealVector
 ]
 """A real-valued function with one real argument"""
+FusedScalarFunction: TypeAlias = Callable[
+    ..., tuple[np.float64 | RealVector, np.float64 | RealVector]
+]
+"""A real-valued function with one real argument returning values and derivatives"""
+ChordPointFunction: TypeAlias = Callable[
+    [RealMatrix | RealVector, RealMatrix | RealVector], RealMatrix | RealVector
+]
+"""A function mapping the bounds of intervals to one point within each interval"""
 Intervals: TypeAlias = tuple[interval, ...]
 """A tuple of intervals on the real number line each enabled for interval arithmetics"""
 IntervalCollection: TypeAlias = tuple[Intervals, ...]
@@ -44,8 +61,238 @@ LayerIdx: TypeAlias = int
 """Index of a layer of a neural network"""
 NeuronIdx: TypeAlias = int
 """Index of a neuron in a layer of a neural network"""
-RealVars: TypeAlias = dict[tuple[LayerIdx, NeuronIdx], Variable]
-"""The real variables in the linear optimization problem"""
+IndexVector: TypeAlias = NDArray[np.int64]
+"""A vector of indices, e.g. of the variables or constraints of a linear program"""
+WeightMatrix: TypeAlias = RealMatrix | csr_matrix
+"""A weight matrix either dense or sparse in compressed sparse row format"""
+
+
+class IntervalArray:
+    """A compact representation of an array of intervals on the real number line
+
+    The lower and upper bounds are stored in two contiguous float64 arrays of the
+    same shape, such that all interval operations are carried out vectorized. In
+    *sound* mode all operations round outwards by switching the FPU's rounding mode
+    like :mod:`interval` does it, such that the results are guaranteed enclosures.
+    In *fast* mode the operations are carried out with the default rounding to
+    nearest, which is faster but not guaranteed to enclose the exact results.
+
+    Parameters
+    ----------
+    lo : RealVector
+        the lower bounds of the intervals
+    hi : RealVector
+        the upper bounds of the intervals, each at least as large as the
+        corresponding lower bound
+    sound : bool, optional
+        if True (default) all operations round outwards, otherwise to nearest
+    """
+
+    __array_ufunc__ = None
+    lo: RealVector
+    """the lower bounds of the intervals"""
+    hi: RealVector
+    """the upper bounds of the intervals"""
+    sound: bool
+    """if True all operations round outwards, otherwise to nearest"""
+
+    def __init__(self, lo: RealVector, hi: RealVector, sound: bool = True):
+        self.lo = np.ascontiguousarray(lo, dtype=np.float64)
+        self.hi = np.ascontiguousarray(hi, dtype=np.float64)
+        assert self.lo.shape == self.hi.shape, (
+            f"Somehow lower and upper bounds are not of the same shape but the lower "
+            f"bounds are of shape {self.lo.shape} and the upper bounds of shape "
+            f"{self.hi.shape}"
+        )
+        self.sound = sound
+
+    @classmethod
+    def from_intervals(
+        cls, intervals: Intervals, sound: bool = True
+    ) -> "IntervalArray":
+        """Construct an interval array from a tuple of intervals"""
+        return cls(
+            np.array([interval_k[0].inf for interval_k in intervals]),
+            np.array([interval_k[0].sup for interval_k in intervals]),
+            sound,
+        )
+
+    @classmethod
+    def from_center_and_radius(
+        cls,
+        center: RealMatrix | RealVector,
+        radius: RealMatrix | RealVector,
+        sound: bool = True,
+    ) -> "IntervalArray":
+        """Construct the intervals :math:`[c - r, c + r]` from centers and radii"""
+        return cls(
+            _round_down(lambda: center - radius, sound),
+            _round_up(lambda: center + radius, sound),
+            sound,
+        )
+
+    def to_intervals(self) -> Intervals:
+        """Construct a tuple of intervals from the flattened interval array"""
+        return Intervals(
+            interval[inf, sup]
+            for inf, sup in zip(self.lo.ravel().tolist(), self.hi.ravel().tolist())
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """the shape of the interval array"""
+        return self.lo.shape
+
+    @property
+    def midpoint(self) -> RealMatrix | RealVector:
+        """the midpoints of the intervals rounded to nearest"""
+        return (self.lo + self.hi) / 2
+
+    @property
+    def width(self) -> RealMatrix | RealVector:
+        """the widths of the intervals, in sound mode rounded upwards"""
+        return _round_up(lambda: self.hi - self.lo, self.sound)
+
+    @property
+    def radius(self) -> RealMatrix | RealVector:
+        """the radii of the intervals w.r.t. their midpoints, in sound mode enclosing"""
+        return _round_up(
+            lambda: np.maximum(self.midpoint - self.lo, self.hi - self.midpoint),
+            self.sound,
+        )
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> NDArray[np.object_]:
+        """Appear as opaque object, such that sparse matrices defer products to us"""
+        opaque = np.empty((), dtype=object)
+        opaque[()] = self
+        return opaque
+
+    def __len__(self) -> int:
+        return len(self.lo)
+
+    def __getitem__(self, key: Any) -> "IntervalArray":
+        return IntervalArray(self.lo[key], self.hi[key], self.sound)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return bool(np.array_equal(self.lo, other.lo)) and bool(
+            np.array_equal(self.hi, other.hi)
+        )
+
+    def __repr__(self) -> str:
+        return f"IntervalArray(lo={self.lo!r}, hi={self.hi!r}, sound={self.sound})"
+
+    def __neg__(self) -> "IntervalArray":
+        return IntervalArray(-self.hi, -self.lo, self.sound)
+
+    def __add__(
+        self, other: "IntervalArray | RealMatrix | RealVector | float"
+    ) -> "IntervalArray":
+        if isinstance(other, IntervalArray):
+            sound = self.sound or other.sound
+            return IntervalArray(
+                _round_down(lambda: self.lo + other.lo, sound),
+                _round_up(lambda: self.hi + other.hi, sound),
+                sound,
+            )
+        return IntervalArray(
+            _round_down(lambda: self.lo + other, self.sound),
+            _round_up(lambda: self.hi + other, self.sound),
+            self.sound,
+        )
+
+    def __radd__(self, other: RealMatrix | RealVector | float) -> "IntervalArray":
+        return self + other
+
+    def __sub__(
+        self, other: "IntervalArray | RealMatrix | RealVector | float"
+    ) -> "IntervalArray":
+        return self + (-other)
+
+    def __rsub__(self, other: RealMatrix | RealVector | float) -> "IntervalArray":
+        return (-self) + other
+
+    def scale(self, factors: RealMatrix | RealVector | float) -> "IntervalArray":
+        """Multiply the intervals elementwise by real factors"""
+        return IntervalArray(
+            _round_down(
+                lambda: np.minimum(factors * self.lo, factors * self.hi), self.sound
+            ),
+            _round_up(
+                lambda: np.maximum(factors * self.lo, factors * self.hi), self.sound
+            ),
+            self.sound,
+        )
+
+    def intersection(self, other: "IntervalArray") -> "IntervalArray":
+        """Intersect the intervals elementwise with other enclosures of the same values
+
+        The bounds are only compared, such that no rounding is involved.
+        """
+        return IntervalArray(
+            np.maximum(self.lo, other.lo),
+            np.minimum(self.hi, other.hi),
+            self.sound or other.sound,
+        )
+
+    def __mul__(self, other: RealMatrix | RealVector | float) -> "IntervalArray":
+        return self.scale(other)
+
+    def __rmul__(self, other: RealMatrix | RealVector | float) -> "IntervalArray":
+        return self.scale(other)
+
+    def __rmatmul__(self, matrix: RealMatrix) -> "IntervalArray":
+        r"""Enclose :math:`A x` for all :math:`x` in the intervals
+
+        The intervals are converted into center/radius form :math:`\langle c, r
+        \rangle` and the enclosure is computed as :math:`A c \pm |A| r`, as proposed
+        by Rump for fast interval matrix-vector products.
+        """
+        center = _round_up(lambda: self.lo + (self.hi - self.lo) / 2, self.sound)
+        radius = _round_up(lambda: center - self.lo, self.sound)
+        radius_image = _round_up(lambda: abs(matrix) @ radius, self.sound)
+        return IntervalArray(
+            _round_down(lambda: matrix @ center - radius_image, self.sound),
+            _round_up(lambda: matrix @ center + radius_image, self.sound),
+            self.sound,
+        )
+
+    def __matmul__(self, matrix: RealMatrix) -> "IntervalArray":
+        r"""Enclose :math:`x A` for all :math:`x` in the intervals"""
+        transposed_product: IntervalArray = matrix.T @ self.T
+        return transposed_product.T
+
+    @property
+    def T(self) -> "IntervalArray":  # pylint: disable=invalid-name
+        """the transposed interval array"""
+        return IntervalArray(self.lo.T, self.hi.T, self.sound)
+
+
+def _round_down(
+    computation: Callable[[], RealMatrix | RealVector], sound: bool
+) -> RealMatrix | RealVector:
+    """Carry out a computation rounding downwards in sound mode, to nearest otherwise
+
+    Overflows are silently rounded towards infinity, which are valid bounds.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        return fpu.down(computation) if sound else computation()
+
+
+def _round_up(
+    computation: Callable[[], RealMatrix | RealVector], sound: bool
+) -> RealMatrix | RealVector:
+    """Carry out a computation rounding upwards in sound mode, to nearest otherwise
+
+    Overflows are silently rounded towards infinity, which are valid bounds.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        return fpu.up(computation) if sound else computation()
+
+
+IntervalArrayCollection: TypeAlias = tuple[IntervalArray, ...]
+"""Tuple of interval arrays, e.g. one for each layer of a neural network"""
 
 
 class UncertainArray(NamedTuple):
@@ -58,27 +305,213 @@ class UncertainArray(NamedTuple):
 
 
 class ActivationFunc(NamedTuple):
-    """A representation of a real-valued, scalar function with its first derivative"""
+    """A representation of a real-valued, scalar function with its first derivative
+
+    Additionally, the function's shape can be declared, which enables vectorized
+    bounds for whole arrays of intervals. The breakpoints split the real line into
+    regions, on each of which the function is monotonic and either convex or concave,
+    such that the extrema of the function and its derivative on any interval are
+    attained at the interval's endpoints or at the breakpoints within.
+    """
 
     func: RealScalarFunction = lambda x: np.full(1, x) if isinstance(x, float) else x
     """the function itself"""
     deriv: RealScalarFunction = lambda x: np.ones(1)
     """the function's derivative"""
+    monotone: bool = True
+    """whether the function is non-decreasing on the whole real line"""
+    breakpoints: tuple[float, ...] = ()
+    """the sorted points at which the function may change its monotonicity or its
+    curvature"""
+    convexity: tuple[int, ...] = ()
+    """for each region between the breakpoints 1 if the function is convex, -1 if it
+    is concave and 0 if it is affine there, or empty if unknown"""
+    fused: FusedScalarFunction | None = None
+    """a kernel computing the function's values and derivatives in one pass, which
+    accepts a tuple of two preallocated arrays as keyword argument ``out``"""
+    chord_point: ChordPointFunction | None = None
+    """a closed form of the point within each interval, at which the derivative
+    equals the slope of the chord between the interval's endpoints, which is only
+    evaluated on intervals on which the function is convex or concave"""
+
+    @property
+    def single_kink(self) -> bool:
+        """whether the function is piecewise linear with exactly one breakpoint"""
+        return len(self.breakpoints) == 1 and self.convexity == (0, 0)
+
+    def func_and_deriv(
+        self,
+        val: RealMatrix | RealVector,
+        out: tuple[RealVector, RealVector] | None = None,
+    ) -> tuple[RealMatrix | RealVector, RealMatrix | RealVector]:
+        """Compute the function's values and derivatives on arrays
+
+        The fused kernel is used if available, otherwise the function and its
+        derivative are evaluated one after another.
+
+        Parameters
+        ----------
+        val : RealMatrix or RealVector
+            the arguments
+        out : tuple[RealVector, RealVector], optional
+            the arrays to write the values and derivatives into, defaults to newly
+            allocated arrays
+
+        Returns
+        -------
+        tuple[RealMatrix | RealVector, RealMatrix | RealVector]
+            the values and the derivatives, each of the arguments' shape
+        """
+        if self.fused is not None:
+            return cast(
+                tuple[RealMatrix | RealVector, RealMatrix | RealVector],
+                self.fused(val, out=out),
+            )
+        value = np.broadcast_to(self.func(val), np.shape(val))
+        deriv = np.broadcast_to(self.deriv(val), np.shape(val))
+        if out is None:
+            return value, deriv
+        np.copyto(out[0], value)
+        np.copyto(out[1], deriv)
+        return out
+
+    def image(
+        self, lo: RealMatrix | RealVector, hi: RealMatrix | RealVector
+    ) -> tuple[RealMatrix | RealVector, RealMatrix | RealVector]:
+        """Compute the smallest and largest function values on intervals
+
+        For monotone functions both endpoints are evaluated in a single call,
+        otherwise additionally the breakpoints within the intervals.
+
+        Parameters
+        ----------
+        lo : RealMatrix or RealVector
+            the intervals' lower bounds
+        hi : RealMatrix or RealVector
+            the intervals' upper bounds
+
+        Returns
+        -------
+        tuple[RealMatrix | RealVector, RealMatrix | RealVector]
+            the image's lower and upper bounds componentwise
+        """
+        if self.monotone:
+            return _at_endpoints(self.func, lo, hi)
+        values = self._at_candidates(self.func, lo, hi)
+        return values.min(axis=0), values.max(axis=0)
+
+    def deriv_range(
+        self, lo: RealMatrix | RealVector, hi: RealMatrix | RealVector
+    ) -> tuple[RealMatrix | RealVector, RealMatrix | RealVector]:
+        """Compute the smallest and largest derivative values on intervals
+
+        The derivative is monotonic on each region between two breakpoints according
+        to the function's convexity there, such that functions being convex or
+        concave on the whole real line need both endpoints only.
+
+        Parameters
+        ----------
+        lo : RealMatrix or RealVector
+            the intervals' lower bounds
+        hi : RealMatrix or RealVector
+            the intervals' upper bounds
+
+        Returns
+        -------
+        tuple[RealMatrix | RealVector, RealMatrix | RealVector]
+            the derivative's lower and upper bounds componentwise
+        """
+        assert len(self.convexity) == len(self.breakpoints) + 1, (
+            f"Somehow the derivative's range was requested, but the activation "
+            f"declares the convexity of {len(self.convexity)} regions between its "
+            f"{len(self.breakpoints)} breakpoints"
+        )
+        if min(self.convexity) >= 0:
+            return _at_endpoints(self.deriv, lo, hi)
+        if max(self.convexity) <= 0:
+            deriv_hi, deriv_lo = _at_endpoints(self.deriv, lo, hi)
+            return deriv_lo, deriv_hi
+        values = self._at_candidates(self.deriv, lo, hi)
+        return values.min(axis=0), values.max(axis=0)
+
+    def convex_or_concave(
+        self, lo: RealMatrix | RealVector, hi: RealMatrix | RealVector
+    ) -> NDArray[np.bool_]:
+        """Decide on which intervals the function is convex or concave as a whole
+
+        Parameters
+        ----------
+        lo : RealMatrix or RealVector
+            the intervals' lower bounds
+        hi : RealMatrix or RealVector
+            the intervals' upper bounds
+
+        Returns
+        -------
+        NDArray[np.bool_]
+            True for all intervals, which do not contain a breakpoint in their
+            interior, at which the function changes from convex to concave or vice
+            versa, and False for all intervals if the convexity is unknown
+        """
+        if not self.convexity:
+            return np.zeros(np.shape(lo), dtype=np.bool_)
+        if min(self.convexity) >= 0 or max(self.convexity) <= 0:
+            return np.ones(np.shape(lo), dtype=np.bool_)
+        first_regions = np.searchsorted(self.breakpoints, lo, side="right")
+        last_regions = np.searchsorted(self.breakpoints, hi, side="left")
+        convexity = np.array(self.convexity)
+        regions = np.arange(len(convexity))
+        within = (first_regions[..., np.newaxis] <= regions) & (
+            regions <= last_regions[..., np.newaxis]
+        )
+        is_convex_or_concave: NDArray[np.bool_] = ~np.any(
+            within & (convexity > 0), axis=-1
+        ) | ~np.any(within & (convexity < 0), axis=-1)
+        return is_convex_or_concave
+
+    def _at_candidates(
+        self,
+        function: RealScalarFunction,
+        lo: RealMatrix | RealVector,
+        hi: RealMatrix | RealVector,
+    ) -> RealMatrix:
+        """Evaluate at the endpoints and the breakpoints clipped into the intervals"""
+        candidates = np.stack(
+            (lo, hi, *(np.clip(breakpoint, lo, hi) for breakpoint in self.breakpoints))
+        )
+        values: RealMatrix = np.broadcast_to(function(candidates), candidates.shape)
+        return values
+
+
+def _at_endpoints(
+    function: RealScalarFunction,
+    lo: RealMatrix | RealVector,
+    hi: RealMatrix | RealVector,
+) -> tuple[RealMatrix | RealVector, RealMatrix | RealVector]:
+    """Evaluate a function at the lower and upper bounds in one vectorized call"""
+    endpoints = np.stack((lo, hi))
+    values = np.broadcast_to(function(endpoints), endpoints.shape)
+    return values[0], values[1]
 
 
 @dataclass
 class NNParams:
-    """A representation of a neural network's parameters"""
+    """A representation of a neural network's parameters
+
+    Weight matrices may be given as any :mod:`scipy.sparse` matrix and are stored in
+    compressed sparse row format, such that all products only involve their
+    non-zero entries.
+    """
 
     biases: VectorOfRealVectors
     """The bias vectors of the neural network"""
-    weights: VectorOfRealMatrices
+    weights: tuple[WeightMatrix, ...]
     """The weights matrices of the neural network"""
 
     def __init__(
         self,
         biases: VectorOfRealVectors = (np.array([0.0, 0.0]),),
-        weights: VectorOfRealMatrices = (np.array([[1.0, 0.0], [0.0, 1.0]]),),
+        weights: tuple[WeightMatrix, ...] = (np.array([[1.0, 0.0], [0.0, 1.0]]),),
     ):
         assert len(biases) == len(weights), (
             f"Somehow there are {len(biases)} of bias vectors and {len(weights)} "
@@ -94,11 +527,14 @@ class NNParams:
                 f"not match the dimension of its weight matrix ({weight_matrix})"
             )
         self.biases = biases
-        self.weights = weights
+        self.weights = tuple(
+            csr_matrix(weight_matrix) if issparse(weight_matrix) else weight_matrix
+            for weight_matrix in weights
+        )
 
     def __iter__(
         self,
-    ) -> Iterator[tuple[RealVector, RealMatrix]]:
+    ) -> Iterator[tuple[RealVector, WeightMatrix]]:
         """Return an iterator over the biases and weights
 
         Examples
@@ -110,5 +546,204 @@ class NNParams:
             print(biases, weights)
         """
         return cast(
-            Iterator[tuple[RealVector, RealMatrix]], zip(self.biases, self.weights)
+            Iterator[tuple[RealVector, WeightMatrix]], zip(self.biases, self.weights)
         )
+
+
+@dataclass
+class LPMatrices:
+    r"""A linear optimization problem in matrix form
+
+    The problem reads :math:`\min c^T v` subject to :math:`lhs \leq A v \leq rhs`
+    and :math:`lb \leq v \leq ub`, where equality constraints are represented by
+    coinciding left- and right-hand sides and missing bounds by infinite values.
+    """
+
+    constraint_matrix: csr_matrix
+    """the sparse constraint matrix :math:`A`"""
+    lhs: RealVector
+    """the left-hand sides of the constraints"""
+    rhs: RealVector
+    """the right-hand sides of the constraints"""
+    lb: RealVector
+    """the lower bounds of the variables"""
+    ub: RealVector
+    """the upper bounds of the variables"""
+    objective: RealVector
+    """the coefficients :math:`c` of the objective function"""
+    x_is: tuple[IndexVector, ...]
+    r"""the indices of the variables :math:`x^{(i)}` for each layer including inputs"""
+    z_is: tuple[IndexVector, ...]
+    r"""the indices of the variables :math:`z^{(i)}` for each layer"""
+    neurons: tuple[IndexVector, ...]
+    r"""the network's neurons represented by the :math:`x^{(i)}` for each layer
+    including inputs, which omit neurons without influence on the outputs"""
+    affine_rows: tuple[IndexVector, ...]
+    r"""the indices of the equality constraints :math:`z^{(i)} = W x^{(i-1)} + b`"""
+    half_space_rows: tuple[IndexVector, ...]
+    r"""the indices of the two-sided constraints bounding the linearization errors"""
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """the number of constraints and variables"""
+        return cast(tuple[int, int], self.constraint_matrix.shape)
+
+
+@dataclass
+class VerificationResult:
+    r"""The solution of the margin closest to refuting robustness as arrays
+
+    All per-layer arrays follow the order of :attr:`neurons`, which omit the neurons
+    without influence on the outputs. Values of unsolved problems and unavailable
+    dual values are NaN. The result is stored in a single ``.npz`` file by
+    :meth:`save` and restored by :meth:`load`.
+    """
+
+    label: int
+    """the output neuron expected to be maximal"""
+    competitor: int
+    """the output neuron, whose margin's solution is provided"""
+    margins: RealVector
+    """the minimal margins per output neuron"""
+    neurons: tuple[IndexVector, ...]
+    r"""the network's neurons represented by the :math:`x^{(i)}` for each layer
+    including inputs"""
+    x_values: VectorOfRealVectors
+    r"""the values of the :math:`x^{(i)}` for each layer including inputs"""
+    z_values: VectorOfRealVectors
+    r"""the values of the :math:`z^{(i)}` for each layer"""
+    residual_lo: VectorOfRealVectors
+    r"""the lower bounds of the residual terms :math:`r^{(i)}` for each layer"""
+    residual_hi: VectorOfRealVectors
+    r"""the upper bounds of the residual terms :math:`r^{(i)}` for each layer"""
+    half_space_duals: VectorOfRealVectors
+    """the dual values of the half-space constraints for each layer"""
+    statistics: dict[str, float]
+    """the solver's statistics by name"""
+
+    _LAYERED_FIELDS = (
+        "neurons",
+        "x_values",
+        "z_values",
+        "residual_lo",
+        "residual_hi",
+        "half_space_duals",
+    )
+
+    def save(self, file: str | Path) -> None:
+        """Write all arrays into one uncompressed ``.npz`` file
+
+        Parameters
+        ----------
+        file : str or Path
+            the destination, to which NumPy appends ``.npz`` if missing
+        """
+        arrays = {
+            f"{name}_{i_idx}": array
+            for name in self._LAYERED_FIELDS
+            for i_idx, array in enumerate(getattr(self, name))
+        }
+        np.savez(
+            file,
+            label=self.label,
+            competitor=self.competitor,
+            margins=self.margins,
+            statistics_names=np.array(list(self.statistics), dtype=np.str_),
+            statistics_values=np.array(list(self.statistics.values())),
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, file: str | Path) -> "VerificationResult":
+        """Read a result written by :meth:`save`
+
+        Parameters
+        ----------
+        file : str or Path
+            the ``.npz`` file
+
+        Returns
+        -------
+        VerificationResult
+            the result with all arrays loaded into memory
+        """
+        with np.load(file) as arrays:
+            layered_fields = {
+                name: tuple(
+                    arrays[f"{name}_{i_idx}"]
+                    for i_idx in range(
+                        sum(key.rpartition("_")[0] == name for key in arrays.files)
+                    )
+                )
+                for name in cls._LAYERED_FIELDS
+            }
+            return cls(
+                label=int(arrays["label"]),
+                competitor=int(arrays["competitor"]),
+                margins=arrays["margins"],
+                statistics=dict(
+                    zip(
+                        arrays["statistics_names"].tolist(),
+                        arrays["statistics_values"].tolist(),
+                    )
+                ),
+                **layered_fields,
+            )
+
+
+@dataclass
+class DualCertificate:
+    r"""The dual values proving lower bounds of the margins without a solver
+
+    For each competitor the dual values :math:`y` of all constraints of the
+    optimization problem as assembled by :func:`~.linear_program.assemble_lp_matrices`
+    bound the margin :math:`c^T v` from below by weak duality, i.e. by
+    :math:`\min_{lhs \leq A v \leq rhs} y^T A v + \min_{lb \leq v \leq ub} (c - A^T
+    y)^T v`, which is evaluated by :func:`~.certificates.check_certificate`. The
+    certificate is stored in a single ``.npz`` file by :meth:`save` and restored by
+    :meth:`load`.
+    """
+
+    label: int
+    """the output neuron expected to be maximal"""
+    competitors: IndexVector
+    """the other output neurons in the order of :attr:`row_duals`"""
+    row_duals: RealMatrix
+    """the dual values of all constraints, one row per competitor, all zero for
+    competitors without an optimal solution"""
+
+    def save(self, file: str | Path) -> None:
+        """Write the certificate into one uncompressed ``.npz`` file
+
+        Parameters
+        ----------
+        file : str or Path
+            the destination, to which NumPy appends ``.npz`` if missing
+        """
+        np.savez(
+            file,
+            label=self.label,
+            competitors=self.competitors,
+            row_duals=self.row_duals,
+        )
+
+    @classmethod
+    def load(cls, file: str | Path) -> "DualCertificate":
+        """Read a certificate written by :meth:`save`
+
+        Parameters
+        ----------
+        file : str or Path
+            the ``.npz`` file
+
+        Returns
+        -------
+        DualCertificate
+            the certificate with all arrays loaded into memory
+        """
+        with np.load(file) as arrays:
+            return cls(
+                label=int(arrays["label"]),
+                competitors=arrays["competitors"],
+                row_duals=arrays["row_duals"],
+            )
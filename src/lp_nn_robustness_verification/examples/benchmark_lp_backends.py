@@ -0,0 +1,85 @@
+"""Compare the solving times of the LP backends on the thesis' instance sizes"""
+
+import sys
+from time import perf_counter
+
+from zema_emc_annotated.data_types import SampleSize  # type: ignore[import]
+from zema_emc_annotated.dataset import ZeMASamples  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.generate_nn_params import (
+    construct_out_features_counts,
+    generate_weights_and_biases,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import UncertainArray
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.lp_backends import (
+    HiGHSBackend,
+    LPBackend,
+    SCIPBackend,
+)
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+def benchmark_lp_backends(size_scaler: int, n_samples: int = 3) -> None:
+    """Solve the same instances with every backend and report the faster one
+
+    Parameters
+    ----------
+    size_scaler : int
+        the number of datapoints per sensor and cycle, the network has eleven times
+        as many inputs
+    n_samples : int, optional
+        the number of samples to solve per network depth, defaults to 3
+    """
+    zema_data = ZeMASamples(
+        SampleSize(0, n_samples, datapoints_per_cycle=size_scaler), normalize=True
+    )
+    for depth in (1, 3, 5, 8):
+        out_features = max(min(size_scaler * 11 - depth, 100), 10)
+        timings = {"SCIP": 0.0, "HiGHS": 0.0}
+        for sample_idx in range(n_samples):
+            uncertain_inputs = UncertainInputs(
+                UncertainArray(
+                    zema_data.values[sample_idx], zema_data.uncertainties[sample_idx]
+                )
+            )
+            linear_inclusion = LinearInclusion(
+                uncertain_inputs,
+                Sigmoid,
+                generate_weights_and_biases(
+                    len(uncertain_inputs.values),
+                    construct_out_features_counts(
+                        len(uncertain_inputs.values),
+                        out_features=out_features,
+                        depth=depth,
+                    ),
+                    sample_idx,
+                ),
+            )
+            scip_backend = SCIPBackend()
+            scip_backend.model.hideOutput()
+            backends: dict[str, LPBackend] = {
+                "SCIP": scip_backend,
+                "HiGHS": HiGHSBackend(),
+            }
+            for name, backend in backends.items():
+                start = perf_counter()
+                RobustVerifier(linear_inclusion, backend=backend).solve()
+                timings[name] += perf_counter() - start
+        print(
+            f"{size_scaler * 11} inputs and {depth} "
+            f"{'layers' if depth > 1 else 'layer'}: "
+            + ", ".join(f"{name} {timing:.3f}s" for name, timing in timings.items())
+            + f" -> {min(timings, key=timings.__getitem__)} is faster"
+        )
+
+
+if __name__ == "__main__":
+    for scaler in map(int, sys.argv[1:]) if len(sys.argv) > 1 else (1, 10, 100):
+        benchmark_lp_backends(scaler)
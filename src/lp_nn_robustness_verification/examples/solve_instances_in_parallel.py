@@ -1,4 +1,5 @@
 """An implementation of a parallelized search for valid instances and their results"""
+
 import sys
 
 import yappi  # type: ignore[import]
@@ -16,9 +17,16 @@ from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
     UncertainInputs,
 )
 from lp_nn_robustness_verification.data_types import UncertainArray
-from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.lp_backends import SCIPBackend, SolveLimits
 from lp_nn_robustness_verification.pre_processing import LinearInclusion
-from lp_nn_robustness_verification.timing import write_current_timing_stats
+from lp_nn_robustness_verification.timing import (
+    write_current_timing_stats,
+    write_statistics_record,
+)
+from lp_nn_robustness_verification.verification_pipeline import verify
+
+_TIME_LIMIT = 600.0
+"""The seconds after which a single linear program is given up"""
 
 
 def solve_and_store_timed_solutions(task_id: int) -> None:
@@ -70,17 +78,33 @@ def solve_and_store_timed_solutions(task_id: int) -> None:
                     seed,
                 ),
             )
-            optimization = RobustVerifier(linear_inclusion)
-            optimization.solve()
+            decision = verify(
+                linear_inclusion,
+                SCIPBackend(names=True),
+                limits=SolveLimits(time=_TIME_LIMIT),
+            )
             yappi.stop()
             write_current_timing_stats(
                 f"{size_scaler * 11}_inputs_and_{depth}_layers_with_sample_"
                 f"{idx_start}_and_seed_{seed}_"
                 f"timings.txt",
-                "Everything has been done",
+                f"Everything has been done, decided by {decision.tier.value} with "
+                f"margin {decision.margin}",
                 "a",
             )
-            if optimization.model.getSols():
+            optimization = decision.verifier
+            if optimization is not None:
+                write_statistics_record(
+                    optimization.statistics,
+                    f"{size_scaler * 11}_inputs_and_{depth}_layers_statistics.jsonl",
+                    sample=idx_start,
+                    seed=seed,
+                    n_inputs=size_scaler * 11,
+                    depth=depth,
+                    margin=decision.margin,
+                )
+            solved = decision.robust is not None
+            if optimization is not None and optimization.model.getSols():
                 solved = True
                 optimization.model.writeProblem(
                     filename=(
@@ -111,6 +135,7 @@ def solve_and_store_timed_solutions(task_id: int) -> None:
                         f"best_solution_for_transformed_problem.sol"
                     )
                 )
+            if solved:
                 break
 
 
@@ -14,6 +14,7 @@ At the moment it is only possible to call it via:
 We might add command line parameters at a later time. For now please edit the main
 function at the very bottom of this file to change inputs.
 """
+
 import yappi  # type: ignore[import]
 from zema_emc_annotated.data_types import SampleSize  # type: ignore[import]
 from zema_emc_annotated.dataset import ZeMASamples  # type: ignore[import]
@@ -23,12 +24,9 @@ from lp_nn_robustness_verification.data_acquisition.generate_nn_params import (
     construct_out_features_counts,
     generate_weights_and_biases,
 )
-from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
-    UncertainInputs,
-)
 from lp_nn_robustness_verification.data_types import UncertainArray
 from lp_nn_robustness_verification.linear_program import RobustVerifier
-from lp_nn_robustness_verification.pre_processing import LinearInclusion
+from lp_nn_robustness_verification.pre_processing import BatchedLinearInclusion
 
 
 def optimize() -> None:
@@ -41,14 +39,18 @@ def optimize() -> None:
         construct_out_features_counts(len(zema_data.values[0]), depth=depth),
         seed=0,
     )
-    for (values, uncertainties) in zip(zema_data.values, zema_data.uncertainties):
+    yappi.start()
+    batched_linear_inclusion = BatchedLinearInclusion(
+        UncertainArray(zema_data.values, zema_data.uncertainties),
+        activation=Sigmoid,
+        nn_params=nn_params,
+    )
+    yappi.stop()
+    optimization = RobustVerifier(batched_linear_inclusion[0])
+    for sample_idx, linear_inclusion in enumerate(batched_linear_inclusion):
         yappi.start()
-        linear_inclusion = LinearInclusion(
-            uncertain_inputs=UncertainInputs(UncertainArray(values, uncertainties)),
-            activation=Sigmoid,
-            nn_params=nn_params,
-        )
-        optimization = RobustVerifier(linear_inclusion)
+        if sample_idx:
+            optimization.update_linear_inclusion(linear_inclusion)
         optimization.solve()
         yappi.stop()
         with open(
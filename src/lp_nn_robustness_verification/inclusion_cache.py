@@ -0,0 +1,290 @@
+"""A persistent on-disk cache for the bounds computed during linear inclusion"""
+
+__all__ = ["InclusionBounds", "InclusionCache"]
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+from scipy.sparse import csr_matrix  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    IndexVector,
+    IntervalArray,
+    IntervalArrayCollection,
+    NNParams,
+    RealVector,
+    VectorOfRealVectors,
+)
+
+InclusionBounds = tuple[
+    IntervalArrayCollection,
+    IntervalArrayCollection,
+    VectorOfRealVectors,
+    IntervalArrayCollection,
+]
+"""The z_arrays, theta_arrays, xi_is and r_arrays of a linear inclusion"""
+
+_CACHE_FORMAT_VERSION = b"2"
+_ARRAY_NAMES = ("z_lo", "z_hi", "theta_lo", "theta_hi", "xi", "r_lo", "r_hi")
+
+
+class InclusionCache:
+    """Store and load linear inclusions' bounds in a directory
+
+    Each entry is a subdirectory named after the SHA-256 hash of the network
+    parameters, the input region, the activation function, the rounding mode, the
+    settings of the symbolic propagation and the choice of the expansion points. It
+    contains one ``.npy`` file per kind of bound with all layers concatenated, such
+    that entries are loaded memory-mapped. Whenever the cache exceeds its size cap,
+    the least recently used entries are deleted.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        where to store the entries, defaults to ``lp_nn_robustness_verification``
+        in the system's directory for temporary files
+    max_bytes : int, optional
+        the maximal total size of all entries, defaults to 1 GiB
+    """
+
+    directory: Path
+    max_bytes: int
+
+    def __init__(
+        self,
+        directory: str | Path = Path(tempfile.gettempdir())
+        / "lp_nn_robustness_verification",
+        max_bytes: int = 2**30,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._last_network: tuple[NNParams, bytes] | None = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(
+        self,
+        uncertain_inputs: UncertainInputs,
+        activation: ActivationFunc,
+        nn_params: NNParams,
+        sound: bool,
+        symbolic: bool = False,
+        max_generators: int | None = None,
+        min_residual: bool = False,
+    ) -> str:
+        """Compute the hash identifying a linear inclusion's bounds
+
+        The activation function is identified by the qualified names of its function,
+        derivative, fused kernel and closed form of the chord points and its declared
+        shape, such that e.g. anonymous functions cannot be told apart. Callables
+        without a qualified name, such as :func:`functools.partial` objects, are
+        identified by their representation instead. The hash of the network
+        parameters is remembered for the most recently used instance of
+        :class:`~.data_types.NNParams`, so its arrays must not be changed in place.
+
+        Parameters
+        ----------
+        uncertain_inputs: UncertainInputs
+            the input region
+        activation : ActivationFunc
+            the activation function and its derivative
+        nn_params : NNParams
+            the neural networks parameters
+        sound : bool
+            whether the bounds are rounded outwards
+        symbolic : bool, optional
+            whether the bounds are tightened by symbolic propagation, defaults to
+            False
+        max_generators : int, optional
+            the number of generators kept during symbolic propagation, defaults to
+            keeping all
+        min_residual : bool, optional
+            whether the expansion points minimize the residual terms, defaults to
+            False
+
+        Returns
+        -------
+        str
+            the hexadecimal SHA-256 hash
+        """
+        sha256 = hashlib.sha256(self._network_digest(nn_params))
+        for function in (
+            activation.func,
+            activation.deriv,
+            activation.fused,
+            activation.chord_point,
+        ):
+            sha256.update(f"{_callable_name(function)};".encode("utf-8"))
+        sha256.update(
+            f"{activation.monotone};{activation.breakpoints};"
+            f"{activation.convexity};".encode("utf-8")
+        )
+        sha256.update(b"sound" if sound else b"fast")
+        if symbolic:
+            sha256.update(b"symbolic")
+        if max_generators is not None:
+            sha256.update(f"max_generators={max_generators};".encode("utf-8"))
+        if min_residual:
+            sha256.update(b"min_residual")
+        _update_with_arrays(
+            sha256,
+            (uncertain_inputs.theta_0_array.lo, uncertain_inputs.theta_0_array.hi),
+        )
+        if uncertain_inputs.correlated:
+            _update_with_arrays(sha256, (uncertain_inputs.generators,))
+        return sha256.hexdigest()
+
+    def _network_digest(self, nn_params: NNParams) -> bytes:
+        """Hash the network parameters unless they were hashed most recently"""
+        if self._last_network is None or self._last_network[0] is not nn_params:
+            sha256 = hashlib.sha256(_CACHE_FORMAT_VERSION)
+            _update_with_arrays(sha256, nn_params.biases)
+            for weight_matrix in nn_params.weights:
+                if isinstance(weight_matrix, csr_matrix):
+                    sha256.update(f"csr{weight_matrix.shape};".encode("utf-8"))
+                    _update_with_arrays(
+                        sha256,
+                        (
+                            weight_matrix.data,
+                            weight_matrix.indices,
+                            weight_matrix.indptr,
+                        ),
+                    )
+                else:
+                    _update_with_arrays(sha256, (weight_matrix,))
+            self._last_network = (nn_params, sha256.digest())
+        return self._last_network[1]
+
+    def load(self, key: str) -> InclusionBounds | None:
+        """Load the bounds memory-mapped, if they are cached
+
+        Parameters
+        ----------
+        key : str
+            the hash as computed by :meth:`key`
+
+        Returns
+        -------
+        InclusionBounds or None
+            the z_arrays, theta_arrays, xi_is and r_arrays as read-only views into
+            the files or None, if the key is not cached
+        """
+        entry = self.directory / key
+        try:
+            layer_sizes = np.load(entry / "layer_sizes.npy")
+            sound = bool(np.load(entry / "sound.npy"))
+            arrays = {
+                name: np.load(entry / f"{name}.npy", mmap_mode="r")
+                for name in _ARRAY_NAMES
+            }
+        except FileNotFoundError:
+            return None
+        os.utime(entry)
+        theta_splits = np.cumsum(layer_sizes)[:-1]
+        layer_splits = np.cumsum(layer_sizes[1:])[:-1]
+        return (
+            _split_intervals(arrays["z_lo"], arrays["z_hi"], layer_splits, sound),
+            _split_intervals(
+                arrays["theta_lo"], arrays["theta_hi"], theta_splits, sound
+            ),
+            tuple(np.split(arrays["xi"], layer_splits)),
+            _split_intervals(arrays["r_lo"], arrays["r_hi"], layer_splits, sound),
+        )
+
+    def store(self, key: str, bounds: InclusionBounds) -> None:
+        """Write the bounds to the cache and evict entries exceeding the size cap
+
+        Parameters
+        ----------
+        key : str
+            the hash as computed by :meth:`key`
+        bounds : InclusionBounds
+            the z_arrays, theta_arrays, xi_is and r_arrays to store
+        """
+        z_arrays, theta_arrays, xi_is, r_arrays = bounds
+        arrays = {
+            "z_lo": [z_i.lo for z_i in z_arrays],
+            "z_hi": [z_i.hi for z_i in z_arrays],
+            "theta_lo": [theta_i.lo for theta_i in theta_arrays],
+            "theta_hi": [theta_i.hi for theta_i in theta_arrays],
+            "xi": list(xi_is),
+            "r_lo": [r_i.lo for r_i in r_arrays],
+            "r_hi": [r_i.hi for r_i in r_arrays],
+        }
+        temporary_entry = Path(tempfile.mkdtemp(dir=self.directory, prefix=".tmp"))
+        np.save(
+            temporary_entry / "layer_sizes.npy",
+            np.array([len(theta_i) for theta_i in theta_arrays]),
+        )
+        np.save(temporary_entry / "sound.npy", np.array(theta_arrays[0].sound))
+        for name, layers in arrays.items():
+            np.save(
+                temporary_entry / f"{name}.npy",
+                np.concatenate(layers).astype(np.float64),
+            )
+        try:
+            temporary_entry.rename(self.directory / key)
+        except OSError:
+            shutil.rmtree(temporary_entry)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the size cap is met"""
+        entries = sorted(
+            (
+                entry
+                for entry in self.directory.iterdir()
+                if entry.is_dir() and not entry.name.startswith(".tmp")
+            ),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        sizes = [
+            sum(file.stat().st_size for file in entry.iterdir()) for entry in entries
+        ]
+        total_size = sum(sizes)
+        for entry, size in zip(entries, sizes):
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
+
+
+def _split_intervals(
+    lo: RealVector, hi: RealVector, splits: IndexVector, sound: bool
+) -> IntervalArrayCollection:
+    """Split concatenated lower and upper bounds into one IntervalArray per layer"""
+    return tuple(
+        IntervalArray(lo_i, hi_i, sound)
+        for lo_i, hi_i in zip(np.split(lo, splits), np.split(hi, splits))
+    )
+
+
+def _callable_name(function: Callable[..., Any] | None) -> str:
+    """Name a callable by its module and qualified name or else its representation"""
+    if function is None:
+        return "None"
+    qualname = getattr(function, "__qualname__", None)
+    if qualname is None:
+        return repr(function)
+    return f"{getattr(function, '__module__', None)}.{qualname}"
+
+
+def _update_with_arrays(sha256: "hashlib._Hash", arrays: Iterable[np.ndarray]) -> None:
+    """Feed the data types, shapes and contents of arrays into a hash
+
+    Contiguous arrays are hashed without copying them.
+    """
+    for array in arrays:
+        contiguous_array = np.ascontiguousarray(array)
+        sha256.update(
+            f"{contiguous_array.dtype.str}{contiguous_array.shape}".encode("utf-8")
+        )
+        sha256.update(contiguous_array.data.cast("B"))
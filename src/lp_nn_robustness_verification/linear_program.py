@@ -1,135 +1,857 @@
 """The actual implementation of the linear optimization problem."""
 
+__all__ = ["assemble_lp_matrices", "RobustVerifier"]
+
+import sys
+from dataclasses import replace
+from functools import partial
+from multiprocessing import Pool
+from time import perf_counter
+from typing import Callable
+from warnings import catch_warnings, simplefilter
+
+import numpy as np
+from numpy._typing import NDArray
 from numpy.testing import assert_equal
-from pyscipopt import Model, quicksum  # type: ignore[import]
+from pyscipopt import Model  # type: ignore[import]
+from scipy.sparse import (  # type: ignore[import]
+    coo_matrix,
+    csr_matrix,
+    SparseEfficiencyWarning,
+)
 
-from lp_nn_robustness_verification.data_types import RealVars
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    DualCertificate,
+    IndexVector,
+    IntervalArray,
+    LPMatrices,
+    NNParams,
+    RealVector,
+    VectorOfRealVectors,
+    VerificationResult,
+)
+from lp_nn_robustness_verification.lp_backends import (
+    LPBackend,
+    SCIPBackend,
+    SolveLimits,
+    SolveResult,
+)
+from lp_nn_robustness_verification.lp_reduction import (
+    LPReduction,
+    reduce_lp_matrices,
+)
 from lp_nn_robustness_verification.pre_processing import (
     compute_values_label,
     LinearInclusion,
 )
 
+if sys.platform != "win32":
+    import resource
+
+_CUMULATIVE_STATISTICS = frozenset(
+    ("solving_time", "presolving_time", "lp_iterations", "nodes")
+)
+"""The backend's statistics, which are summed up over all solves of a problem"""
+
 
 class RobustVerifier:
     """Instances of this class represent instances of the linear optimization problem
 
-    For details see chapter 3 in [Ludwig2023]_.
+    For details see chapter 3 in [Ludwig2023]_. The problem is assembled in matrix
+    form by :func:`assemble_lp_matrices` and handed over to an
+    :class:`~.lp_backends.LPBackend` for solving.
 
     Parameters
     ----------
     linear_inclusion : LinearInclusion
         all parameters for the linear constraints and the input regions
+    backend : LPBackend, optional
+        the solver to use, defaults to a :class:`~.lp_backends.SCIPBackend`
+    names : bool, optional
+        if True and no backend is provided, the SCIP variables and constraints are
+        named after their meaning in the optimization problem, which is convenient
+        for inspecting written problem files, otherwise (default) SCIP's generic
+        names are used
+    reduce : bool, optional
+        if True, the problem is shrunk by :func:`~.lp_reduction.reduce_lp_matrices`
+        before it is handed over to the backend, which among others substitutes
+        the :math:`z^{(i)}` by their affine constraints, defaults to False
+    limits : SolveLimits, optional
+        the budgets imposed on every solve, defaults to none
     """
 
     linear_inclusion: LinearInclusion
-    x_is: RealVars
-    z_is: RealVars
-    model: Model
+    lp_matrices: LPMatrices
+    label: int
+    backend: LPBackend
+    reduction: LPReduction | None
+    x_is: tuple[IndexVector, ...]
+    z_is: tuple[IndexVector, ...]
+    statistics: dict[str, float]
+    """the time to build the problem in seconds and the backend's statistics of
+    all solves since, with times, iterations and nodes summed up and the maximum of
+    the problem's size, as well as the process' peak resident memory in bytes up to
+    the last solve as ``"peak_memory"``, which is not reported on Windows"""
 
-    def __init__(self, linear_inclusion: LinearInclusion):
+    def __init__(
+        self,
+        linear_inclusion: LinearInclusion,
+        backend: LPBackend | None = None,
+        names: bool = False,
+        reduce: bool = False,
+        limits: SolveLimits | None = None,
+    ):
         """Crate instance of the optimization problem without considering remainders"""
         self.linear_inclusion = linear_inclusion
-        self.x_is = {}
-        self.z_is = {}
-        self.model = Model("Robustness Verification (abstract base)")
+        self.backend = SCIPBackend(names=names) if backend is None else backend
+        self.reduce = reduce
+        self.limits = SolveLimits() if limits is None else limits
+        self.backend.set_limits(self.limits)
         self._set_up_model()
 
+    @property
+    def model(self) -> Model:
+        """The underlying SCIP model, only available with the SCIP backend"""
+        return self._scip_backend.model
+
+    @property
+    def variables(self) -> NDArray[np.object_]:
+        """The SCIP variables, only available with the SCIP backend"""
+        return self._scip_backend.variables
+
+    @property
+    def _scip_backend(self) -> SCIPBackend:
+        assert isinstance(self.backend, SCIPBackend), (
+            f"Somehow the SCIP model was requested, but the problem is solved by "
+            f"{type(self.backend).__name__}"
+        )
+        return self.backend
+
     def _set_up_model(self) -> None:
-        """Set up all the variables for the SCIP model"""
-        self._add_vars_x_i_in_theta_i()
-        self._add_vars_z_i()
-        self._add_linear_cons()
+        """Assemble the optimization problem and hand it over to the backend"""
+        start = perf_counter()
+        self.lp_matrices = assemble_lp_matrices(self.linear_inclusion)
+        self.x_is = self.lp_matrices.x_is
+        self.z_is = self.lp_matrices.z_is
+        assert_equal(
+            len(self.x_is[-1]), len(self.linear_inclusion.nn_params.biases[-1])
+        )
         self._add_objective()
+        if self.reduce:
+            self.reduction = reduce_lp_matrices(self.lp_matrices)
+            self.backend.build(self.reduction.lp_matrices)
+        else:
+            self.reduction = None
+            self.backend.build(self.lp_matrices)
+        self._set_objective(self.lp_matrices.objective)
+        self.statistics = {"build_time": perf_counter() - start}
 
-    def _add_vars_x_i_in_theta_i(self) -> None:
-        for i_idx, theta_i in enumerate(self.linear_inclusion.theta_is):
-            for k_idx, theta_i_k in enumerate(theta_i):
-                self.x_is[i_idx, k_idx] = self.model.addVar(
-                    name=f"x_{k_idx}^({i_idx})",
-                    vtype="C",
-                    lb=theta_i_k[0].inf,
-                    ub=theta_i_k[0].sup,
-                )
-        assert_equal(
-            len(self.x_is),
-            len(self.linear_inclusion.uncertain_inputs.uncertain_values.values)
-            + sum(
-                weight_matrix.shape[0]
-                for weight_matrix in self.linear_inclusion.nn_params.weights
-            ),
+    def _add_objective(self) -> None:
+        """Introduce objective function to the optimization problem
+
+        The margin between the label and the last competing output neuron is
+        minimized.
+        """
+        self.label = compute_values_label(
+            self.linear_inclusion.uncertain_inputs,
+            self.linear_inclusion.activation,
+            self.linear_inclusion.nn_params,
         )
+        self._competitor = max(self._competitors())
+        self.lp_matrices.objective[:] = self._margin_objective(self._competitor)
 
-    def _add_vars_z_i(self) -> None:
-        """Introduce z_is to the SCIP model"""
-        for i_idx, (biases, weight_matrix) in enumerate(
-            self.linear_inclusion.nn_params, start=1
-        ):
-            for k_idx, (bias, weight_vector) in enumerate(zip(biases, weight_matrix)):
-                self.z_is[i_idx, k_idx] = self.model.addVar(
-                    name=f"z_{k_idx}^({i_idx})", vtype="C", lb=None
-                )
-                self.model.addCons(
-                    self.z_is[i_idx, k_idx]
-                    == quicksum(
-                        weight * self.x_is[i_idx - 1, j_idx]
-                        for j_idx, weight in enumerate(weight_vector)
-                    )
-                    + bias,
-                    f"z_{k_idx}^({i_idx})(x^({i_idx - 1}))",
-                )
+    def _competitors(self) -> list[int]:
+        """The indices of all output neurons except the label"""
+        return [
+            neuron_idx
+            for neuron_idx in range(len(self.x_is[-1]))
+            if neuron_idx != self.label
+        ]
+
+    def _margin_objective(self, competitor: int) -> RealVector:
+        """The objective coefficients of the margin between label and competitor"""
+        objective = np.zeros(self.lp_matrices.shape[1])
+        objective[self.x_is[-1][self.label]] = 1.0
+        objective[self.x_is[-1][competitor]] = -1.0
+        return objective
+
+    def update_inputs(self, uncertain_inputs: UncertainInputs | IntervalArray) -> None:
+        """Exchange the input region while keeping the network and the model
 
-    def _add_linear_cons(self) -> None:
-        """Introduce linear constraints to the SCIP model"""
-        for layer_idx, (xi_i, r_i) in enumerate(
-            zip(self.linear_inclusion.xi_is, self.linear_inclusion.r_is), start=1
+        The linear inclusion is recomputed for the new inputs and the backend
+        changes only the variables' bounds and the half-space constraints in place.
+
+        Parameters
+        ----------
+        uncertain_inputs : UncertainInputs or IntervalArray
+            the new input region
+        """
+        self.update_linear_inclusion(
+            LinearInclusion(
+                uncertain_inputs,
+                self.linear_inclusion.activation,
+                self.linear_inclusion.nn_params,
+                self.linear_inclusion.sound,
+                self.linear_inclusion.symbolic,
+                self.linear_inclusion.max_generators,
+                min_residual=self.linear_inclusion.min_residual,
+            )
+        )
+
+    def update_linear_inclusion(self, linear_inclusion: LinearInclusion) -> None:
+        """Exchange the linear inclusion of a network with the same architecture
+
+        The affine constraints depend on the weights and biases only, such that
+        merely the variables' bounds and the half-space constraints are computed
+        for the new linear inclusion and patched into the problem and the backend.
+
+        Parameters
+        ----------
+        linear_inclusion : LinearInclusion
+            the new linear inclusion, e.g. from a :class:`~.BatchedLinearInclusion`,
+            which must share weights and biases with the current one
+        """
+        assert self.reduction is None, (
+            "Somehow the linear inclusion of a reduced problem was requested to "
+            "change, but the reduction depends on the bounds, such that the problem "
+            "needs to be set up again"
+        )
+        assert not linear_inclusion.activation.single_kink, (
+            "Somehow the linear inclusion of a network with a piecewise linear "
+            "activation was requested to change, but its encoding depends on the "
+            "bounds, such that the problem needs to be set up again"
+        )
+        start = perf_counter()
+        self.linear_inclusion = linear_inclusion
+        neurons = self.lp_matrices.neurons
+        lb = self.lp_matrices.lb.copy()
+        ub = self.lp_matrices.ub.copy()
+        x_columns = np.concatenate(self.x_is)
+        lb[x_columns] = np.concatenate(
+            [
+                theta_i.lo[neurons_i]
+                for theta_i, neurons_i in zip(linear_inclusion.theta_arrays, neurons)
+            ]
+        )
+        ub[x_columns] = np.concatenate(
+            [
+                theta_i.hi[neurons_i]
+                for theta_i, neurons_i in zip(linear_inclusion.theta_arrays, neurons)
+            ]
+        )
+        lhs = self.lp_matrices.lhs.copy()
+        rhs = self.lp_matrices.rhs.copy()
+        slopes = []
+        for rows_i, neurons_i, xi_i, r_i in zip(
+            self.lp_matrices.half_space_rows,
+            neurons[1:],
+            linear_inclusion.xi_is,
+            linear_inclusion.r_arrays,
         ):
-            for neuron_idx, (xi_i_k, r_i_k) in enumerate(zip(xi_i, r_i)):
-                linear_approximation = (
-                    self.x_is[layer_idx, neuron_idx]
-                    - float(self.linear_inclusion.activation.func(xi_i_k))
-                    - float(self.linear_inclusion.activation.deriv(xi_i_k))
-                    * (self.z_is[layer_idx, neuron_idx] - xi_i_k)
-                )
-                self.model.addCons(
-                    linear_approximation - r_i_k[0].inf >= 0,
-                    f"x_{neuron_idx}^({layer_idx}) upper half-space",
-                )
-                self.model.addCons(
-                    linear_approximation - r_i_k[0].sup <= 0,
-                    f"x_{neuron_idx}^({layer_idx}) lower half-space",
+            _, slopes_i, lhs[rows_i], rhs[rows_i] = _taylor_half_spaces(
+                linear_inclusion.activation, xi_i[neurons_i], r_i[neurons_i]
+            )
+            slopes.append(slopes_i)
+        rows = np.concatenate(self.lp_matrices.half_space_rows)
+        constraint_matrix = self.lp_matrices.constraint_matrix.copy()
+        with catch_warnings():
+            # Only slopes, which were zero before, lack an entry to overwrite.
+            simplefilter("ignore", SparseEfficiencyWarning)
+            constraint_matrix[rows, np.concatenate(self.z_is)] = -np.concatenate(slopes)
+        self.lp_matrices = replace(
+            self.lp_matrices,
+            constraint_matrix=constraint_matrix,
+            lhs=lhs,
+            rhs=rhs,
+            lb=lb,
+            ub=ub,
+            objective=np.zeros(self.lp_matrices.shape[1]),
+        )
+        self._add_objective()
+        self.backend.update(self.lp_matrices, rows)
+        self.statistics = {"build_time": perf_counter() - start}
+
+    def solve(self) -> SolveResult:
+        """Actually solve the optimization problem
+
+        Returns
+        -------
+        SolveResult
+            the status and the bounds of the objective value, which are valid even
+            if one of the :attr:`limits` was hit
+        """
+        self.backend.solve()
+        for name, value in {
+            **self.backend.get_statistics(),
+            **_peak_memory(),
+        }.items():
+            self.statistics[name] = (
+                self.statistics.get(name, 0.0) + value
+                if name in _CUMULATIVE_STATISTICS
+                else max(self.statistics.get(name, value), value)
+            )
+        primal_value, dual_bound = self.backend.get_bounds()
+        return SolveResult(
+            self.backend.get_status(),
+            primal_value + self._objective_offset,
+            dual_bound + self._objective_offset,
+        )
+
+    def solve_all_margins(
+        self,
+        stop_early: bool = True,
+        n_workers: int = 1,
+        backend_factory: Callable[[], LPBackend] | None = None,
+    ) -> RealVector:
+        """Minimize the margins between the label and every other output neuron
+
+        The constraints are handed over to the backend only once and merely the
+        objective is replaced for each competing output neuron, such that only the
+        problem's assembly is shared between the solves. With
+        :class:`~.lp_backends.SCIPBackend` created with ``reoptimize=True``, the
+        problem is additionally presolved only once, but no solve warm-starts from
+        the previous one's basis.
+
+        Parameters
+        ----------
+        stop_early : bool, optional
+            if True (default), no further margins are computed as soon as one is
+            negative, because robustness is refuted already
+        n_workers : int, optional
+            if greater than 1, the margins are solved concurrently in as many worker
+            processes, each of which receives the linear inclusion once and sets up
+            its own optimization problem. Stopping early terminates the worker
+            processes, which aborts the solves still running. Defaults to 1
+        backend_factory : Callable[[], LPBackend], optional
+            creates the backend in each worker process, defaults to creating one of
+            the same type and :attr:`~.lp_backends.LPBackend.configuration` as this
+            instance's backend
+
+        Returns
+        -------
+        RealVector
+            the minimal margins per output neuron, ``np.inf`` for competitors, for
+            which the optimization problem is infeasible, and ``np.nan`` for the
+            label itself and all competitors skipped due to ``stop_early``. If a
+            solve hits one of the :attr:`limits`, its margin is the dual bound,
+            which is still a valid lower bound but may be ``-np.inf``.
+        """
+        margins = np.full(len(self.x_is[-1]), np.nan)
+        if n_workers > 1:
+            if backend_factory is None:
+                backend_factory = partial(
+                    type(self.backend), **self.backend.configuration
                 )
+            # Leaving the pool's context terminates its workers, even amid a solve.
+            with Pool(
+                n_workers,
+                _initialize_margin_worker,
+                (self.linear_inclusion, backend_factory, self.reduce, self.limits),
+            ) as pool:
+                for competitor, margin in pool.imap_unordered(
+                    _solve_margin_in_worker, self._competitors()
+                ):
+                    margins[competitor] = margin
+                    if stop_early and margin < 0:
+                        break
+            return margins
+        for competitor in self._competitors():
+            margins[competitor] = self._solve_margin(competitor)
+            if stop_early and margins[competitor] < 0:
+                break
+        return margins
 
-    def _add_objective(self) -> None:
-        """Introduce objective function to the SCIP model"""
-        label = compute_values_label(
-            self.linear_inclusion.uncertain_inputs,
-            self.linear_inclusion.activation,
-            self.linear_inclusion.nn_params,
+    def _solve_margin(self, competitor: int) -> float:
+        """Bound the margin between the label and one competing output neuron"""
+        self._competitor = competitor
+        self._set_objective(self._margin_objective(competitor))
+        result = self.solve()
+        if result.status == "infeasible":
+            return np.inf
+        if result.status == "optimal":
+            return self.objective_value
+        return result.dual_bound
+
+    def verification_result(self, stop_early: bool = True) -> VerificationResult:
+        """Minimize all margins and extract the solution of the smallest one
+
+        The margins are computed by :meth:`solve_all_margins` and the smallest one
+        is solved again, unless it was solved last. All values are retrieved from
+        the backend in one call each and split into layers by index arrays.
+
+        Parameters
+        ----------
+        stop_early : bool, optional
+            if True (default), no further margins are computed as soon as one is
+            negative
+
+        Returns
+        -------
+        VerificationResult
+            the margins and the solution of the smallest one with the total time of
+            all solves added to :attr:`statistics` as ``"total_time"``
+        """
+        start = perf_counter()
+        margins = self.solve_all_margins(stop_early)
+        competitor = int(np.nanargmin(margins))
+        if competitor != self._competitor:
+            self._solve_margin(competitor)
+        total_time = perf_counter() - start
+        is_optimal = self.backend.get_status() == "optimal"
+        primal_values = (
+            self.primal_values
+            if is_optimal
+            else np.full(self.lp_matrices.shape[1], np.nan)
         )
-        for neuron_idx in range(len(self.linear_inclusion.theta_is[-1])):
-            if neuron_idx != label:
-                self.model.setObjective(
-                    self.x_is[len(self.linear_inclusion.theta_is) - 1, label]
-                    - self.x_is[len(self.linear_inclusion.theta_is) - 1, neuron_idx],
-                    "minimize",
+        dual_values = np.full(self.lp_matrices.shape[0], np.nan)
+        if is_optimal and self.backend.provides_duals:
+            dual_values = self.backend.get_dual_values()
+            if self.reduction is not None:
+                dual_values = self.reduction.restore_dual_values(dual_values)
+        neurons = self.lp_matrices.neurons
+        return VerificationResult(
+            label=self.label,
+            competitor=competitor,
+            margins=margins,
+            neurons=neurons,
+            x_values=tuple(primal_values[x_i] for x_i in self.x_is),
+            z_values=tuple(primal_values[z_i] for z_i in self.z_is),
+            residual_lo=tuple(
+                r_i.lo[neurons_i]
+                for r_i, neurons_i in zip(self.linear_inclusion.r_arrays, neurons[1:])
+            ),
+            residual_hi=tuple(
+                r_i.hi[neurons_i]
+                for r_i, neurons_i in zip(self.linear_inclusion.r_arrays, neurons[1:])
+            ),
+            half_space_duals=tuple(
+                dual_values[rows] for rows in self.lp_matrices.half_space_rows
+            ),
+            statistics={**self.statistics, "total_time": total_time},
+        )
+
+    def dual_certificate(self) -> DualCertificate:
+        """Minimize all margins and keep their dual values as a certificate
+
+        The dual values of a reduced problem are mapped back to the original
+        problem's constraints. The removed affine constraints receive the dual values,
+        for which the reduced costs of the :math:`z^{(i)}` vanish, and all other
+        removed constraints receive zeros. Competitors, whose
+        solves are not optimal or whose dual values are not all finite, receive
+        all-zero dual values, which still certify the bounds of the output
+        intervals.
+
+        Returns
+        -------
+        DualCertificate
+            the dual values for re-verifying robustness by
+            :func:`~.certificates.check_certificate`
+        """
+        assert self.backend.provides_duals, (
+            f"Somehow a dual certificate was requested from "
+            f"{type(self.backend).__name__}, which does not provide dual values as "
+            f"configured"
+        )
+        competitors = np.array(self._competitors(), dtype=np.int_)
+        row_duals = np.zeros((len(competitors), self.lp_matrices.shape[0]))
+        for competitor, row_duals_k in zip(competitors.tolist(), row_duals):
+            self._solve_margin(competitor)
+            if self.backend.get_status() != "optimal":
+                continue
+            dual_values = self.backend.get_dual_values()
+            if not np.all(np.isfinite(dual_values)):
+                continue
+            if self.reduction is not None:
+                dual_values = _balance_affine_duals(
+                    self.lp_matrices,
+                    self.reduction.restore_dual_values(dual_values),
+                    self.reduction.row_indices < 0,
                 )
+            row_duals_k[:] = dual_values
+        return DualCertificate(self.label, competitors, row_duals)
 
-    def solve(self) -> None:
-        """Actually solve the optimization problem"""
-        self.model.optimize()
+    def _set_objective(self, objective: RealVector) -> None:
+        """Hand over an objective of the original problem to the backend"""
+        if self.reduction is None:
+            self.backend.set_objective(objective)
+            self._objective_offset = 0.0
+        else:
+            reduced_objective, self._objective_offset = self.reduction.reduce_objective(
+                objective
+            )
+            self.backend.set_objective(reduced_objective)
+
+    @property
+    def objective_value(self) -> float:
+        """The optimal margin found by the last solve"""
+        return self.backend.get_objective_value() + self._objective_offset
+
+    @property
+    def primal_values(self) -> RealVector:
+        """The values of all variables of the original problem in the last solution"""
+        if self.reduction is None:
+            return self.backend.get_primal_values()
+        return self.reduction.restore_primal_values(self.backend.get_primal_values())
 
     def visualize_solution(self) -> str:
         """Rudimentary visualize the optimization result on the console"""
         solution_assignments = []
-        for x_i in self.x_is.values():
-            solution_assignments.append(f"{x_i.name}: " f"{self.model.getVal(x_i)}")
-        for layer_idx, r_i in enumerate(self.linear_inclusion.r_is, start=1):
-            for neuron_idx, r_i_k in enumerate(r_i):
+        primal_values = self.primal_values
+        for layer_idx, (x_i, neurons_i) in enumerate(
+            zip(self.x_is, self.lp_matrices.neurons)
+        ):
+            for neuron_idx, value in zip(
+                neurons_i.tolist(), primal_values[x_i].tolist()
+            ):
+                solution_assignments.append(f"x_{neuron_idx}^({layer_idx}): {value}")
+        for layer_idx, r_i in enumerate(self.linear_inclusion.r_arrays, start=1):
+            for neuron_idx, (r_i_k_inf, r_i_k_sup) in enumerate(
+                zip(r_i.lo.tolist(), r_i.hi.tolist())
+            ):
                 solution_assignments.append(
-                    f"inf r_{neuron_idx}^({layer_idx}): {r_i_k[0].inf}"
+                    f"inf r_{neuron_idx}^({layer_idx}): {r_i_k_inf}"
                 )
                 solution_assignments.append(
-                    f"sup r_{neuron_idx}^({layer_idx}): {r_i_k[0].sup}"
+                    f"sup r_{neuron_idx}^({layer_idx}): {r_i_k_sup}"
                 )
         solution_assignments.append("\n")
         return str(solution_assignments)
+
+
+def _peak_memory() -> dict[str, float]:
+    """The process' peak resident memory in bytes, empty if it is not reported"""
+    if sys.platform == "win32":
+        return {}
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"peak_memory": float(peak if sys.platform == "darwin" else 1024 * peak)}
+
+
+_margin_worker_verifier: RobustVerifier | None = None
+"""The optimization problem set up once per worker process of the process pool"""
+
+
+def _initialize_margin_worker(
+    linear_inclusion: LinearInclusion,
+    backend_factory: Callable[[], LPBackend],
+    reduce: bool,
+    limits: SolveLimits,
+) -> None:
+    """Set up the optimization problem once when starting a worker process"""
+    global _margin_worker_verifier
+    _margin_worker_verifier = RobustVerifier(
+        linear_inclusion, backend_factory(), reduce=reduce, limits=limits
+    )
+
+
+def _solve_margin_in_worker(competitor: int) -> tuple[int, float]:
+    """Minimize one margin on the worker process' optimization problem"""
+    assert _margin_worker_verifier is not None, (
+        "Somehow a margin was requested from a worker process, which has not been "
+        "initialized"
+    )
+    return competitor, _margin_worker_verifier._solve_margin(competitor)
+
+
+def _balance_affine_duals(
+    lp_matrices: LPMatrices, dual_values: RealVector, is_removed: NDArray[np.bool_]
+) -> RealVector:
+    r"""Choose the removed affine constraints' dual values to cancel the z's costs
+
+    Each :math:`z^{(i)}_k` has the coefficient one in its affine constraint and is
+    otherwise only involved in its half-space constraints, such that its reduced
+    cost vanishes, if the affine constraint's dual value is the negative sum of the
+    half-space constraints' contributions.
+    """
+    affine_rows = np.concatenate(lp_matrices.affine_rows)
+    balanced_rows = affine_rows[is_removed[affine_rows]]
+    dual_values = dual_values.copy()
+    dual_values[balanced_rows] = 0.0
+    z_costs = -(
+        lp_matrices.constraint_matrix[:, np.concatenate(lp_matrices.z_is)].T
+        @ dual_values
+    )
+    dual_values[affine_rows] = np.where(
+        is_removed[affine_rows], z_costs, dual_values[affine_rows]
+    )
+    return dual_values
+
+
+def assemble_lp_matrices(linear_inclusion: LinearInclusion) -> LPMatrices:
+    r"""Assemble the linear optimization problem in matrix form
+
+    The variables are ordered as :math:`x^{(0)}, \ldots, x^{(n)}` followed by
+    :math:`z^{(1)}, \ldots, z^{(n)}`. For each layer the equality constraints
+    :math:`z^{(i)} - W^{(i)} x^{(i-1)} = b^{(i)}` are followed by the two-sided
+    constraints
+
+    .. math::
+
+        \underline{r}^{(i)}_k + \sigma (\xi^{(i)}_k) - \sigma' (\xi^{(i)}_k)
+        \xi^{(i)}_k \leq x^{(i)}_k - \sigma' (\xi^{(i)}_k) z^{(i)}_k \leq
+        \overline{r}^{(i)}_k + \sigma (\xi^{(i)}_k) - \sigma' (\xi^{(i)}_k)
+        \xi^{(i)}_k,
+
+    see Definition 3.2.17 in [Ludwig2023]_. Each layer's blocks are assembled as
+    sparse matrices from the weight matrices' non-zero entries only.
+
+    Piecewise linear activations with a single kink like
+    :data:`~.activation_functions.ReLU` are encoded exactly instead. Neurons, whose
+    pre-activations' intervals do not contain the kink, are stable and their
+    activations are affine in the pre-activations, i.e. :math:`x^{(i)}_k =
+    z^{(i)}_k` for stably active ReLUs. Stable neurons of slope zero, i.e. stably
+    inactive ReLUs, are constant. In hidden layers they are left out and their
+    contributions are added to the next layer's biases. Only the unstable neurons
+    are relaxed by their convex hull on the pre-activations' intervals, which for
+    ReLUs is the triangle :math:`x^{(i)}_k \geq 0, x^{(i)}_k \geq z^{(i)}_k,
+    x^{(i)}_k \leq \frac{\overline{z}^{(i)}_k}{\overline{z}^{(i)}_k -
+    \underline{z}^{(i)}_k} (z^{(i)}_k - \underline{z}^{(i)}_k)`. Thus, the number
+    of half-space constraints per layer varies with the input region.
+
+    Neurons without any path of non-zero weights to the output layer, including
+    unused inputs, cannot influence the margins and are left out, see
+    :attr:`.LPMatrices.neurons`. Hidden neurons with all-zero weight rows have
+    constant pre-activations. If their activations' intervals are single points
+    as well, they are left out with their variables and constraints like stably
+    inactive ReLUs and their activations are added to the next layer's biases.
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        all parameters for the linear constraints and the input regions
+
+    Returns
+    -------
+    LPMatrices
+        the linear optimization problem with an all-zero objective function
+    """
+    activation = linear_inclusion.activation
+    constants = _constant_activations(linear_inclusion)
+    neurons = _live_neurons(linear_inclusion.nn_params, constants)
+    x_sizes = [len(neurons_i) for neurons_i in neurons]
+    x_offsets = np.cumsum([0] + x_sizes)
+    z_offsets = x_offsets[-1] + np.cumsum([0] + x_sizes[1:])
+    x_is = tuple(
+        np.arange(start, end) for start, end in zip(x_offsets[:-1], x_offsets[1:])
+    )
+    z_is = tuple(
+        np.arange(start, end) for start, end in zip(z_offsets[:-1], z_offsets[1:])
+    )
+    row_indices: list[IndexVector] = []
+    column_indices: list[IndexVector] = []
+    coefficients: list[RealVector] = []
+    lhs: list[RealVector] = []
+    rhs: list[RealVector] = []
+    affine_rows: list[IndexVector] = []
+    half_space_rows: list[IndexVector] = []
+    n_rows = 0
+    for i_idx, ((biases, weight_matrix), xi_i, r_i) in enumerate(
+        zip(
+            linear_inclusion.nn_params,
+            linear_inclusion.xi_is,
+            linear_inclusion.r_arrays,
+        ),
+        start=1,
+    ):
+        if np.any(~np.isnan(constants[i_idx - 1])):
+            biases = biases + weight_matrix @ np.nan_to_num(constants[i_idx - 1])
+        live_neurons = neurons[i_idx]
+        n_neurons = len(live_neurons)
+        weights = coo_matrix(weight_matrix[live_neurons][:, neurons[i_idx - 1]])
+        if activation.single_kink:
+            positions, slopes, half_space_lhs, half_space_rhs = _kinked_half_spaces(
+                activation, linear_inclusion.z_arrays[i_idx - 1][live_neurons]
+            )
+        else:
+            positions, slopes, half_space_lhs, half_space_rhs = _taylor_half_spaces(
+                activation, xi_i[live_neurons], r_i[live_neurons]
+            )
+        affine_rows.append(n_rows + np.arange(n_neurons))
+        half_space_rows.append(n_rows + n_neurons + np.arange(len(positions)))
+        row_indices.extend(
+            (
+                affine_rows[-1][weights.row],
+                affine_rows[-1],
+                half_space_rows[-1],
+                half_space_rows[-1],
+            )
+        )
+        column_indices.extend(
+            (
+                x_is[i_idx - 1][weights.col],
+                z_is[i_idx - 1],
+                x_is[i_idx][positions],
+                z_is[i_idx - 1][positions],
+            )
+        )
+        coefficients.extend(
+            (-weights.data, np.ones(n_neurons), np.ones(len(positions)), -slopes)
+        )
+        lhs.extend((biases[live_neurons], half_space_lhs))
+        rhs.extend((biases[live_neurons], half_space_rhs))
+        n_rows += n_neurons + len(positions)
+    n_columns = int(z_offsets[-1])
+    constraint_matrix = csr_matrix(
+        (
+            np.concatenate(coefficients),
+            (np.concatenate(row_indices), np.concatenate(column_indices)),
+        ),
+        shape=(n_rows, n_columns),
+    )
+    constraint_matrix.eliminate_zeros()
+    return LPMatrices(
+        constraint_matrix=constraint_matrix,
+        lhs=np.concatenate(lhs).astype(np.float64),
+        rhs=np.concatenate(rhs).astype(np.float64),
+        lb=np.concatenate(
+            [
+                theta_i.lo[neurons_i]
+                for theta_i, neurons_i in zip(linear_inclusion.theta_arrays, neurons)
+            ]
+            + [np.full(n_columns - x_offsets[-1], -np.inf)]
+        ),
+        ub=np.concatenate(
+            [
+                theta_i.hi[neurons_i]
+                for theta_i, neurons_i in zip(linear_inclusion.theta_arrays, neurons)
+            ]
+            + [np.full(n_columns - x_offsets[-1], np.inf)]
+        ),
+        objective=np.zeros(n_columns),
+        x_is=x_is,
+        z_is=z_is,
+        neurons=neurons,
+        affine_rows=tuple(affine_rows),
+        half_space_rows=tuple(half_space_rows),
+    )
+
+
+def _live_neurons(
+    nn_params: NNParams, constants: VectorOfRealVectors
+) -> tuple[IndexVector, ...]:
+    """Find each layer's non-constant neurons with a path of non-zero weights to the
+    outputs"""
+    live_neurons = [np.arange(len(nn_params.biases[-1]))]
+    for weight_matrix, constants_i in zip(
+        reversed(nn_params.weights), reversed(constants)
+    ):
+        weights = coo_matrix(weight_matrix[live_neurons[0]])
+        columns = np.unique(weights.col[weights.data != 0])
+        live_neurons.insert(0, columns[np.isnan(constants_i[columns])])
+    return tuple(live_neurons)
+
+
+def _constant_activations(linear_inclusion: LinearInclusion) -> VectorOfRealVectors:
+    """Find the activations of the inputs and hidden layers known to be constant
+
+    Only neurons with all-zero weight rows, whose activations' intervals are single
+    points, and stable neurons of piecewise linear activations with a single kink,
+    whose slope is zero, are detected. All other entries are NaN.
+    """
+    constants = [np.full(len(linear_inclusion.theta_arrays[0]), np.nan)]
+    activation = linear_inclusion.activation
+    for weight_matrix, z_i, theta_i in zip(
+        linear_inclusion.nn_params.weights,
+        linear_inclusion.z_arrays[:-1],
+        linear_inclusion.theta_arrays[1:],
+    ):
+        constants.append(np.full(len(z_i), np.nan))
+        if activation.single_kink:
+            values, slopes = activation.func_and_deriv(z_i.midpoint)
+            is_constant = _is_stable(activation, z_i) & (slopes == 0)
+            constants[-1][is_constant] = values[is_constant]
+        weights = coo_matrix(weight_matrix)
+        is_dead = theta_i.lo == theta_i.hi
+        is_dead[weights.row[weights.data != 0]] = False
+        constants[-1][is_dead] = theta_i.lo[is_dead]
+    return tuple(constants)
+
+
+def _is_stable(activation: ActivationFunc, z_i: IntervalArray) -> NDArray[np.bool_]:
+    """Decide which intervals do not contain the single kink in their interior"""
+    (kink,) = activation.breakpoints
+    is_stable: NDArray[np.bool_] = (z_i.hi <= kink) | (z_i.lo >= kink)
+    return is_stable
+
+
+def _taylor_half_spaces(
+    activation: ActivationFunc, xi_i: RealVector, r_i: IntervalArray
+) -> tuple[IndexVector, RealVector, RealVector, RealVector]:
+    """Enclose each neuron's activations by its Taylor approximation's residuals
+
+    Returns
+    -------
+    tuple[IndexVector, RealVector, RealVector, RealVector]
+        the neurons' positions within the layer, the slopes, left-hand and
+        right-hand sides of the half-space constraints
+    """
+    func_xi_i, deriv_xi_i = activation.func_and_deriv(xi_i)
+    offsets = func_xi_i - deriv_xi_i * xi_i
+    return np.arange(len(xi_i)), deriv_xi_i, r_i.lo + offsets, r_i.hi + offsets
+
+
+def _kinked_half_spaces(
+    activation: ActivationFunc, z_i: IntervalArray
+) -> tuple[IndexVector, RealVector, RealVector, RealVector]:
+    """Encode piecewise linear activations with a single kink by their convex hulls
+
+    Stable neurons are encoded by one equality. Unstable neurons are enclosed by
+    their two linear pieces on one side and by the chord between the intervals'
+    endpoints on the other side. For monotone activations pieces of slope zero are
+    left out, since they coincide with the activations' bounds. The chords'
+    intercepts are rounded outwards in sound mode, such that they enclose the
+    activations at both endpoints.
+
+    Returns
+    -------
+    tuple[IndexVector, RealVector, RealVector, RealVector]
+        the neurons' positions within the layer, the slopes, left-hand and
+        right-hand sides of the half-space constraints
+    """
+    is_stable = _is_stable(activation, z_i)
+    (stable,) = np.nonzero(is_stable)
+    (unstable,) = np.nonzero(~is_stable)
+    midpoints = z_i.midpoint[stable]
+    values, stable_slopes = activation.func_and_deriv(midpoints)
+    stable_intercepts = values - stable_slopes * midpoints
+    positions = [stable]
+    slopes = [stable_slopes]
+    lhs = [stable_intercepts]
+    rhs = [stable_intercepts]
+    lo = IntervalArray(z_i.lo[unstable], z_i.lo[unstable], z_i.sound)
+    hi = IntervalArray(z_i.hi[unstable], z_i.hi[unstable], z_i.sound)
+    (lo_values, lo_slopes), (hi_values, hi_slopes) = (
+        activation.func_and_deriv(lo.lo),
+        activation.func_and_deriv(hi.lo),
+    )
+    is_convex = lo_slopes <= hi_slopes
+    for values, piece_slopes, endpoints in (
+        (lo_values, lo_slopes, lo),
+        (hi_values, hi_slopes, hi),
+    ):
+        intercepts = values - endpoints.scale(piece_slopes)
+        is_needed = ~(activation.monotone & (piece_slopes == 0))
+        positions.append(unstable[is_needed])
+        slopes.append(piece_slopes[is_needed])
+        lhs.append(np.where(is_convex, intercepts.lo, -np.inf)[is_needed])
+        rhs.append(np.where(is_convex, np.inf, intercepts.hi)[is_needed])
+    chord_slopes = (hi_values - lo_values) / (hi.lo - lo.lo)
+    lo_intercepts = lo_values - lo.scale(chord_slopes)
+    hi_intercepts = hi_values - hi.scale(chord_slopes)
+    positions.append(unstable)
+    slopes.append(chord_slopes)
+    lhs.append(
+        np.where(is_convex, -np.inf, np.minimum(lo_intercepts.lo, hi_intercepts.lo))
+    )
+    rhs.append(
+        np.where(is_convex, np.maximum(lo_intercepts.hi, hi_intercepts.hi), np.inf)
+    )
+    return (
+        np.concatenate(positions),
+        np.concatenate(slopes).astype(np.float64),
+        np.concatenate(lhs).astype(np.float64),
+        np.concatenate(rhs).astype(np.float64),
+    )
@@ -0,0 +1,642 @@
+"""Interchangeable solvers for linear optimization problems given in matrix form"""
+
+__all__ = [
+    "HiGHSBackend",
+    "LPBackend",
+    "SCIP_PROFILES",
+    "SCIPBackend",
+    "SolveLimits",
+    "SolveResult",
+]
+
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy._typing import NDArray
+from pyscipopt import Expr, ExprCons, Model  # type: ignore[import]
+from pyscipopt import (  # type: ignore[import, attr-defined]
+    SCIP_PARAMSETTING,
+    SCIP_STAGE,
+)
+from pyscipopt.scip import MatrixVariable, Term  # type: ignore[import]
+from scipy.optimize import linprog, OptimizeResult  # type: ignore[import]
+from scipy.sparse import csr_matrix, vstack  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_types import (
+    IndexVector,
+    LPMatrices,
+    RealVector,
+)
+
+SCIP_PROFILES = ("default", "pure_lp", "aggressive_presolve")
+"""The names of the parameter settings :class:`SCIPBackend` can be configured with"""
+_BARRIER_MIN_NONZEROS = 10**6
+
+
+class SolveLimits(NamedTuple):
+    """The budgets of a single solve, after which the solver gives up
+
+    Limits set to None are not imposed.
+    """
+
+    time: float | None = None
+    """the wall-clock time in seconds"""
+    iterations: int | None = None
+    """the number of simplex iterations"""
+    memory: float | None = None
+    """the memory in MiB, only respected by :class:`SCIPBackend`"""
+
+
+class SolveResult(NamedTuple):
+    """The outcome of a single solve, which provides bounds even if a limit was hit"""
+
+    status: str
+    """the status as reported by :meth:`LPBackend.get_status`"""
+    primal_value: float
+    """the objective value of the best solution found or ``np.inf`` if there is
+    none"""
+    dual_bound: float
+    """the best proven lower bound of the optimal objective value, ``np.inf`` if
+    the problem is infeasible and ``-np.inf`` if nothing is proven"""
+
+    @property
+    def gap(self) -> float:
+        """the absolute difference between primal value and dual bound"""
+        if self.primal_value == self.dual_bound:
+            return 0.0
+        return self.primal_value - self.dual_bound
+
+
+class LPBackend(ABC):
+    """The interface every solver for the linear optimization problems provides
+
+    The problem is handed over in matrix form as :class:`~.data_types.LPMatrices`,
+    the objective can be exchanged afterwards without rebuilding the problem. The
+    status is reported with SCIP's vocabulary, i.e. one of ``"optimal"``,
+    ``"infeasible"``, ``"unbounded"``, ``"unknown"`` or a string ending with
+    ``"limit"``.
+    """
+
+    @property
+    def configuration(self) -> dict[str, Any]:
+        """the keyword arguments, which create an empty backend configured alike"""
+        return {}
+
+    @abstractmethod
+    def build(self, lp_matrices: LPMatrices) -> None:
+        """Hand over the constraints, bounds and objective of the problem"""
+
+    @abstractmethod
+    def update(self, lp_matrices: LPMatrices, rows: IndexVector) -> None:
+        """Change the problem in place to match the provided one
+
+        Parameters
+        ----------
+        lp_matrices : LPMatrices
+            the changed problem with the same variables and constraints
+        rows : IndexVector
+            the only constraints, whose coefficients or sides may have changed
+        """
+
+    @abstractmethod
+    def set_objective(self, objective: RealVector) -> None:
+        """Replace the coefficients of the objective function to be minimized"""
+
+    @abstractmethod
+    def set_limits(self, limits: SolveLimits) -> None:
+        """Impose the budgets on every following solve"""
+
+    @abstractmethod
+    def solve(self) -> None:
+        """Solve the current problem"""
+
+    @abstractmethod
+    def get_status(self) -> str:
+        """Return the status of the last solve"""
+
+    @abstractmethod
+    def get_objective_value(self) -> float:
+        """Return the objective value of the best solution found"""
+
+    @abstractmethod
+    def get_bounds(self) -> tuple[float, float]:
+        """Return the primal value and the dual bound of the last solve
+
+        Returns
+        -------
+        tuple[float, float]
+            the objective value of the best solution found or ``np.inf`` if there
+            is none and the best proven lower bound of the optimal objective value,
+            which is ``np.inf`` for infeasible problems and ``-np.inf`` if nothing
+            is proven
+        """
+
+    @abstractmethod
+    def get_primal_values(self) -> RealVector:
+        """Return the values of all variables in the best solution found"""
+
+    @abstractmethod
+    def get_statistics(self) -> dict[str, float]:
+        """Return the solver's statistics of the last solve by name
+
+        Times are in seconds. The numbers of rows and columns refer to the problem
+        after presolving, if the solver reports it.
+        """
+
+    @property
+    def provides_duals(self) -> bool:
+        """whether :meth:`get_dual_values` is available"""
+        return True
+
+    @abstractmethod
+    def get_dual_values(self) -> RealVector:
+        r"""Return the dual values of all constraints
+
+        The dual value of a constraint :math:`lhs \leq a^T v \leq rhs` is the
+        derivative of the optimal objective value with respect to the active side,
+        i.e. it is non-negative if the left-hand side is active and non-positive if
+        the right-hand side is active.
+        """
+
+
+class SCIPBackend(LPBackend):
+    """Solve the linear optimization problems with SCIP via PySCIPOpt
+
+    Parameters
+    ----------
+    names : bool, optional
+        if True, the variables and constraints are named after their meaning in the
+        optimization problem, which is convenient for inspecting written problem
+        files, otherwise (default) SCIP's generic names are used
+    presolve : bool, optional
+        if False, presolving, heuristics and propagation are switched off, which is
+        necessary to retrieve dual values, defaults to True
+    reoptimize : bool, optional
+        if True, SCIP's reoptimization is enabled, such that replacing the objective
+        after a solve keeps the transformed problem, which is then only presolved
+        for the first objective. SCIP does not reuse the previous LP basis, so the
+        simplex of every solve starts from scratch, defaults to False
+    profile : str, optional
+        one of :data:`SCIP_PROFILES`. ``"default"`` (default) keeps SCIP's
+        parameters. ``"pure_lp"`` switches off the machinery for integer programs,
+        i.e. heuristics, cutting planes and propagation, presolves only fast and
+        chooses the LP algorithm by the problem's shape, see
+        :func:`_lp_algorithm`. ``"aggressive_presolve"`` switches off heuristics and
+        cutting planes as well, but presolves aggressively instead. With
+        ``presolve=False`` presolving stays switched off for every profile.
+    """
+
+    model: Model
+    lp_matrices: LPMatrices
+    variables: NDArray[np.object_]
+    terms: NDArray[np.object_]
+    constraints: list[Any]
+
+    def __init__(
+        self,
+        names: bool = False,
+        presolve: bool = True,
+        reoptimize: bool = False,
+        profile: str = "default",
+    ):
+        assert profile in SCIP_PROFILES, (
+            f"Somehow the SCIP profile {profile} was requested, but only "
+            f"{', '.join(SCIP_PROFILES)} are available"
+        )
+        self.names = names
+        self.presolve = presolve
+        self.reoptimize = reoptimize
+        self.profile = profile
+        self.model = Model("Robustness Verification (abstract base)")
+        if reoptimize:
+            self.model.enableReoptimization()
+        if profile != "default":
+            self.model.setHeuristics(SCIP_PARAMSETTING.OFF)
+            self.model.setSeparating(SCIP_PARAMSETTING.OFF)
+        if profile == "pure_lp":
+            self.model.setPresolve(SCIP_PARAMSETTING.FAST)
+            self.model.disablePropagation()
+        elif profile == "aggressive_presolve":
+            self.model.setPresolve(SCIP_PARAMSETTING.AGGRESSIVE)
+        if not presolve:
+            self.model.setPresolve(SCIP_PARAMSETTING.OFF)
+            self.model.setHeuristics(SCIP_PARAMSETTING.OFF)
+            self.model.disablePropagation()
+            # Solutions kept from previous solves would cut off the root node of
+            # later ones before their dual values are available.
+            self.model.setParam("misc/transsolsorig", False)
+
+    @property
+    def configuration(self) -> dict[str, Any]:
+        """the names, presolve, reoptimize and profile settings"""
+        return {
+            "names": self.names,
+            "presolve": self.presolve,
+            "reoptimize": self.reoptimize,
+            "profile": self.profile,
+        }
+
+    def build(self, lp_matrices: LPMatrices) -> None:
+        """Introduce all variables and linear constraints to the SCIP model at once
+
+        One variable is added per column and all rows are added with a single call
+        of :meth:`pyscipopt.scip.Model.addConss`. The ``"pure_lp"`` profile
+        additionally selects the LP algorithm for the problem's shape.
+        """
+        if self.profile == "pure_lp":
+            algorithm = _lp_algorithm(lp_matrices)
+            self.model.setParam("lp/initalgorithm", algorithm)
+            self.model.setParam("lp/resolvealgorithm", algorithm)
+        self._add_vars(lp_matrices)
+        self._add_linear_cons(lp_matrices)
+        self.set_objective(lp_matrices.objective)
+        self.lp_matrices = lp_matrices
+
+    def _add_vars(self, lp_matrices: LPMatrices) -> None:
+        """Introduce all x_is and z_is to the SCIP model"""
+        names = [""] * lp_matrices.shape[1]
+        if self.names:
+            for prefix, layers, start in (
+                ("x", lp_matrices.x_is, 0),
+                ("z", lp_matrices.z_is, 1),
+            ):
+                for i_idx, indices in enumerate(layers, start=start):
+                    for k_idx, index in zip(
+                        _neuron_labels(lp_matrices.neurons[i_idx], len(indices)),
+                        indices.tolist(),
+                    ):
+                        names[index] = f"{prefix}_{k_idx}^({i_idx})"
+        self.variables = np.array(
+            [
+                self.model.addVar(
+                    name=name,
+                    vtype="C",
+                    lb=None if np.isneginf(lb) else lb,
+                    ub=None if np.isposinf(ub) else ub,
+                )
+                for name, lb, ub in zip(
+                    names, lp_matrices.lb.tolist(), lp_matrices.ub.tolist()
+                )
+            ],
+            dtype=object,
+        )
+        self.terms = np.empty(len(self.variables), dtype=object)
+        self.terms[:] = [Term(variable) for variable in self.variables]
+
+    def _add_linear_cons(self, lp_matrices: LPMatrices) -> None:
+        """Introduce all linear constraints to the SCIP model at once"""
+        constraint_matrix = lp_matrices.constraint_matrix
+        names: list[str] | str = ""
+        if self.names:
+            names = [""] * lp_matrices.shape[0]
+            for i_idx, (affine_rows, half_space_rows) in enumerate(
+                zip(lp_matrices.affine_rows, lp_matrices.half_space_rows), start=1
+            ):
+                for k_idx, affine_row, half_space_row in zip(
+                    _neuron_labels(lp_matrices.neurons[i_idx], len(affine_rows)),
+                    affine_rows.tolist(),
+                    half_space_rows.tolist(),
+                ):
+                    names[affine_row] = f"z_{k_idx}^({i_idx})(x^({i_idx - 1}))"
+                    names[half_space_row] = f"x_{k_idx}^({i_idx}) half-spaces"
+        indptr = constraint_matrix.indptr.tolist()
+        terms = self.terms[constraint_matrix.indices].tolist()
+        coefficients = constraint_matrix.data.tolist()
+        self.constraints = self.model.addConss(
+            [
+                ExprCons(
+                    Expr(dict(zip(terms[start:end], coefficients[start:end]))),
+                    lhs=None if np.isneginf(lhs) else lhs,
+                    rhs=None if np.isposinf(rhs) else rhs,
+                )
+                for start, end, lhs, rhs in zip(
+                    indptr[:-1],
+                    indptr[1:],
+                    lp_matrices.lhs.tolist(),
+                    lp_matrices.rhs.tolist(),
+                )
+            ],
+            name=names,
+        )
+
+    def update(self, lp_matrices: LPMatrices, rows: IndexVector) -> None:
+        """Change only differing bounds, sides and coefficients of the SCIP model
+
+        The effort is linear in the number of variables and the number of non-zero
+        entries in the provided rows. SCIP only allows changes to the original
+        problem, so the transformed problem of a previous solve is discarded.
+        """
+        assert not self.reoptimize, (
+            "Somehow the SCIP model was requested to change in place, which SCIP "
+            "does not allow with reoptimization enabled"
+        )
+        if self.model.getStage() != SCIP_STAGE.PROBLEM:
+            self.model.freeTransform()
+        for change_bound, old_bounds, new_bounds in (
+            (self.model.chgVarLb, self.lp_matrices.lb, lp_matrices.lb),
+            (self.model.chgVarUb, self.lp_matrices.ub, lp_matrices.ub),
+        ):
+            (changed_columns,) = np.nonzero(old_bounds != new_bounds)
+            for variable, bound in zip(
+                self.variables[changed_columns], new_bounds[changed_columns].tolist()
+            ):
+                change_bound(variable, None if np.isinf(bound) else bound)
+        old_matrix = self.lp_matrices.constraint_matrix
+        new_matrix = lp_matrices.constraint_matrix
+        for row in rows.tolist():
+            constraint = self.constraints[row]
+            old_row = _row_entries(old_matrix, row)
+            new_row = _row_entries(new_matrix, row)
+            for column in old_row.keys() | new_row.keys():
+                if old_row.get(column, 0.0) != new_row.get(column, 0.0):
+                    self.model.chgCoefLinear(
+                        constraint, self.variables[column], new_row.get(column, 0.0)
+                    )
+            lhs, rhs = lp_matrices.lhs[row], lp_matrices.rhs[row]
+            if lhs != self.lp_matrices.lhs[row]:
+                self.model.chgLhs(constraint, None if np.isneginf(lhs) else lhs)
+            if rhs != self.lp_matrices.rhs[row]:
+                self.model.chgRhs(constraint, None if np.isposinf(rhs) else rhs)
+        self.set_objective(lp_matrices.objective)
+        self.lp_matrices = lp_matrices
+
+    def set_objective(self, objective: RealVector) -> None:
+        """Replace the objective
+
+        After a solve, the transformed problem is kept if reoptimization is enabled
+        and discarded otherwise. In both cases the next solve starts without a basis.
+        """
+        (nonzero_indices,) = np.nonzero(objective)
+        expression = Expr(
+            dict(
+                zip(
+                    self.terms[nonzero_indices].tolist(),
+                    objective[nonzero_indices].tolist(),
+                )
+            )
+        )
+        if self.model.getStage() == SCIP_STAGE.PROBLEM:
+            self.model.setObjective(expression, "minimize")
+        elif self.reoptimize:
+            self.model.freeReoptSolve()
+            self.model.chgReoptObjective(expression, "minimize")
+        else:
+            self.model.freeTransform()
+            self.model.setObjective(expression, "minimize")
+
+    def set_limits(self, limits: SolveLimits) -> None:
+        """Set SCIP's limits on the time, the iterations per LP and the memory"""
+        for name, limit in (
+            ("limits/time", limits.time),
+            ("lp/iterlim", limits.iterations),
+            ("limits/memory", limits.memory),
+        ):
+            if limit is None:
+                self.model.resetParam(name)
+            else:
+                self.model.setParam(name, limit)
+
+    def solve(self) -> None:
+        self.model.optimize()
+
+    def get_status(self) -> str:
+        return str(self.model.getStatus())
+
+    def get_objective_value(self) -> float:
+        return float(self.model.getObjVal())
+
+    def get_bounds(self) -> tuple[float, float]:
+        """Return SCIP's primal and dual bound with its infinity mapped to np.inf"""
+        bounds = []
+        for bound in (self.model.getPrimalbound(), self.model.getDualbound()):
+            if self.model.isInfinity(abs(bound)):
+                bound = np.copysign(np.inf, bound)
+            bounds.append(float(bound))
+        return bounds[0], bounds[1]
+
+    def get_primal_values(self) -> RealVector:
+        """Return the best solution's values, evaluated as one matrix variable"""
+        solution = self.model.getBestSol()
+        assert (
+            solution is not None
+        ), "Somehow primal values were requested from SCIP, which found no solution"
+        return np.asarray(
+            solution[self.variables.view(MatrixVariable)], dtype=np.float64
+        )
+
+    def get_statistics(self) -> dict[str, float]:
+        """Return SCIP's times, iterations, nodes and the transformed problem's size"""
+        return {
+            "solving_time": float(self.model.getSolvingTime()),
+            "presolving_time": float(self.model.getPresolvingTime()),
+            "lp_iterations": float(self.model.getNLPIterations()),
+            "nodes": float(self.model.getNNodes()),
+            "n_rows": float(self.model.getNConss(transformed=True)),
+            "n_columns": float(self.model.getNVars(transformed=True)),
+        }
+
+    @property
+    def provides_duals(self) -> bool:
+        """whether the backend was created with ``presolve=False``"""
+        return not self.presolve
+
+    def get_dual_values(self) -> RealVector:
+        """Return the dual values of all constraints
+
+        Only available if the backend was created with ``presolve=False``, since
+        SCIP does not provide dual values for constraints removed in presolving.
+        SCIP's infinity, which it reports for unavailable dual values, is mapped to
+        ``np.inf``. PySCIPOpt has no matrix access to dual values, so they are
+        queried constraint by constraint.
+        """
+        assert not self.presolve, (
+            "Somehow dual values were requested from SCIP, which only provides them "
+            "if the backend is created with presolve=False"
+        )
+        dual_values = np.array(
+            [self.model.getDualsolLinear(constraint) for constraint in self.constraints]
+        )
+        is_infinite = np.abs(dual_values) >= self.model.infinity()
+        dual_values[is_infinite] = np.copysign(np.inf, dual_values[is_infinite])
+        return dual_values
+
+
+class HiGHSBackend(LPBackend):
+    """Solve the linear optimization problems with HiGHS via SciPy's linprog
+
+    The sparse constraint matrix is handed over to
+    :func:`scipy.optimize.linprog` directly, no license or network access is
+    required.
+
+    Parameters
+    ----------
+    method : str, optional
+        the HiGHS method to use, one of ``"highs"`` (default, automatic choice),
+        ``"highs-ds"`` (dual simplex) or ``"highs-ipm"`` (interior point)
+    options : dict, optional
+        additional solver options passed on to :func:`scipy.optimize.linprog`
+    """
+
+    result: OptimizeResult | None
+
+    _STATUSES = {
+        0: "optimal",
+        1: "iterlimit",
+        2: "infeasible",
+        3: "unbounded",
+        4: "unknown",
+    }
+
+    def __init__(self, method: str = "highs", options: dict[str, Any] | None = None):
+        self.method = method
+        self.options = {} if options is None else options
+        self.result = None
+
+    @property
+    def configuration(self) -> dict[str, Any]:
+        """the method and a copy of the options including the limits"""
+        return {"method": self.method, "options": dict(self.options)}
+
+    def set_limits(self, limits: SolveLimits) -> None:
+        """Set the options for the time and the iterations, memory is not limited"""
+        for option, limit in (
+            ("time_limit", limits.time),
+            ("maxiter", limits.iterations),
+        ):
+            if limit is None:
+                self.options.pop(option, None)
+            else:
+                self.options[option] = limit
+
+    def build(self, lp_matrices: LPMatrices) -> None:
+        """Split the two-sided constraints into equality and inequality constraints"""
+        constraint_matrix = lp_matrices.constraint_matrix
+        self.n_rows = lp_matrices.shape[0]
+        (self.equality_rows,) = np.nonzero(lp_matrices.lhs == lp_matrices.rhs)
+        inequality_rows = lp_matrices.lhs != lp_matrices.rhs
+        (self.upper_rows,) = np.nonzero(inequality_rows & np.isfinite(lp_matrices.rhs))
+        (self.lower_rows,) = np.nonzero(inequality_rows & np.isfinite(lp_matrices.lhs))
+        self.a_eq = constraint_matrix[self.equality_rows]
+        self.b_eq = lp_matrices.rhs[self.equality_rows]
+        self.a_ub = vstack(
+            (
+                constraint_matrix[self.upper_rows],
+                -constraint_matrix[self.lower_rows],
+            ),
+            format="csr",
+        )
+        self.b_ub = np.concatenate(
+            (lp_matrices.rhs[self.upper_rows], -lp_matrices.lhs[self.lower_rows])
+        )
+        self.bounds = np.column_stack((lp_matrices.lb, lp_matrices.ub))
+        self.set_objective(lp_matrices.objective)
+
+    def update(self, lp_matrices: LPMatrices, rows: IndexVector) -> None:
+        """Split the changed problem's constraints again
+
+        :func:`scipy.optimize.linprog` receives the complete problem with every call
+        anyways, such that there is no state to patch.
+        """
+        self.build(lp_matrices)
+
+    def set_objective(self, objective: RealVector) -> None:
+        self.objective = np.array(objective, dtype=np.float64)
+        self.result = None
+
+    def solve(self) -> None:
+        self.result = linprog(
+            self.objective,
+            A_ub=self.a_ub if self.a_ub.shape[0] else None,
+            b_ub=self.b_ub if self.a_ub.shape[0] else None,
+            A_eq=self.a_eq if self.a_eq.shape[0] else None,
+            b_eq=self.b_eq if self.a_eq.shape[0] else None,
+            bounds=self.bounds,
+            method=self.method,
+            options=self.options,
+        )
+
+    def _solved_result(self) -> OptimizeResult:
+        assert (
+            self.result is not None
+        ), "Somehow results were requested from HiGHS before the problem was solved"
+        return self.result
+
+    def get_status(self) -> str:
+        result = self._solved_result()
+        if result.status == 1 and "time limit" in result.message.lower():
+            return "timelimit"
+        return self._STATUSES.get(result.status, "unknown")
+
+    def get_objective_value(self) -> float:
+        return float(self._solved_result().fun)
+
+    def get_bounds(self) -> tuple[float, float]:
+        """Return the bounds, which HiGHS only provides for finished solves"""
+        status = self.get_status()
+        if status == "optimal":
+            return self.get_objective_value(), self.get_objective_value()
+        if status == "infeasible":
+            return np.inf, np.inf
+        if status == "unbounded":
+            return -np.inf, -np.inf
+        return np.inf, -np.inf
+
+    def get_primal_values(self) -> RealVector:
+        return np.asarray(self._solved_result().x, dtype=np.float64)
+
+    def get_statistics(self) -> dict[str, float]:
+        """Return the iterations and the problem's size, HiGHS' presolve is hidden"""
+        return {
+            "lp_iterations": float(self._solved_result().nit),
+            "n_rows": float(self.n_rows),
+            "n_columns": float(len(self.bounds)),
+        }
+
+    def get_dual_values(self) -> RealVector:
+        result = self._solved_result()
+        dual_values = np.zeros(self.n_rows)
+        if len(self.equality_rows):
+            dual_values[self.equality_rows] = result.eqlin.marginals
+        if len(self.upper_rows) + len(self.lower_rows):
+            marginals = result.ineqlin.marginals
+            dual_values[self.upper_rows] += marginals[: len(self.upper_rows)]
+            dual_values[self.lower_rows] -= marginals[len(self.upper_rows) :]
+        return dual_values
+
+
+def _row_entries(matrix: csr_matrix, row: int) -> dict[int, float]:
+    """Map column indices to the non-zero entries of one row of a CSR matrix"""
+    start, end = matrix.indptr[row], matrix.indptr[row + 1]
+    return dict(
+        zip(matrix.indices[start:end].tolist(), matrix.data[start:end].tolist())
+    )
+
+
+def _lp_algorithm(lp_matrices: LPMatrices) -> str:
+    """Choose SCIP's LP algorithm for a problem by its shape
+
+    Problems with at least a million non-zero entries are solved by the barrier
+    method, if the LP solver linked to SCIP provides one, since the simplex' pivots
+    become too expensive. Otherwise, the primal simplex is chosen for problems with
+    more variables than constraints and the dual simplex for all others, following
+    the rule of thumb to pivot along the larger dimension.
+
+    Returns
+    -------
+    str
+        SCIP's abbreviation ``"b"``, ``"p"`` or ``"d"`` for the barrier method, the
+        primal or the dual simplex
+    """
+    if lp_matrices.constraint_matrix.nnz >= _BARRIER_MIN_NONZEROS:
+        return "b"
+    n_rows, n_columns = lp_matrices.shape
+    return "p" if n_columns > n_rows else "d"
+
+
+def _neuron_labels(neurons: IndexVector, n_entries: int) -> list[int]:
+    """Label a layer's entries by its neurons, unless the reduction removed some"""
+    if len(neurons) == n_entries:
+        labels: list[int] = neurons.tolist()
+        return labels
+    return list(range(n_entries))
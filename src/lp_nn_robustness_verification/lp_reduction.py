@@ -0,0 +1,253 @@
+"""Shrink the linear optimization problem before handing it over to a solver"""
+
+__all__ = ["LPReduction", "reduce_lp_matrices"]
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix, diags  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_types import (
+    IndexVector,
+    LPMatrices,
+    RealVector,
+)
+
+
+@dataclass
+class LPReduction:
+    r"""A reduced linear optimization problem and how to translate back and forth
+
+    The original variables :math:`v` are affine functions :math:`v = T v' + t` of
+    the remaining variables :math:`v'` of the reduced problem.
+
+    Attributes
+    ----------
+    lp_matrices : LPMatrices
+        the reduced problem
+    transformation : csr_matrix
+        the matrix :math:`T` of shape ``(original columns, remaining columns)``
+    offset : RealVector
+        the vector :math:`t` of length ``original columns``
+    row_indices : IndexVector
+        the index of each original constraint within the reduced problem or -1, if
+        it was removed
+    original_shape : tuple[int, int]
+        the numbers of rows and columns of the original problem
+    n_substituted_columns : int
+        the number of variables substituted via equality constraints
+    n_fixed_columns : int
+        the number of variables fixed due to degenerate bounds
+    n_implied_rows : int
+        the number of constraints removed, because they are implied by the bounds
+    """
+
+    lp_matrices: LPMatrices
+    transformation: csr_matrix
+    offset: RealVector
+    row_indices: IndexVector
+    original_shape: tuple[int, int]
+    n_substituted_columns: int
+    n_fixed_columns: int
+    n_implied_rows: int
+
+    @property
+    def n_removed_columns(self) -> int:
+        """The number of variables removed from the original problem"""
+        return self.original_shape[1] - self.lp_matrices.shape[1]
+
+    @property
+    def n_removed_rows(self) -> int:
+        """The number of constraints removed from the original problem"""
+        return self.original_shape[0] - self.lp_matrices.shape[0]
+
+    def reduce_objective(self, objective: RealVector) -> tuple[RealVector, float]:
+        """Express an objective of the original problem in the reduced variables
+
+        Parameters
+        ----------
+        objective : RealVector
+            coefficients of the original problem's objective function
+
+        Returns
+        -------
+        tuple[RealVector, float]
+            coefficients of the reduced problem's objective function and the
+            constant to add to its objective values
+        """
+        return (
+            np.asarray(self.transformation.T @ objective, dtype=np.float64),
+            float(objective @ self.offset),
+        )
+
+    def restore_primal_values(self, primal_values: RealVector) -> RealVector:
+        """Compute the original variables' values from the reduced ones"""
+        return np.asarray(self.transformation @ primal_values + self.offset)
+
+    def restore_dual_values(self, dual_values: RealVector) -> RealVector:
+        """Compute the original constraints' dual values from the reduced ones
+
+        Constraints implied by the bounds are never active, such that their dual
+        values are zero. The constraints used for substitution are set to zero as
+        well, which does not match their actual dual values.
+        """
+        is_kept = self.row_indices >= 0
+        restored_dual_values = np.zeros(self.original_shape[0])
+        restored_dual_values[is_kept] = dual_values[self.row_indices[is_kept]]
+        return restored_dual_values
+
+    def __str__(self) -> str:
+        return (
+            f"Removed {self.n_removed_columns} of {self.original_shape[1]} variables "
+            f"({self.n_substituted_columns} substituted, {self.n_fixed_columns} "
+            f"fixed) and {self.n_removed_rows} of {self.original_shape[0]} "
+            f"constraints ({self.n_implied_rows} implied by bounds)"
+        )
+
+
+def reduce_lp_matrices(
+    lp_matrices: LPMatrices, degenerate_width: float = 0.0
+) -> LPReduction:
+    r"""Substitute, fix and drop variables and constraints of the problem
+
+    Three reductions are applied:
+
+    #. each :math:`z^{(i)}_k` is substituted by :math:`W^{(i)}_k x^{(i-1)} +
+       b^{(i)}_k` using its equality constraint, which is removed afterwards,
+    #. each variable, whose bounds are at most ``degenerate_width`` apart, is fixed
+       to the midpoint of its bounds and
+    #. each constraint, which is satisfied for all values within the remaining
+       variables' bounds, is removed.
+
+    Parameters
+    ----------
+    lp_matrices : LPMatrices
+        the problem as assembled by :func:`~.linear_program.assemble_lp_matrices`
+    degenerate_width : float, optional
+        the maximal width of the bounds of variables to be fixed, defaults to 0.0,
+        such that only variables with coinciding bounds are fixed, since any
+        positive value restricts the feasible set
+
+    Returns
+    -------
+    LPReduction
+        the reduced problem with the reduced objective function
+    """
+    n_rows, n_columns = lp_matrices.shape
+    constraint_matrix = csr_matrix(lp_matrices.constraint_matrix)
+    pivot_rows = np.concatenate(lp_matrices.affine_rows)
+    pivot_columns = np.concatenate(lp_matrices.z_is)
+    assert np.all(np.isneginf(lp_matrices.lb[pivot_columns])) and np.all(
+        np.isposinf(lp_matrices.ub[pivot_columns])
+    ), "Somehow some of the variables to be substituted are bounded"
+    assert np.all(
+        lp_matrices.lhs[pivot_rows] == lp_matrices.rhs[pivot_rows]
+    ), "Somehow some of the constraints used for substitution are no equalities"
+    pivots = constraint_matrix[pivot_rows][:, pivot_columns]
+    pivot_values = pivots.diagonal()
+    assert (
+        pivots.count_nonzero() == np.count_nonzero(pivot_values) == len(pivot_values)
+    ), "Somehow the variables to be substituted depend on each other"
+    non_pivot_columns = np.setdiff1d(np.arange(n_columns), pivot_columns)
+    is_fixed = np.zeros(n_columns, dtype=bool)
+    is_fixed[non_pivot_columns] = (
+        lp_matrices.ub[non_pivot_columns] - lp_matrices.lb[non_pivot_columns]
+        <= degenerate_width
+    )
+    is_kept = ~is_fixed
+    is_kept[pivot_columns] = False
+    (kept_columns,) = np.nonzero(is_kept)
+    (fixed_columns,) = np.nonzero(is_fixed)
+    offset = np.zeros(n_columns)
+    offset[fixed_columns] = (
+        lp_matrices.lb[fixed_columns] + lp_matrices.ub[fixed_columns]
+    ) / 2
+    basis = csr_matrix(
+        (np.ones(len(kept_columns)), (kept_columns, np.arange(len(kept_columns)))),
+        shape=(n_columns, len(kept_columns)),
+    )
+    inverse_pivots = diags(1.0 / pivot_values)
+    pivot_dependencies = constraint_matrix[pivot_rows][:, non_pivot_columns]
+    substitutions = coo_matrix(
+        -(inverse_pivots @ pivot_dependencies @ basis[non_pivot_columns])
+    )
+    offset[pivot_columns] = inverse_pivots @ (
+        lp_matrices.rhs[pivot_rows] - pivot_dependencies @ offset[non_pivot_columns]
+    )
+    transformation = csr_matrix(
+        (
+            np.concatenate((np.ones(len(kept_columns)), substitutions.data)),
+            (
+                np.concatenate((kept_columns, pivot_columns[substitutions.row])),
+                np.concatenate((np.arange(len(kept_columns)), substitutions.col)),
+            ),
+        ),
+        shape=(n_columns, len(kept_columns)),
+    )
+    reduced_matrix = csr_matrix(constraint_matrix @ transformation)
+    reduced_matrix.eliminate_zeros()
+    shift = constraint_matrix @ offset
+    lhs, rhs = lp_matrices.lhs - shift, lp_matrices.rhs - shift
+    lb, ub = lp_matrices.lb[kept_columns], lp_matrices.ub[kept_columns]
+    min_activities, max_activities = _activity_bounds(reduced_matrix, lb, ub)
+    is_implied = (min_activities >= lhs) & (max_activities <= rhs)
+    is_implied[pivot_rows] = False
+    is_kept_row = ~is_implied
+    is_kept_row[pivot_rows] = False
+    (kept_rows,) = np.nonzero(is_kept_row)
+    new_columns = np.full(n_columns, -1)
+    new_columns[kept_columns] = np.arange(len(kept_columns))
+    new_rows = np.full(n_rows, -1)
+    new_rows[kept_rows] = np.arange(len(kept_rows))
+    return LPReduction(
+        lp_matrices=LPMatrices(
+            constraint_matrix=reduced_matrix[kept_rows],
+            lhs=lhs[kept_rows],
+            rhs=rhs[kept_rows],
+            lb=lb,
+            ub=ub,
+            objective=np.asarray(transformation.T @ lp_matrices.objective),
+            x_is=_remaining(lp_matrices.x_is, new_columns),
+            z_is=_remaining(lp_matrices.z_is, new_columns),
+            neurons=tuple(
+                neurons_i[new_columns[x_i] >= 0]
+                for neurons_i, x_i in zip(lp_matrices.neurons, lp_matrices.x_is)
+            ),
+            affine_rows=_remaining(lp_matrices.affine_rows, new_rows),
+            half_space_rows=_remaining(lp_matrices.half_space_rows, new_rows),
+        ),
+        transformation=transformation,
+        offset=offset,
+        row_indices=new_rows,
+        original_shape=(n_rows, n_columns),
+        n_substituted_columns=len(pivot_columns),
+        n_fixed_columns=len(fixed_columns),
+        n_implied_rows=int(np.count_nonzero(is_implied)),
+    )
+
+
+def _remaining(
+    index_vectors: tuple[IndexVector, ...], new_indices: IndexVector
+) -> tuple[IndexVector, ...]:
+    """Translate indices to the reduced problem and leave out the removed ones"""
+    return tuple(
+        new_indices[indices][new_indices[indices] >= 0] for indices in index_vectors
+    )
+
+
+def _activity_bounds(
+    matrix: csr_matrix, lb: RealVector, ub: RealVector
+) -> tuple[RealVector, RealVector]:
+    """Compute the smallest and largest values of each row's linear combination"""
+    rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    is_positive = matrix.data > 0
+    lower_bounds = np.where(is_positive, lb[matrix.indices], ub[matrix.indices])
+    upper_bounds = np.where(is_positive, ub[matrix.indices], lb[matrix.indices])
+    return (
+        np.bincount(rows, matrix.data * lower_bounds, matrix.shape[0]).astype(
+            np.float64
+        ),
+        np.bincount(rows, matrix.data * upper_bounds, matrix.shape[0]).astype(
+            np.float64
+        ),
+    )
@@ -1,35 +1,53 @@
 """Performs all computations needed prior the solving the optimization problem"""
 
-__all__ = ["LinearInclusion"]
+__all__ = ["BatchedLinearInclusion", "LinearInclusion"]
 
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Iterator
 
 import numpy as np
-from interval import interval
 
 from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
     UncertainInputs,
 )
 from lp_nn_robustness_verification.data_types import (
     ActivationFunc,
+    IntervalArray,
+    IntervalArrayCollection,
     IntervalCollection,
-    Intervals,
     NNParams,
+    RealMatrix,
+    RealVector,
+    UncertainArray,
+    VectorOfRealMatrices,
     VectorOfRealVectors,
 )
+from lp_nn_robustness_verification.inclusion_cache import InclusionCache
+from lp_nn_robustness_verification.symbolic_bounds import SymbolicBounds
 from lp_nn_robustness_verification.timing import write_current_timing_stats
 
+_N_RELAXATION_PIECES = 16
+_N_SEARCH_ITERATIONS = 32
+_GOLDEN_RATIO_CONJUGATE = (np.sqrt(5.0) - 1.0) / 2.0
+
 
 @dataclass
 class LinearInclusion:
     """Instances provide convenient access to the method of linear inclusion
 
+    All bounds are stored as :class:`~.data_types.IntervalArray` per layer in the
+    attributes ``z_arrays``, ``theta_arrays`` and ``r_arrays``. The corresponding
+    tuples of :class:`interval.interval` objects ``z_is``, ``theta_is`` and ``r_is``
+    are only constructed on first access.
+
     Parameters
     ----------
-    uncertain_inputs: UncertainInputs, optional
+    uncertain_inputs: UncertainInputs or IntervalArray, optional
         the values with associated uncertainties and resulting
         intervals, defaults to the default
-        :class:`~.data_acquisition.uncertain_inputs.UncertainInputs` instance
+        :class:`~.data_acquisition.uncertain_inputs.UncertainInputs` instance. If an
+        :class:`~.data_types.IntervalArray` is provided, it is used as input region
     activation : ActivationFunc, optional
          the activation function and its derivative, defaults to the default
          :class:`~.type_aliases.ActivationFunc` instance
@@ -37,23 +55,51 @@ class LinearInclusion:
         the neural networks parameters, i.e. a tuple of bias vectors and weight
         matrices, defaults to the default
         :class:`~.type_aliases.NNParams` instance
+    sound : bool, optional
+        if True (default) all interval operations round outwards, otherwise all
+        computations are carried out with the default rounding to nearest
+    symbolic : bool, optional
+        if True, the intervals of the :math:`z^{(i)}` are intersected with the bounds
+        of a :class:`~.symbolic_bounds.SymbolicBounds` propagation, which keeps the
+        correlation between the neurons across layers, defaults to False. Inputs with
+        correlated uncertainties are always propagated symbolically starting from
+        the zonotope enclosing their input region.
+    max_generators : int, optional
+        the number of generators kept during symbolic propagation, such that its
+        memory is bounded by the largest layer times ``max_generators``, defaults to
+        keeping all
+    cache : InclusionCache, optional
+        if provided, the bounds are loaded from the cache, if they were computed
+        before, and stored in the cache otherwise
+    min_residual : bool, optional
+        if True, each neuron's expansion point :math:`\\xi` is chosen to minimize the
+        width of its residual term instead of being the midpoint of
+        :math:`\\Theta^{(i)}` and the residual terms are additionally enclosed
+        piecewise, defaults to False
     """
 
     uncertain_inputs: UncertainInputs
     activation: ActivationFunc
     nn_params: NNParams
-    z_is: IntervalCollection
-    theta_is: IntervalCollection
+    z_arrays: IntervalArrayCollection
+    theta_arrays: IntervalArrayCollection
     xi_is: VectorOfRealVectors
-    r_is: IntervalCollection
+    r_arrays: IntervalArrayCollection
 
     def __init__(
         self,
-        uncertain_inputs: UncertainInputs = UncertainInputs(),
+        uncertain_inputs: UncertainInputs | IntervalArray = UncertainInputs(),
         activation: ActivationFunc = ActivationFunc(),
         nn_params: NNParams = NNParams(),
+        sound: bool = True,
+        symbolic: bool = False,
+        max_generators: int | None = None,
+        cache: InclusionCache | None = None,
+        min_residual: bool = False,
     ):
         """Instantiate linear inclusion"""
+        if isinstance(uncertain_inputs, IntervalArray):
+            uncertain_inputs = UncertainInputs(uncertain_inputs)
         assert (
             len(uncertain_inputs.uncertain_values.values)
             == nn_params.weights[0].shape[1]
@@ -66,90 +112,237 @@ class LinearInclusion:
         self.uncertain_inputs = uncertain_inputs
         self.activation = activation
         self.nn_params = nn_params
+        self.sound = sound
+        self.symbolic = symbolic or uncertain_inputs.correlated
+        self.max_generators = max_generators
+        self.min_residual = min_residual
+        if cache is not None:
+            key = cache.key(
+                uncertain_inputs,
+                activation,
+                nn_params,
+                sound,
+                self.symbolic,
+                max_generators,
+                min_residual,
+            )
+            bounds = cache.load(key)
+            if bounds is not None:
+                self.z_arrays, self.theta_arrays, self.xi_is, self.r_arrays = bounds
+                return
         self._compute_z_is_and_theta()
         self._compute_xi_is()
         self._compute_r_is()
+        if cache is not None:
+            cache.store(
+                key, (self.z_arrays, self.theta_arrays, self.xi_is, self.r_arrays)
+            )
+
+    @cached_property
+    def z_is(self) -> IntervalCollection:
+        r"""the :math:`z^{(i)}` as tuples of interval arithmetically enabled objects"""
+        return IntervalCollection(z_i.to_intervals() for z_i in self.z_arrays)
+
+    @cached_property
+    def theta_is(self) -> IntervalCollection:
+        r"""the :math:`\Theta^{(i)}` as tuples of interval enabled objects"""
+        return IntervalCollection(
+            theta_i.to_intervals() for theta_i in self.theta_arrays
+        )
+
+    @cached_property
+    def r_is(self) -> IntervalCollection:
+        r"""the :math:`r^{(i)}` as tuples of interval arithmetically enabled objects"""
+        return IntervalCollection(r_i.to_intervals() for r_i in self.r_arrays)
+
+    @classmethod
+    def from_bounds(
+        cls,
+        uncertain_inputs: UncertainInputs,
+        activation: ActivationFunc,
+        nn_params: NNParams,
+        bounds: tuple[
+            IntervalArrayCollection,
+            IntervalArrayCollection,
+            VectorOfRealVectors,
+            IntervalArrayCollection,
+        ],
+        symbolic: bool = False,
+        min_residual: bool = False,
+    ) -> "LinearInclusion":
+        """Instantiate linear inclusion from already computed bounds
+
+        Parameters
+        ----------
+        uncertain_inputs: UncertainInputs
+            the values with associated uncertainties and resulting intervals
+        activation : ActivationFunc
+             the activation function and its derivative
+        nn_params : NNParams
+            the neural networks parameters, i.e. a tuple of bias vectors and weight
+            matrices
+        bounds : tuple of the z_arrays, theta_arrays, xi_is and r_arrays
+            the bounds as they would have been computed during instantiation
+        symbolic : bool, optional
+            whether the bounds were tightened by symbolic propagation, defaults to
+            False
+        min_residual : bool, optional
+            whether the expansion points were chosen to minimize the residual
+            terms, defaults to False
+
+        Returns
+        -------
+        LinearInclusion
+            the linear inclusion without any recomputation of its bounds
+        """
+        linear_inclusion = cls.__new__(cls)
+        linear_inclusion.uncertain_inputs = uncertain_inputs
+        linear_inclusion.activation = activation
+        linear_inclusion.nn_params = nn_params
+        (
+            linear_inclusion.z_arrays,
+            linear_inclusion.theta_arrays,
+            linear_inclusion.xi_is,
+            linear_inclusion.r_arrays,
+        ) = bounds
+        linear_inclusion.sound = linear_inclusion.theta_arrays[0].sound
+        linear_inclusion.symbolic = symbolic
+        linear_inclusion.max_generators = None
+        linear_inclusion.min_residual = min_residual
+        assert (
+            len(linear_inclusion.z_arrays)
+            == len(linear_inclusion.theta_arrays) - 1
+            == len(linear_inclusion.xi_is)
+            == len(linear_inclusion.r_arrays)
+            == len(nn_params.weights)
+        ), (
+            f"Somehow the number of provided bounds does not match the "
+            f"{len(nn_params.weights)} layers of the network"
+        )
+        return linear_inclusion
+
+    def tighten_layer(self, layer_idx: int, z_i: IntervalArray) -> "LinearInclusion":
+        r"""Intersect one layer's :math:`z^{(i)}` with tighter bounds
+
+        The :math:`\Theta^{(i)}`, :math:`\xi^{(i)}` and :math:`r^{(i)}` of this and
+        all following layers are recomputed from the intersected bounds, where the
+        following layers' :math:`z^{(j)}` are the intersections of their current
+        bounds with the affine images of the new :math:`\Theta^{(j-1)}`.
+
+        Parameters
+        ----------
+        layer_idx : int
+            the layer :math:`i` starting at 1 for the first hidden layer
+        z_i : IntervalArray
+            valid bounds of the layer's pre-activations, e.g. found by
+            :func:`~.bound_tightening.tighten_bounds`
+
+        Returns
+        -------
+        LinearInclusion
+            a new linear inclusion with the tightened bounds
+        """
+        assert 1 <= layer_idx <= len(self.z_arrays), (
+            f"Somehow layer {layer_idx} was requested to be tightened, but the network "
+            f"has the layers 1 to {len(self.z_arrays)}"
+        )
+        residual = _tight_taylors_residual if self.min_residual else _taylors_residual
+        z_is = list(self.z_arrays)
+        theta_is = list(self.theta_arrays)
+        xi_is = list(self.xi_is)
+        r_is = list(self.r_arrays)
+        for j_idx in range(layer_idx, len(z_is) + 1):
+            if j_idx > layer_idx:
+                biases, weight_matrix = (
+                    self.nn_params.biases[j_idx - 1],
+                    self.nn_params.weights[j_idx - 1],
+                )
+                z_i = weight_matrix @ theta_is[j_idx - 1] + biases
+            z_is[j_idx - 1] = z_is[j_idx - 1].intersection(z_i)
+            theta_is[j_idx] = _activation_image(self.activation, z_is[j_idx - 1])
+            xi_is[j_idx - 1] = self._expansion_points(theta_is[j_idx], z_is[j_idx - 1])
+            r_is[j_idx - 1] = residual(
+                self.activation, xi_is[j_idx - 1], z_is[j_idx - 1]
+            )
+        return LinearInclusion.from_bounds(
+            self.uncertain_inputs,
+            self.activation,
+            self.nn_params,
+            (
+                IntervalArrayCollection(z_is),
+                IntervalArrayCollection(theta_is),
+                tuple(xi_is),
+                IntervalArrayCollection(r_is),
+            ),
+            self.symbolic,
+            self.min_residual,
+        )
 
     def _compute_z_is_and_theta(self) -> None:
         r"""Compute the :math:`z^{(i)}` and :math:`\Theta^{(i)}, i = 1, \ldots, n^{(i)}`
 
         For details see Equations 3.10 to 3.12 of Definition 3.2.17 in [Ludwig2023]_.
+        The affine images of the intervals are computed in center/radius form, i.e.
+        :math:`W c \pm |W| r`, which requires only two matrix-vector products per
+        layer. In symbolic mode the :math:`z^{(i)}` are additionally intersected with
+        the bounds of the :class:`~.symbolic_bounds.SymbolicBounds`, which substitute
+        the same linearization as the residual terms for the activations. Its
+        expansion points are kept in :attr:`xi_is` for :meth:`_compute_xi_is`.
         """
+        theta_0 = self.uncertain_inputs.theta_0_array
         z_is = []
-        theta_is = [self.uncertain_inputs.theta_0]
-        for biases, weight_matrix in self.nn_params:
-            z_i = []
-            for k_idx, (bias, weight_vector) in enumerate(zip(biases, weight_matrix)):
-                z_i.append(float(bias))
-                for j_idx, weight in enumerate(weight_vector):
-                    z_i[k_idx] += float(weight) * theta_is[-1][j_idx]
-            z_is.append(Intervals(z_i))
-            write_current_timing_stats(
-                f"{len(self.uncertain_inputs.values)}_inputs_and"
-                f"_{len(self.nn_params.weights)}_layers_with_sample_"
-                f"0_and_seed_0_"
-                f"timings.txt",
-                f"z^({len(z_is)}) computation finished",
-                "a",
+        xi_is = []
+        theta_is = [IntervalArray(theta_0.lo, theta_0.hi, self.sound)]
+        symbolic_bounds = None
+        if self.uncertain_inputs.correlated:
+            symbolic_bounds = SymbolicBounds.from_generators(
+                self.uncertain_inputs.values,
+                self.uncertain_inputs.generators,
+                self.sound,
             )
-            theta_i = []
-            for z_k in z_is[-1]:
-                theta_i.append(
-                    interval[
-                        self.activation.func(z_k[0].inf),
-                        self.activation.func(z_k[0].sup),
-                    ]
-                )
-                assert isinstance(theta_i[-1], interval), (
-                    f"Somehow one of the components of theta ended up not being an "
-                    f"interval but a {type(theta_i[-1])}"
-                )
-            theta_is.append(
-                Intervals(
-                    theta_i,
+        elif self.symbolic:
+            symbolic_bounds = SymbolicBounds.from_box(theta_is[0])
+        for biases, weight_matrix in self.nn_params:
+            z_is.append(weight_matrix @ theta_is[-1] + biases)
+            if symbolic_bounds is not None:
+                symbolic_bounds = symbolic_bounds.affine(weight_matrix, biases)
+                if self.max_generators is not None:
+                    symbolic_bounds = symbolic_bounds.reduce_order(self.max_generators)
+                z_is[-1] = z_is[-1].intersection(symbolic_bounds.concretize())
+            self._write_timing_stats(f"z^({len(z_is)}) computation finished")
+            theta_is.append(_activation_image(self.activation, z_is[-1]))
+            self._write_timing_stats(f"theta^({len(z_is)}) computation finished")
+            if symbolic_bounds is not None and len(z_is) < len(self.nn_params.weights):
+                xi_is.append(self._expansion_points(theta_is[-1], z_is[-1]))
+                self._write_timing_stats(f"xi^({len(xi_is)}) computation finished")
+                symbolic_bounds = symbolic_bounds.linearize(
+                    *_taylors_relaxation(self.activation, xi_is[-1], z_is[-1])
                 )
-            )
-            write_current_timing_stats(
-                f"{len(self.uncertain_inputs.values)}_inputs_and"
-                f"_{len(self.nn_params.weights)}_layers_with_sample_"
-                f"0_and_seed_0_"
-                f"timings.txt",
-                f"theta^({len(z_is)}) computation finished",
-                "a",
-            )
-        self.z_is = IntervalCollection(
-            z_is,
-        )
-        self.theta_is = IntervalCollection(
-            theta_is,
-        )
+        self.z_arrays = IntervalArrayCollection(z_is)
+        self.theta_arrays = IntervalArrayCollection(theta_is)
+        self.xi_is = tuple(xi_is)
 
     def _compute_xi_is(self) -> None:
-        r"""Compute the midpoints of the intervals of the :math:`\Theta^{(i)}`
+        r"""Compute the expansion points :math:`\xi^{(i)}` of the linearizations
 
-        For details see Equation 3.13 of Definition 3.2.17 in [Ludwig2023]_.
+        By default these are the midpoints of the intervals of the
+        :math:`\Theta^{(i)}`, for details see Equation 3.13 of Definition 3.2.17 in
+        [Ludwig2023]_. The expansion points of the layers, which the symbolic
+        propagation linearized already, are reused.
         """
-        xi_is = []
-        for theta_i in self.theta_is[1:]:
-            xi_ks = []
-            for theta_k in theta_i:
-                xi_ks.append(theta_k.midpoint[0].inf)
-            xi_is.append(np.array(xi_ks))
-            write_current_timing_stats(
-                f"{len(self.uncertain_inputs.values)}_inputs_and"
-                f"_{len(self.nn_params.weights)}_layers_with_sample_"
-                f"0_and_seed_0_"
-                f"timings.txt",
-                f"xi^({len(xi_is)}) computation finished",
-                "a",
-            )
-            assert len(xi_ks) == len(theta_i), (
+        xi_is = list(self.xi_is)
+        for theta_i, z_i in zip(
+            self.theta_arrays[1 + len(xi_is) :], self.z_arrays[len(xi_is) :]
+        ):
+            xi_is.append(self._expansion_points(theta_i, z_i))
+            self._write_timing_stats(f"xi^({len(xi_is)}) computation finished")
+            assert len(xi_is[-1]) == len(theta_i), (
                 f"Somehow there is not one xi_k^(i) for every of the {len(theta_i)}, "
-                f"theta_k^(i), but only {len(xi_ks)}"
+                f"theta_k^(i), but only {len(xi_is[-1])}"
             )
-        assert len(xi_is) == len(self.z_is), (
-            f"Somehow there is not one xi^(i) for every of the {len(self.z_is)} z^(i), "
-            f"but only {len(xi_is)}"
+        assert len(xi_is) == len(self.z_arrays), (
+            f"Somehow there is not one xi^(i) for every of the {len(self.z_arrays)} "
+            f"z^(i), but only {len(xi_is)}"
         )
         self.xi_is = tuple(xi_is)
 
@@ -158,43 +351,345 @@ class LinearInclusion:
 
         For details see Equation 3.15 of Definition 3.2.17 in [Ludwig2023]_.
         """
+        residual = _tight_taylors_residual if self.min_residual else _taylors_residual
         r_is = []
-        for xi_i, z_i in zip(self.xi_is, self.z_is):
-            r_i = []
-            for xi_k, z_k in zip(xi_i, z_i):
-                r_i.append(self._taylors_residual(xi_k, z_k))
-            assert isinstance(
-                r_i[-1], interval
-            ), f"Somehow r^(i) ended up not being an interval but a {type(r_i[-1])}"
-            r_is.append(
-                Intervals(
-                    r_i,
-                )
-            )
-            write_current_timing_stats(
-                f"{len(self.uncertain_inputs.values)}_inputs_and"
-                f"_{len(self.nn_params.weights)}_layers_with_sample_"
-                f"0_and_seed_0_"
-                f"timings.txt",
-                f"r^({len(r_is)}) computation finished",
-                "a",
+        for xi_i, z_i in zip(self.xi_is, self.z_arrays):
+            r_is.append(residual(self.activation, xi_i, z_i))
+            self._write_timing_stats(f"r^({len(r_is)}) computation finished")
+        self.r_arrays = IntervalArrayCollection(r_is)
+
+    def _expansion_points(
+        self, theta_i: IntervalArray, z_i: IntervalArray
+    ) -> RealVector:
+        """Choose one layer's expansion points according to :attr:`min_residual`"""
+        if self.min_residual:
+            return _min_residual_points(self.activation, theta_i, z_i)
+        return theta_i.midpoint
+
+    def _write_timing_stats(self, msg: str) -> None:
+        """Write the current timing stats for this instance with a message"""
+        write_current_timing_stats(
+            f"{len(self.uncertain_inputs.values)}_inputs_and"
+            f"_{len(self.nn_params.weights)}_layers_with_sample_"
+            f"0_and_seed_0_"
+            f"timings.txt",
+            msg,
+            "a",
+        )
+
+
+@dataclass
+class BatchedLinearInclusion:
+    """The method of linear inclusion for many uncertain input samples at once
+
+    All samples are propagated through the network together, such that each layer
+    only requires two matrix-matrix products instead of two matrix-vector products
+    per sample. The bounds are stored as :class:`~.data_types.IntervalArray` of
+    shape ``(n_samples, n_neurons)`` per layer. Indexing an instance provides the
+    corresponding :class:`LinearInclusion` for one sample without recomputation,
+    which can be handed to :class:`~.linear_program.RobustVerifier` directly.
+
+    Parameters
+    ----------
+    uncertain_values : UncertainArray
+        the values with associated uncertainties, both given as matrices of shape
+        ``(n_samples, n_inputs)``
+    activation : ActivationFunc, optional
+         the activation function and its derivative, defaults to the default
+         :class:`~.data_types.ActivationFunc` instance
+    nn_params : NNParams, optional
+        the neural networks parameters, i.e. a tuple of bias vectors and weight
+        matrices, defaults to the default :class:`~.data_types.NNParams` instance
+    sound : bool, optional
+        if True (default) all interval operations round outwards, otherwise all
+        computations are carried out with the default rounding to nearest
+    min_residual : bool, optional
+        if True, the expansion points are chosen to minimize the residual terms as
+        for :class:`LinearInclusion`, defaults to False
+    """
+
+    uncertain_values: UncertainArray
+    activation: ActivationFunc
+    nn_params: NNParams
+    sound: bool
+    z_arrays: IntervalArrayCollection
+    theta_arrays: IntervalArrayCollection
+    xi_is: VectorOfRealMatrices
+    r_arrays: IntervalArrayCollection
+
+    def __init__(
+        self,
+        uncertain_values: UncertainArray,
+        activation: ActivationFunc = ActivationFunc(),
+        nn_params: NNParams = NNParams(),
+        sound: bool = True,
+        min_residual: bool = False,
+    ):
+        assert (
+            uncertain_values.values.ndim == uncertain_values.uncertainties.ndim == 2
+            and uncertain_values.values.shape == uncertain_values.uncertainties.shape
+        ), (
+            f"Somehow values and uncertainties are not given as matrices of the same "
+            f"shape but the values are of shape {uncertain_values.values.shape} and "
+            f"the uncertainties of shape {uncertain_values.uncertainties.shape}"
+        )
+        assert uncertain_values.values.shape[1] == nn_params.weights[0].shape[1], (
+            f"Somehow the samples' and the first weight matrix' dimensions do not "
+            f"match, as we have samples of length {uncertain_values.values.shape[1]} "
+            f"but the weight matrix has shape {nn_params.weights[0].shape}"
+        )
+        self.uncertain_values = uncertain_values
+        self.activation = activation
+        self.nn_params = nn_params
+        self.sound = sound
+        self.min_residual = min_residual
+        residual = _tight_taylors_residual if min_residual else _taylors_residual
+        z_is = []
+        theta_is = [
+            IntervalArray.from_center_and_radius(*uncertain_values, sound=sound)
+        ]
+        xi_is = []
+        r_is = []
+        for biases, weight_matrix in nn_params:
+            z_is.append(theta_is[-1] @ weight_matrix.T + biases)
+            theta_is.append(_activation_image(activation, z_is[-1]))
+            xi_is.append(
+                _min_residual_points(activation, theta_is[-1], z_is[-1])
+                if min_residual
+                else theta_is[-1].midpoint
             )
-        self.r_is = IntervalCollection(r_is)
+            r_is.append(residual(activation, xi_is[-1], z_is[-1]))
+        self.z_arrays = IntervalArrayCollection(z_is)
+        self.theta_arrays = IntervalArrayCollection(theta_is)
+        self.xi_is = tuple(xi_is)
+        self.r_arrays = IntervalArrayCollection(r_is)
 
-    def _taylors_residual(self, xi_k: float, z_k: interval) -> interval:
-        """Compute the residual term of the taylor approximation at the midpoint of z_k
+    def __len__(self) -> int:
+        return len(self.uncertain_values.values)
 
-        For details see Equation 3.15 of Definition 3.2.17 in [Ludwig2023]_.
-        """
-        return (
-            interval[
-                self.activation.func(z_k[0].inf),
-                self.activation.func(z_k[0].sup),
-            ]
-            - float(self.activation.func(xi_k))  # type: ignore[arg-type]
-            - float(self.activation.deriv(xi_k))  # type: ignore[arg-type]
-            * (z_k - xi_k)
+    def __getitem__(self, sample_idx: int) -> LinearInclusion:
+        """Provide the linear inclusion of one sample without any recomputation"""
+        return LinearInclusion.from_bounds(
+            UncertainInputs(
+                UncertainArray(
+                    self.uncertain_values.values[sample_idx],
+                    self.uncertain_values.uncertainties[sample_idx],
+                )
+            ),
+            self.activation,
+            self.nn_params,
+            (
+                tuple(z_i[sample_idx] for z_i in self.z_arrays),
+                tuple(theta_i[sample_idx] for theta_i in self.theta_arrays),
+                tuple(xi_i[sample_idx] for xi_i in self.xi_is),
+                tuple(r_i[sample_idx] for r_i in self.r_arrays),
+            ),
+            min_residual=self.min_residual,
+        )
+
+    def __iter__(self) -> Iterator[LinearInclusion]:
+        return (self[sample_idx] for sample_idx in range(len(self)))
+
+
+def _activation_image(activation: ActivationFunc, z_i: IntervalArray) -> IntervalArray:
+    """Compute the image of the intervals under the activation"""
+    return IntervalArray(*activation.image(z_i.lo, z_i.hi), z_i.sound)
+
+
+def _taylors_residual(
+    activation: ActivationFunc, xi_i: RealMatrix | RealVector, z_i: IntervalArray
+) -> IntervalArray:
+    """Compute the residual terms of the taylor approximations at the midpoints
+
+    For details see Equation 3.15 of Definition 3.2.17 in [Ludwig2023]_. The interval
+    operations are carried out componentwise in the same order as with scalar interval
+    arithmetic, such that in sound mode the results coincide with those of
+    :mod:`interval`.
+    """
+    return _taylors_residual_at(activation, xi_i, z_i, *activation.func_and_deriv(xi_i))
+
+
+def _taylors_residual_at(
+    activation: ActivationFunc,
+    xi_i: RealMatrix | RealVector,
+    z_i: IntervalArray,
+    func_xi_i: RealMatrix | RealVector,
+    deriv_xi_i: RealMatrix | RealVector,
+) -> IntervalArray:
+    """Compute the residual terms given the activations and derivatives at the xi"""
+    return (
+        _activation_image(activation, z_i) - func_xi_i - (z_i - xi_i).scale(deriv_xi_i)
+    )
+
+
+def _tight_taylors_residual(
+    activation: ActivationFunc,
+    xi_i: RealMatrix | RealVector,
+    z_i: IntervalArray,
+    n_pieces: int = _N_RELAXATION_PIECES,
+) -> IntervalArray:
+    r"""Compute the residual terms additionally enclosed piecewise
+
+    Since :math:`r = \sigma(z) - \sigma'(\xi) z - \sigma(\xi) + \sigma'(\xi) \xi`,
+    the residual terms are intersected with the piecewise enclosures of
+    :math:`\sigma(z) - \sigma'(\xi) z` as computed for :func:`_taylors_relaxation`.
+    """
+    func_xi_i, deriv_xi_i = activation.func_and_deriv(xi_i)
+    return _taylors_residual_at(
+        activation, xi_i, z_i, func_xi_i, deriv_xi_i
+    ).intersection(
+        _piecewise_intercepts(activation, z_i, deriv_xi_i, n_pieces)
+        - func_xi_i
+        + IntervalArray(xi_i, xi_i, z_i.sound).scale(deriv_xi_i)
+    )
+
+
+def _taylors_relaxation(
+    activation: ActivationFunc,
+    xi_i: RealVector,
+    z_i: IntervalArray,
+    n_pieces: int = _N_RELAXATION_PIECES,
+) -> tuple[RealVector, IntervalArray]:
+    r"""Compute slopes and intercepts of the linearizations enclosing the activations
+
+    Each activation lies within :math:`\sigma'(\xi) z + c` for all :math:`z` within
+    the intervals, where :math:`c` encloses :math:`\sigma(z) - \sigma'(\xi) z =
+    \sigma(\xi) - \sigma'(\xi) \xi + r`. The residual terms' interval evaluation
+    overestimates this range by more than the width of the activations' image. Thus,
+    the range is additionally enclosed piecewise on ``n_pieces`` subintervals
+    :math:`[a, b]`, on which the activation lies within its image
+    :math:`\sigma([a, b])`.
+    """
+    func_xi_i, slopes = activation.func_and_deriv(xi_i)
+    residual_intercepts = (
+        _taylors_residual_at(activation, xi_i, z_i, func_xi_i, slopes)
+        + func_xi_i
+        - IntervalArray(xi_i, xi_i, z_i.sound).scale(slopes)
+    )
+    return slopes, residual_intercepts.intersection(
+        _piecewise_intercepts(activation, z_i, slopes, n_pieces)
+    )
+
+
+def _piecewise_intercepts(
+    activation: ActivationFunc,
+    z_i: IntervalArray,
+    slopes: RealMatrix | RealVector,
+    n_pieces: int,
+) -> IntervalArray:
+    r"""Enclose :math:`\sigma(z) - d z` by the images of ``n_pieces`` subintervals"""
+    grid = _pre_activation_grid(z_i, n_pieces)
+    piecewise_intercepts = IntervalArray(
+        *activation.image(grid[..., :-1], grid[..., 1:]), z_i.sound
+    ) - IntervalArray(grid[..., :-1], grid[..., 1:], z_i.sound).scale(
+        slopes[..., np.newaxis]
+    )
+    return IntervalArray(
+        piecewise_intercepts.lo.min(axis=-1),
+        piecewise_intercepts.hi.max(axis=-1),
+        z_i.sound,
+    )
+
+
+def _pre_activation_grid(z_i: IntervalArray, n_pieces: int) -> RealMatrix:
+    """Split each interval into ``n_pieces`` subintervals of equal width"""
+    grid: RealMatrix = z_i.lo[..., np.newaxis] + (z_i.hi - z_i.lo)[
+        ..., np.newaxis
+    ] * np.linspace(0, 1, n_pieces + 1)
+    grid[..., -1] = z_i.hi
+    return grid
+
+
+def _min_residual_points(
+    activation: ActivationFunc,
+    theta_i: IntervalArray,
+    z_i: IntervalArray,
+    n_pieces: int = _N_RELAXATION_PIECES,
+) -> RealMatrix | RealVector:
+    r"""Choose the expansion points minimizing the widths of the residual terms
+
+    The residual terms enclose :math:`\sigma(z) - \sigma'(\xi) z` up to a constant,
+    whose range is approximated on the ``n_pieces + 1`` points of the grid of
+    :func:`_piecewise_intercepts`. On intervals, on which the activation is convex or
+    concave, the range is narrowest for the chord's slope, such that the activation's
+    closed form of the chord's tangent point is used, if it is available. Otherwise,
+    the width is unimodal in :math:`\xi` between two breakpoints, since the
+    derivative is monotonic there, such that each of these regions is searched by
+    golden section. The searched points are only kept, if they narrow the range
+    compared to the midpoints of the :math:`\Theta^{(i)}`.
+    """
+    points = np.array(theta_i.midpoint)
+    searched = np.ones(points.shape, dtype=np.bool_)
+    if activation.chord_point is not None:
+        closed_form = activation.convex_or_concave(z_i.lo, z_i.hi)
+        points[closed_form] = activation.chord_point(
+            z_i.lo[closed_form], z_i.hi[closed_form]
+        )
+        searched &= ~closed_form
+    if not searched.any():
+        return points
+    lo, hi = z_i.lo[searched], z_i.hi[searched]
+    grid = _pre_activation_grid(IntervalArray(lo, hi, z_i.sound), n_pieces)
+    values = np.broadcast_to(activation.func(grid), grid.shape)
+
+    def range_width(xi: RealVector) -> RealVector:
+        slopes = np.broadcast_to(activation.deriv(xi), xi.shape)
+        width: RealVector = np.ptp(values - slopes[:, np.newaxis] * grid, axis=-1)
+        return width
+
+    region_bounds = (-np.inf, *activation.breakpoints, np.inf)
+    candidates = np.stack(
+        (
+            points[searched],
+            *(
+                _golden_section_search(
+                    range_width, np.clip(region_lo, lo, hi), np.clip(region_hi, lo, hi)
+                )
+                for region_lo, region_hi in zip(region_bounds[:-1], region_bounds[1:])
+            ),
+        )
+    )
+    widths = np.stack([range_width(candidate) for candidate in candidates])
+    points[searched] = np.take_along_axis(
+        candidates, widths.argmin(axis=0)[np.newaxis], axis=0
+    )[0]
+    return points
+
+
+def _golden_section_search(
+    objective: Callable[[RealVector], RealVector],
+    lo: RealVector,
+    hi: RealVector,
+    n_iterations: int = _N_SEARCH_ITERATIONS,
+) -> RealVector:
+    """Minimize a unimodal objective componentwise within intervals
+
+    Each iteration shrinks all intervals by the golden ratio at the cost of one
+    vectorized evaluation of the objective.
+    """
+    left = hi - _GOLDEN_RATIO_CONJUGATE * (hi - lo)
+    right = lo + _GOLDEN_RATIO_CONJUGATE * (hi - lo)
+    objective_left, objective_right = objective(left), objective(right)
+    for _ in range(n_iterations):
+        shrink_right = objective_left <= objective_right
+        hi = np.where(shrink_right, right, hi)
+        lo = np.where(shrink_right, lo, left)
+        new_point = np.where(
+            shrink_right,
+            hi - _GOLDEN_RATIO_CONJUGATE * (hi - lo),
+            lo + _GOLDEN_RATIO_CONJUGATE * (hi - lo),
+        )
+        objective_new = objective(new_point)
+        left, right = (
+            np.where(shrink_right, new_point, right),
+            np.where(shrink_right, left, new_point),
+        )
+        objective_left, objective_right = (
+            np.where(shrink_right, objective_new, objective_right),
+            np.where(shrink_right, objective_left, objective_new),
         )
+    points: RealVector = (lo + hi) / 2.0
+    return points
 
 
 def compute_values_label(
@@ -0,0 +1,271 @@
+"""Search the largest scale of the uncertainties, for which robustness is proven"""
+
+__all__ = ["certify_scales", "RadiusBracket", "search_radius"]
+
+from typing import Callable, NamedTuple
+
+import numpy as np
+from numpy._typing import NDArray
+
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    NNParams,
+    RealVector,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.lp_backends import (
+    LPBackend,
+    SCIPBackend,
+    SolveLimits,
+)
+from lp_nn_robustness_verification.pre_processing import (
+    BatchedLinearInclusion,
+    compute_values_label,
+    LinearInclusion,
+)
+from lp_nn_robustness_verification.verification_pipeline import (
+    check_interval_dominance,
+    search_counterexample,
+)
+
+
+class RadiusBracket(NamedTuple):
+    """The outcome of :func:`search_radius`"""
+
+    certified_scale: float
+    """the largest scale, for which robustness is proven, 0.0 if there is none"""
+    uncertified_scale: float | None
+    """the smallest scale, for which robustness is not proven, None if it is proven
+    up to the largest scale searched"""
+    refuted_scale: float | None
+    """the smallest scale, for which a counterexample was found, such that the
+    sample is not robust for any larger scale, None if none was found"""
+    n_linear_programs: int
+    """the number of scales, for which the margins were minimized"""
+
+
+def certify_scales(
+    uncertain_inputs: UncertainInputs,
+    activation: ActivationFunc,
+    nn_params: NNParams,
+    scales: RealVector,
+    backend_factory: Callable[[], LPBackend] = SCIPBackend,
+    limits: SolveLimits | None = None,
+    sound: bool = True,
+    min_residual: bool = False,
+) -> NDArray[np.bool_]:
+    """Decide robustness for a grid of scales of the uncertainties
+
+    The bounds of all scales are propagated together by one
+    :class:`~.pre_processing.BatchedLinearInclusion`. Since robustness for one
+    scale implies robustness for all smaller scales, the scales are bisected, such
+    that only logarithmically many of them are decided. Each is decided by interval
+    dominance, a search for a counterexample or the minimization of all margins on
+    one optimization problem, which is updated from scale to scale.
+
+    Parameters
+    ----------
+    uncertain_inputs : UncertainInputs
+        the sample, whose uncertainties given as a vector are scaled
+    activation : ActivationFunc
+        the activation function and its derivative
+    nn_params : NNParams
+        the neural networks parameters
+    scales : RealVector
+        the non-negative factors of the uncertainties in ascending order
+    backend_factory : Callable[[], LPBackend], optional
+        creates the backend for the linear programs, defaults to
+        :class:`~.lp_backends.SCIPBackend`
+    limits : SolveLimits, optional
+        the budgets of each linear program, defaults to none
+    sound : bool, optional
+        if True (default) all interval operations round outwards
+    min_residual : bool, optional
+        whether the expansion points minimize the residual terms, defaults to False
+
+    Returns
+    -------
+    NDArray[np.bool_]
+        for each scale, whether robustness is proven
+    """
+    search = _ScaleDecisions(
+        compute_values_label(uncertain_inputs, activation, nn_params),
+        backend_factory,
+        limits,
+    )
+    return _certify_scales(
+        uncertain_inputs, activation, nn_params, scales, search, sound, min_residual
+    )
+
+
+def search_radius(
+    uncertain_inputs: UncertainInputs,
+    activation: ActivationFunc,
+    nn_params: NNParams,
+    max_scale: float = 1.0,
+    tolerance: float = 1e-3,
+    n_grid: int = 8,
+    backend_factory: Callable[[], LPBackend] = SCIPBackend,
+    limits: SolveLimits | None = None,
+    sound: bool = True,
+    min_residual: bool = False,
+) -> RadiusBracket:
+    """Bisect the scale of the uncertainties to find the largest robust one
+
+    First the grid of ``n_grid`` equidistant scales up to ``max_scale`` is decided
+    by :func:`certify_scales`. Afterwards the scales between the largest certified
+    grid point and its successor are bisected, for which the linear inclusion is
+    recomputed, but the optimization problem is only updated by
+    :meth:`.RobustVerifier.update_linear_inclusion`. Each scale is decided by the
+    cheapest sufficient check among interval dominance, a search for a
+    counterexample and the minimization of all margins. Piecewise linear
+    activations with a single kink require setting up the problem for each scale.
+
+    Parameters
+    ----------
+    uncertain_inputs : UncertainInputs
+        the sample, whose uncertainties given as a vector are scaled
+    activation : ActivationFunc
+        the activation function and its derivative
+    nn_params : NNParams
+        the neural networks parameters
+    max_scale : float, optional
+        the largest scale searched, defaults to 1.0
+    tolerance : float, optional
+        the width of the final bracket of scales, defaults to 1e-3
+    n_grid : int, optional
+        the number of scales decided in one batch before bisecting, defaults to 8
+    backend_factory : Callable[[], LPBackend], optional
+        creates the backend for the linear programs, defaults to
+        :class:`~.lp_backends.SCIPBackend`
+    limits : SolveLimits, optional
+        the budgets of each linear program, defaults to none
+    sound : bool, optional
+        if True (default) all interval operations round outwards
+    min_residual : bool, optional
+        whether the expansion points minimize the residual terms, defaults to False
+
+    Returns
+    -------
+    RadiusBracket
+        the largest certified scale and the smallest uncertified scale found
+    """
+    grid = np.linspace(max_scale / n_grid, max_scale, n_grid)
+    search = _ScaleDecisions(
+        compute_values_label(uncertain_inputs, activation, nn_params),
+        backend_factory,
+        limits,
+    )
+    n_certified = int(
+        _certify_scales(
+            uncertain_inputs, activation, nn_params, grid, search, sound, min_residual
+        ).sum()
+    )
+    if n_certified == n_grid:
+        return RadiusBracket(max_scale, None, None, search.n_linear_programs)
+    certified_scale = float(grid[n_certified - 1]) if n_certified else 0.0
+    uncertified_scale = float(grid[n_certified])
+    while uncertified_scale - certified_scale > tolerance:
+        scale = (certified_scale + uncertified_scale) / 2
+        if search.decide(
+            scale,
+            LinearInclusion(
+                _scaled_inputs(uncertain_inputs, scale),
+                activation,
+                nn_params,
+                sound,
+                min_residual=min_residual,
+            ),
+        ):
+            certified_scale = scale
+        else:
+            uncertified_scale = scale
+    return RadiusBracket(
+        certified_scale,
+        uncertified_scale,
+        search.refuted_scale,
+        search.n_linear_programs,
+    )
+
+
+def _certify_scales(
+    uncertain_inputs: UncertainInputs,
+    activation: ActivationFunc,
+    nn_params: NNParams,
+    scales: RealVector,
+    search: "_ScaleDecisions",
+    sound: bool,
+    min_residual: bool,
+) -> NDArray[np.bool_]:
+    """Bisect a grid of scales, whose bounds are propagated in one batch"""
+    assert not uncertain_inputs.correlated, (
+        "Somehow the scales of correlated uncertainties were requested to be "
+        "certified, but only uncertainties given as a vector can be scaled in batches"
+    )
+    assert np.all(np.diff(scales) >= 0), "Somehow the scales are not sorted ascending"
+    batched_linear_inclusion = BatchedLinearInclusion(
+        UncertainArray(
+            np.tile(uncertain_inputs.values, (len(scales), 1)),
+            np.outer(scales, uncertain_inputs.uncertainties),
+        ),
+        activation,
+        nn_params,
+        sound,
+        min_residual,
+    )
+    certified_idx, uncertified_idx = -1, len(scales)
+    while uncertified_idx - certified_idx > 1:
+        scale_idx = (certified_idx + uncertified_idx) // 2
+        if search.decide(scales[scale_idx], batched_linear_inclusion[scale_idx]):
+            certified_idx = scale_idx
+        else:
+            uncertified_idx = scale_idx
+    return np.arange(len(scales)) <= certified_idx
+
+
+def _scaled_inputs(uncertain_inputs: UncertainInputs, scale: float) -> UncertainInputs:
+    """Scale the uncertainties of a sample"""
+    return UncertainInputs(
+        UncertainArray(uncertain_inputs.values, scale * uncertain_inputs.uncertainties)
+    )
+
+
+class _ScaleDecisions:
+    """Decide robustness for one scale after another on the same problem"""
+
+    def __init__(
+        self,
+        label: int,
+        backend_factory: Callable[[], LPBackend],
+        limits: SolveLimits | None,
+    ):
+        self.label = label
+        self.backend_factory = backend_factory
+        self.limits = limits
+        self.verifier: RobustVerifier | None = None
+        self.refuted_scale: float | None = None
+        self.n_linear_programs = 0
+
+    def decide(self, scale: float, linear_inclusion: LinearInclusion) -> bool:
+        """Return whether robustness is proven and remember refuted scales"""
+        if check_interval_dominance(linear_inclusion, self.label) > 0:
+            return True
+        if search_counterexample(linear_inclusion, self.label)[0] < 0:
+            if self.refuted_scale is None or scale < self.refuted_scale:
+                self.refuted_scale = float(scale)
+            return False
+        if self.verifier is None or linear_inclusion.activation.single_kink:
+            backend = self.backend_factory()
+            if isinstance(backend, SCIPBackend):
+                backend.model.hideOutput()
+            self.verifier = RobustVerifier(
+                linear_inclusion, backend, limits=self.limits
+            )
+        else:
+            self.verifier.update_linear_inclusion(linear_inclusion)
+        self.n_linear_programs += 1
+        return bool(np.nanmin(self.verifier.solve_all_margins()) > 0)
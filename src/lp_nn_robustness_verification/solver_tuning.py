@@ -0,0 +1,91 @@
+"""Choose the fastest parameter profile of SCIP for a sample of instances"""
+
+__all__ = ["load_scip_profile", "ProfileTuning", "tune_scip_profile"]
+
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, NamedTuple
+
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.lp_backends import SCIP_PROFILES, SCIPBackend
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+class ProfileTuning(NamedTuple):
+    """The outcome of :func:`tune_scip_profile`"""
+
+    profile: str
+    """the profile with the smallest total time"""
+    seconds: dict[str, float]
+    """the total time of setting up and solving all instances per profile"""
+
+
+def tune_scip_profile(
+    linear_inclusions: Iterable[LinearInclusion],
+    profiles: Iterable[str] = SCIP_PROFILES,
+    n_repetitions: int = 1,
+    path: str | Path | None = None,
+) -> ProfileTuning:
+    """Benchmark SCIP's parameter profiles on a sample of instances
+
+    For every instance and profile the optimization problem is set up and all its
+    margins are minimized by :meth:`.RobustVerifier.solve_all_margins`. The profiles
+    take turns on each instance, such that a changing load of the machine affects
+    all of them alike.
+
+    Parameters
+    ----------
+    linear_inclusions : Iterable[LinearInclusion]
+        the sample of instances, which should resemble the ones to be solved later
+    profiles : Iterable[str], optional
+        the profiles to compare, defaults to all of :data:`.SCIP_PROFILES`
+    n_repetitions : int, optional
+        how often each instance is solved with each profile, defaults to 1
+    path : str or Path, optional
+        if provided, the outcome is stored there as JSON to be read by
+        :func:`load_scip_profile`
+
+    Returns
+    -------
+    ProfileTuning
+        the fastest profile and the times of all profiles
+    """
+    linear_inclusions = tuple(linear_inclusions)
+    assert linear_inclusions, "Somehow the SCIP profiles were tuned on no instance"
+    seconds = dict.fromkeys(profiles, 0.0)
+    for _ in range(n_repetitions):
+        for linear_inclusion in linear_inclusions:
+            for profile in seconds:
+                backend = SCIPBackend(profile=profile)
+                backend.model.hideOutput()
+                start = perf_counter()
+                RobustVerifier(linear_inclusion, backend).solve_all_margins(
+                    stop_early=False
+                )
+                seconds[profile] += perf_counter() - start
+    tuning = ProfileTuning(min(seconds, key=seconds.__getitem__), seconds)
+    if path is not None:
+        Path(path).write_text(json.dumps(tuning._asdict(), indent=4), encoding="utf-8")
+    return tuning
+
+
+def load_scip_profile(path: str | Path) -> str:
+    """Read the fastest profile stored by :func:`tune_scip_profile`
+
+    Parameters
+    ----------
+    path : str or Path
+        the JSON file written by :func:`tune_scip_profile`
+
+    Returns
+    -------
+    str
+        the profile to pass on to :class:`~.lp_backends.SCIPBackend`
+    """
+    profile = str(json.loads(Path(path).read_text(encoding="utf-8"))["profile"])
+    assert profile in SCIP_PROFILES, (
+        f"Somehow the stored SCIP profile {profile} is none of "
+        f"{', '.join(SCIP_PROFILES)}"
+    )
+    return profile
@@ -0,0 +1,244 @@
+"""Symbolic propagation of linear bounds in terms of the network's inputs"""
+
+__all__ = ["SymbolicBounds"]
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_types import (
+    IndexVector,
+    IntervalArray,
+    RealMatrix,
+    RealVector,
+    WeightMatrix,
+)
+
+
+@dataclass
+class SymbolicBounds:
+    r"""Affine enclosures of one layer's neurons in terms of the input generators
+
+    The input region is described as :math:`c + G \varepsilon` with
+    :math:`\varepsilon \in [-1, 1]^m`, e.g. a box with :math:`G` being the diagonal
+    matrix of its radii or a zonotope enclosing correlated inputs. Every neuron's
+    value is then enclosed by :math:`A \varepsilon + e` with interval coefficients
+    :math:`A` and interval offsets :math:`e`, such that the correlation between the
+    neurons is kept across layers instead of being lost in each interval
+    matrix-vector product.
+
+    Substituting the linear relaxations :math:`\Theta^{(i)} \in D^{(i)} z^{(i)} +
+    \sigma(\xi^{(i)}) - D^{(i)} \xi^{(i)} + r^{(i)}` with :math:`D^{(i)} =
+    \operatorname{diag} \sigma'(\xi^{(i)})` from the linear inclusion layer by layer
+    back into the preceding affine maps yields the same enclosures as the
+    back-substitution of each layer's bounds to the inputs. Since lower and upper
+    relaxation share their slopes, the coefficients are accumulated in forward
+    direction instead, which requires two matrix-matrix products per layer.
+
+    A box's generators are diagonal, so they are not stored as a matrix. Instead,
+    each generator is described by its single non-zero coefficient and the neuron
+    it belongs to, until the first affine map makes the coefficients dense.
+
+    Parameters
+    ----------
+    coefficients : IntervalArray
+        the coefficients :math:`A` of shape ``(n_neurons, n_generators)`` or, if the
+        generators' neurons are given, their non-zero coefficients of shape
+        ``(n_generators,)``
+    offsets : IntervalArray
+        the offsets :math:`e` of shape ``(n_neurons,)``
+    generator_neurons : IndexVector, optional
+        for each generator the neuron it solely contributes to, defaults to dense
+        coefficients
+    """
+
+    coefficients: IntervalArray
+    offsets: IntervalArray
+    generator_neurons: IndexVector | None = None
+
+    @classmethod
+    def from_generators(
+        cls,
+        center: RealVector,
+        generators: RealMatrix | csr_matrix,
+        sound: bool = True,
+    ) -> "SymbolicBounds":
+        r"""Describe the input region :math:`c + G \varepsilon` itself
+
+        Sparse generators with at most one non-zero entry per column, such as the
+        generators of a box, keep their diagonal form. All others are stored dense.
+
+        Parameters
+        ----------
+        center : RealVector
+            the center :math:`c` of the input region
+        generators : RealMatrix or csr_matrix
+            the generator matrix :math:`G` of shape ``(n_inputs, n_generators)``
+        sound : bool, optional
+            if True (default) all operations round outwards
+
+        Returns
+        -------
+        SymbolicBounds
+            the exact enclosure of the inputs
+        """
+        if isinstance(generators, csr_matrix):
+            columns = csc_matrix(generators)
+            columns.eliminate_zeros()
+            if np.all(np.diff(columns.indptr) <= 1):
+                return cls(
+                    IntervalArray(columns.data, columns.data, sound),
+                    IntervalArray(center, center, sound),
+                    columns.indices.astype(np.int64),
+                )
+            generators = columns.toarray()
+        return cls(
+            IntervalArray(generators, generators, sound),
+            IntervalArray(center, center, sound),
+        )
+
+    @classmethod
+    def from_box(cls, theta_0: IntervalArray) -> "SymbolicBounds":
+        r"""Describe a box shaped input region by its midpoints and radii
+
+        Inputs without uncertainty do not contribute a generator.
+
+        Parameters
+        ----------
+        theta_0 : IntervalArray
+            the input region :math:`\Theta^{(0)}`
+
+        Returns
+        -------
+        SymbolicBounds
+            the exact enclosure of the inputs
+        """
+        radius = theta_0.radius
+        uncertain = np.flatnonzero(radius > 0)
+        return cls(
+            IntervalArray(radius[uncertain], radius[uncertain], theta_0.sound),
+            IntervalArray(theta_0.midpoint, theta_0.midpoint, theta_0.sound),
+            uncertain,
+        )
+
+    def affine(
+        self, weight_matrix: WeightMatrix, biases: RealVector
+    ) -> "SymbolicBounds":
+        """Enclose the next layer's pre-activations :math:`z = W x + b`
+
+        Parameters
+        ----------
+        weight_matrix : WeightMatrix
+            the weight matrix :math:`W`, dense or sparse
+        biases : RealVector
+            the bias vector :math:`b`
+
+        Returns
+        -------
+        SymbolicBounds
+            the enclosures of the pre-activations
+        """
+        if self.generator_neurons is None:
+            coefficients = weight_matrix @ self.coefficients
+        else:
+            if isinstance(weight_matrix, csr_matrix):
+                columns = weight_matrix[:, self.generator_neurons].toarray()
+            else:
+                columns = weight_matrix[:, self.generator_neurons]
+            coefficients = self.coefficients.scale(columns)
+        return SymbolicBounds(coefficients, weight_matrix @ self.offsets + biases)
+
+    def linearize(
+        self, slopes: RealVector, intercepts: IntervalArray
+    ) -> "SymbolicBounds":
+        """Enclose the activations by a linear relaxation of the activation function
+
+        Parameters
+        ----------
+        slopes : RealVector
+            the slopes :math:`d` of the relaxations
+        intercepts : IntervalArray
+            the intercepts :math:`c`, such that each activation lies within
+            :math:`d z + c` for all pre-activations :math:`z` within the bounds
+
+        Returns
+        -------
+        SymbolicBounds
+            the enclosures of the activations
+        """
+        if self.generator_neurons is None:
+            coefficients = self.coefficients.scale(slopes[:, np.newaxis])
+        else:
+            coefficients = self.coefficients.scale(slopes[self.generator_neurons])
+        return SymbolicBounds(
+            coefficients,
+            self.offsets.scale(slopes) + intercepts,
+            self.generator_neurons,
+        )
+
+    def reduce_order(self, max_generators: int) -> "SymbolicBounds":
+        """Enclose the contributions of all but the largest generators by the offsets
+
+        The generators are ranked by the total magnitude of their coefficients as in
+        Girard's order reduction of zonotopes. The concretization does not change,
+        but the correlation carried by the dropped generators is lost.
+
+        Parameters
+        ----------
+        max_generators : int
+            the number of generators to keep
+
+        Returns
+        -------
+        SymbolicBounds
+            the enclosures with at most ``max_generators`` generators
+        """
+        magnitudes = self._magnitudes
+        if magnitudes.shape[1] <= max_generators:
+            return self
+        ranking = np.argsort(np.asarray(magnitudes.sum(axis=0)).ravel())[::-1]
+        kept, dropped = ranking[:max_generators], ranking[max_generators:]
+        offsets = self.offsets + _spread(magnitudes[:, dropped], self.offsets.sound)
+        if self.generator_neurons is None:
+            return SymbolicBounds(self.coefficients[:, kept], offsets)
+        return SymbolicBounds(
+            self.coefficients[kept], offsets, self.generator_neurons[kept]
+        )
+
+    def concretize(self) -> IntervalArray:
+        r"""Bound each neuron's enclosure over all inputs
+
+        Returns
+        -------
+        IntervalArray
+            the intervals :math:`e \pm |A| 1`
+        """
+        return self.offsets + _spread(self._magnitudes, self.offsets.sound)
+
+    @property
+    def _magnitudes(self) -> RealMatrix | csr_matrix:
+        """the largest absolute values within the coefficients' intervals
+
+        They are returned as sparse matrix of shape ``(n_neurons, n_generators)``,
+        if the generators' neurons are given.
+        """
+        magnitudes = np.maximum(abs(self.coefficients.lo), abs(self.coefficients.hi))
+        if self.generator_neurons is None:
+            return magnitudes
+        return csr_matrix(
+            (
+                magnitudes,
+                (self.generator_neurons, np.arange(len(self.generator_neurons))),
+            ),
+            shape=(len(self.offsets), len(self.generator_neurons)),
+        )
+
+
+def _spread(magnitudes: RealMatrix | csr_matrix, sound: bool) -> IntervalArray:
+    r"""Enclose :math:`A \varepsilon, \varepsilon \in [-1, 1]^m` by :math:`|A|`"""
+    n_generators = magnitudes.shape[1]
+    spread: IntervalArray = magnitudes @ IntervalArray(
+        -np.ones(n_generators), np.ones(n_generators), sound
+    )
+    return spread
@@ -1,8 +1,10 @@
 """Time the current progress of model preprocessing setup or any part of the process"""
 
-__all__ = ["write_current_timing_stats"]
+__all__ = ["write_current_timing_stats", "write_statistics_record"]
 
+import json
 from io import StringIO
+from typing import Mapping
 
 import yappi  # type: ignore[import]
 
@@ -41,3 +43,28 @@ def write_current_timing_stats(
                 f"===========================\n"
             )
             timings_file.write(out.getvalue())
+
+
+def write_statistics_record(
+    statistics: Mapping[str, float],
+    filename: str = "statistics.jsonl",
+    **fields: str | float,
+) -> None:
+    """Append the statistics of one instance to a file as one line of JSON
+
+    Meant for :attr:`.RobustVerifier.statistics`, such that records of many
+    instances can be compared by e.g. ``pandas.read_json(filename, lines=True)``.
+
+    Parameters
+    ----------
+    statistics : Mapping[str, float]
+        the statistics of solving one instance by name
+    filename : str, optional
+        destination file name, can be relative to current working directory,
+        defaults to "statistics.jsonl"
+    **fields : str or float
+        further entries of the record to identify the instance, e.g. the name of
+        the network or its number of neurons
+    """
+    with open(filename, "a", encoding="utf-8") as statistics_file:
+        statistics_file.write(json.dumps({**fields, **statistics}) + "\n")
@@ -0,0 +1,195 @@
+"""Decide robustness by trying cheap checks before solving linear programs"""
+
+__all__ = [
+    "check_interval_dominance",
+    "PipelineDecision",
+    "search_counterexample",
+    "Tier",
+    "verify",
+]
+
+from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    NNParams,
+    RealMatrix,
+    RealVector,
+)
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.lp_backends import LPBackend, SolveLimits
+from lp_nn_robustness_verification.pre_processing import (
+    compute_values_label,
+    LinearInclusion,
+)
+
+
+class Tier(Enum):
+    """The checks of the pipeline in the order they are tried"""
+
+    INTERVAL_DOMINANCE = "interval dominance"
+    FALSIFICATION = "falsification"
+    LINEAR_PROGRAM = "linear program"
+
+
+class PipelineDecision(NamedTuple):
+    """The outcome of :func:`verify` for one instance"""
+
+    robust: bool | None
+    """True if robustness is proven, False if it is refuted and None if undecided"""
+    tier: Tier
+    """the check which decided the instance or gave up last"""
+    margin: float
+    """the margin between label and competitors found by the deciding check
+
+    a lower bound for interval dominance and the linear program and the margin of
+    the counterexample for falsification
+    """
+    counterexample: RealVector | None = None
+    """an input within the input region, which is not classified as the label"""
+    verifier: RobustVerifier | None = None
+    """the solved optimization problem, if the linear program had to be solved"""
+
+
+def check_interval_dominance(linear_inclusion: LinearInclusion, label: int) -> float:
+    r"""Bound the margin between label and competitors by the output intervals
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        the linear inclusion providing the output layer's intervals
+    label : int
+        the index of the output neuron expected to be maximal
+
+    Returns
+    -------
+    float
+        :math:`\underline{\Theta}^{(n)}_{label} - \max_{k \neq label}
+        \overline{\Theta}^{(n)}_k`, which proves robustness if it is positive
+    """
+    theta_n = linear_inclusion.theta_arrays[-1]
+    return float(theta_n.lo[label] - np.delete(theta_n.hi, label).max())
+
+
+def search_counterexample(
+    linear_inclusion: LinearInclusion, label: int
+) -> tuple[float, RealVector]:
+    """Look for an input within the input region, which is not classified as label
+
+    Besides the input region's center, for each competitor the point of the input
+    region is evaluated, which minimizes the margin's linearization in the center,
+    i.e. a vertex of a box or a boundary point of the ellipsoid of correlated inputs.
+    All candidates are propagated through the network in one batch.
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        the network and its input region
+    label : int
+        the index of the output neuron expected to be maximal
+
+    Returns
+    -------
+    tuple[float, RealVector]
+        the smallest margin between the label and any competitor among all
+        candidates and the candidate attaining it, which refutes robustness if the
+        margin is negative
+    """
+    theta_0 = linear_inclusion.theta_arrays[0]
+    center = linear_inclusion.uncertain_inputs.values
+    activation = linear_inclusion.activation
+    nn_params = linear_inclusion.nn_params
+    _, derivs = _forward_pass(
+        center[np.newaxis, :], activation, nn_params, with_derivs=True
+    )
+    jacobian = np.eye(len(nn_params.biases[-1]))
+    for deriv_i, weight_matrix in zip(reversed(derivs), reversed(nn_params.weights)):
+        jacobian = (jacobian * deriv_i[0]) @ weight_matrix
+    margin_gradients = np.delete(jacobian[label] - jacobian, label, axis=0)
+    if linear_inclusion.uncertain_inputs.correlated:
+        generators = linear_inclusion.uncertain_inputs.generators
+        directions = margin_gradients @ generators
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        steps = (directions / np.where(norms > 0, norms, 1.0)) @ generators.T
+    else:
+        steps = np.sign(margin_gradients) * theta_0.radius
+    candidates = np.clip(np.vstack((center, center - steps)), theta_0.lo, theta_0.hi)
+    outputs, _ = _forward_pass(candidates, activation, nn_params)
+    margins = outputs[:, label] - np.delete(outputs, label, axis=1).max(axis=1)
+    worst_idx = int(margins.argmin())
+    return float(margins[worst_idx]), candidates[worst_idx]
+
+
+def verify(
+    linear_inclusion: LinearInclusion,
+    backend: LPBackend | None = None,
+    reduce: bool = False,
+    limits: SolveLimits | None = None,
+) -> PipelineDecision:
+    """Decide robustness by the cheapest sufficient check
+
+    The checks are tried in the order of :class:`Tier`: interval dominance of the
+    label's output interval, a search for a counterexample and finally the
+    minimization of all margins by :meth:`.RobustVerifier.solve_all_margins`.
+
+    Parameters
+    ----------
+    linear_inclusion : LinearInclusion
+        the network and its input region
+    backend : LPBackend, optional
+        the solver for the linear programs, defaults to
+        :class:`~.lp_backends.SCIPBackend`
+    reduce : bool, optional
+        if True, the linear programs are reduced before solving, defaults to False
+    limits : SolveLimits, optional
+        the budgets of each linear program, after which its dual bound is used as
+        the margin's lower bound, defaults to none
+
+    Returns
+    -------
+    PipelineDecision
+        whether the network is robust and which check decided
+    """
+    label = compute_values_label(
+        linear_inclusion.uncertain_inputs,
+        linear_inclusion.activation,
+        linear_inclusion.nn_params,
+    )
+    dominance_margin = check_interval_dominance(linear_inclusion, label)
+    if dominance_margin > 0:
+        return PipelineDecision(True, Tier.INTERVAL_DOMINANCE, dominance_margin)
+    falsification_margin, candidate = search_counterexample(linear_inclusion, label)
+    if falsification_margin < 0:
+        return PipelineDecision(
+            False, Tier.FALSIFICATION, falsification_margin, candidate
+        )
+    verifier = RobustVerifier(linear_inclusion, backend, reduce=reduce, limits=limits)
+    lp_margin = float(np.nanmin(verifier.solve_all_margins()))
+    return PipelineDecision(
+        True if lp_margin > 0 else None,
+        Tier.LINEAR_PROGRAM,
+        lp_margin,
+        verifier=verifier,
+    )
+
+
+def _forward_pass(
+    inputs: RealMatrix,
+    activation: ActivationFunc,
+    nn_params: NNParams,
+    with_derivs: bool = False,
+) -> tuple[RealMatrix, list[RealMatrix]]:
+    """Propagate a batch of inputs row-wise and optionally keep the derivatives"""
+    x_i = inputs
+    derivs = []
+    for biases, weight_matrix in nn_params:
+        z_i = x_i @ weight_matrix.T + biases
+        if with_derivs:
+            x_i, deriv_i = activation.func_and_deriv(z_i)
+            derivs.append(deriv_i)
+        else:
+            x_i = np.broadcast_to(activation.func(z_i), z_i.shape)
+    return x_i, derivs
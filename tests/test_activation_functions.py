@@ -0,0 +1,191 @@
+import pickle
+from typing import Callable
+
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_equal
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    identity,
+    Identity,
+    identity_prime,
+    quadlu,
+    QuadLU,
+    quadlu_and_prime,
+    quadlu_chord_point,
+    quadlu_prime,
+    relu,
+    ReLU,
+    relu_prime,
+    sigmoid,
+    Sigmoid,
+    sigmoid_and_prime,
+    sigmoid_chord_point,
+    sigmoid_prime,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    ChordPointFunction,
+    RealScalarFunction,
+    RealVector,
+)
+
+
+def test_identity_returns_input() -> None:
+    assert_equal(identity(np.array([-1.0, 2.0])), np.array([-1.0, 2.0]))
+
+
+def test_identity_prime_is_one_for_scalars() -> None:
+    assert_equal(identity_prime(np.float64(-3.0)), 1.0)
+
+
+def test_identity_prime_is_one_for_arrays() -> None:
+    assert_equal(identity_prime(np.array([-1.0, 2.0])), np.ones(2))
+
+
+def test_identity_can_be_pickled() -> None:
+    assert_equal(pickle.loads(pickle.dumps(Identity)).func(2.0), 2.0)
+
+
+@pytest.mark.parametrize("activation", [Identity, Sigmoid, QuadLU, ReLU])
+def test_image_encloses_sampled_values(activation: ActivationFunc) -> None:
+    lo, hi = np.array([-2.0, -0.3, 0.1, 1.0]), np.array([-1.0, 0.2, 0.5, 3.0])
+    samples = np.linspace(lo, hi, 101)
+    image_lo, image_hi = activation.image(lo, hi)
+    assert np.all(activation.func(samples) >= image_lo)
+    assert np.all(activation.func(samples) <= image_hi)
+
+
+@pytest.mark.parametrize("activation", [Identity, Sigmoid, QuadLU, ReLU])
+def test_deriv_range_encloses_sampled_derivatives(activation: ActivationFunc) -> None:
+    lo, hi = np.array([-2.0, -0.3, 0.1, -1.0]), np.array([-1.0, 0.2, 0.5, 3.0])
+    samples = np.linspace(lo, hi, 101)
+    deriv_lo, deriv_hi = activation.deriv_range(lo, hi)
+    assert np.all(activation.deriv(samples) >= deriv_lo)
+    assert np.all(activation.deriv(samples) <= deriv_hi)
+
+
+def test_sigmoid_deriv_range_contains_maximum_at_breakpoint() -> None:
+    _, deriv_hi = Sigmoid.deriv_range(np.array([-1.0]), np.array([2.0]))
+    assert_equal(deriv_hi, np.array([0.25]))
+
+
+def test_image_of_non_monotone_function_contains_breakpoints() -> None:
+    square = ActivationFunc(
+        np.square, lambda x: 2 * x, monotone=False, breakpoints=(0.0,)
+    )
+    assert_equal(
+        square.image(np.array([-1.0, 1.0]), np.array([2.0, 2.0])),
+        (np.array([0.0, 1.0]), np.array([4.0, 4.0])),
+    )
+
+
+def test_deriv_range_requires_declared_convexity() -> None:
+    with pytest.raises(AssertionError):
+        ActivationFunc().deriv_range(np.zeros(1), np.ones(1))
+
+
+@pytest.mark.parametrize("activation", [Identity, Sigmoid, QuadLU, ReLU])
+def test_func_and_deriv_matches_separate_evaluations(
+    activation: ActivationFunc,
+) -> None:
+    val = np.linspace(-3.0, 3.0, 13)
+    value, deriv = activation.func_and_deriv(val)
+    assert_almost_equal(value, activation.func(val))
+    assert_almost_equal(deriv, activation.deriv(val))
+
+
+@pytest.mark.parametrize("activation", [Identity, Sigmoid, QuadLU, ReLU])
+def test_func_and_deriv_writes_into_buffers(activation: ActivationFunc) -> None:
+    val = np.linspace(-3.0, 3.0, 13)
+    buffers = (np.empty(13), np.empty(13))
+    value, deriv = activation.func_and_deriv(val, out=buffers)
+    assert value is buffers[0]
+    assert deriv is buffers[1]
+
+
+def test_func_and_deriv_falls_back_to_separate_evaluations() -> None:
+    value, deriv = ActivationFunc(
+        np.tanh, lambda x: 1 - np.tanh(x) ** 2
+    ).func_and_deriv(np.zeros(3))
+    assert_equal(value, np.zeros(3))
+    assert_equal(deriv, np.ones(3))
+
+
+@pytest.mark.parametrize(
+    "kernel", [sigmoid, sigmoid_prime, quadlu, quadlu_prime, relu, relu_prime]
+)
+def test_kernels_write_into_out(kernel: Callable[..., np.float64 | RealVector]) -> None:
+    out = np.empty(5)
+    assert kernel(np.linspace(-1.0, 1.0, 5), out=out) is out
+
+
+def test_sigmoid_is_stable_for_large_arguments() -> None:
+    with np.errstate(all="raise"):
+        assert_equal(sigmoid(np.array([-1000.0, 1000.0])), np.array([0.0, 1.0]))
+
+
+def test_sigmoid_prime_is_accurate_for_large_arguments() -> None:
+    assert_almost_equal(sigmoid_prime(np.float64(50.0)) / np.exp(-50.0), 1.0)
+
+
+def test_sigmoid_prime_is_stable_for_large_arguments() -> None:
+    with np.errstate(all="raise"):
+        assert_equal(sigmoid_prime(np.array([-1000.0, 1000.0])), np.zeros(2))
+
+
+def test_sigmoid_prime_agrees_with_fused_kernel() -> None:
+    val = np.linspace(-40.0, 40.0, 81)
+    assert_almost_equal(sigmoid_prime(val), sigmoid_and_prime(val)[1], decimal=15)
+
+
+def test_sigmoid_uses_fused_kernel() -> None:
+    assert Sigmoid.fused is sigmoid_and_prime
+
+
+def test_quadlu_and_prime_returns_scalars_for_scalars() -> None:
+    assert_equal(quadlu_and_prime(np.float64(0.0)), (0.0625, 0.5))
+
+
+def test_relu_and_prime_uses_left_derivative_at_kink() -> None:
+    value, deriv = ReLU.func_and_deriv(np.array([-1.0, 0.0, 2.0]))
+    assert_equal(value, np.array([0.0, 0.0, 2.0]))
+    assert_equal(deriv, np.array([0.0, 0.0, 1.0]))
+
+
+def test_relu_has_single_kink() -> None:
+    assert ReLU.single_kink
+    assert not Sigmoid.single_kink
+
+
+@pytest.mark.parametrize(
+    "func, deriv, chord_point",
+    [
+        (sigmoid, sigmoid_prime, sigmoid_chord_point),
+        (quadlu, quadlu_prime, quadlu_chord_point),
+    ],
+)
+def test_chord_points_have_chords_slopes(
+    func: RealScalarFunction,
+    deriv: RealScalarFunction,
+    chord_point: ChordPointFunction,
+) -> None:
+    lo, hi = np.array([-3.0, -1.0, 0.0, 0.1, 2.0]), np.array([-1.0, 0.0, 2.0, 0.2, 6.0])
+    points = chord_point(lo, hi)
+    assert np.all((lo <= points) & (points <= hi))
+    assert_almost_equal(deriv(points), (func(hi) - func(lo)) / (hi - lo))
+
+
+def test_chord_points_of_degenerate_intervals_are_their_endpoints() -> None:
+    assert_equal(sigmoid_chord_point(np.array([1.5]), np.array([1.5])), [1.5])
+    assert_equal(quadlu_chord_point(np.array([0.1]), np.array([0.1])), [0.1])
+
+
+def test_sigmoid_is_convex_or_concave_on_intervals_not_containing_zero() -> None:
+    assert_equal(
+        Sigmoid.convex_or_concave(
+            np.array([-2.0, -1.0, 0.0]), np.array([0.0, 1.0, 3.0])
+        ),
+        [True, False, True],
+    )
+    assert np.all(QuadLU.convex_or_concave(np.array([-1.0]), np.array([1.0])))
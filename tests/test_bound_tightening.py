@@ -0,0 +1,127 @@
+from time import sleep
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from lp_nn_robustness_verification import bound_tightening
+from lp_nn_robustness_verification.bound_tightening import tighten_bounds
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    ReLU,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    NNParams,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import assemble_lp_matrices
+from lp_nn_robustness_verification.lp_backends import HiGHSBackend
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+class SlowBackend(HiGHSBackend):
+    def solve(self) -> None:
+        sleep(2.0)
+        super().solve()
+
+
+def _deep_linear_inclusion(
+    activation: ActivationFunc, min_residual: bool = False
+) -> LinearInclusion:
+    rng = np.random.default_rng(1)
+    sizes = [6, 8, 8, 8, 3]
+    return LinearInclusion(
+        UncertainInputs(UncertainArray(np.linspace(0.0, 1.0, 6), np.full(6, 0.2))),
+        activation,
+        NNParams(
+            tuple(0.3 * rng.normal(size=n_out) for n_out in sizes[1:]),
+            tuple(
+                rng.normal(size=(n_out, n_in)) for n_in, n_out in zip(sizes, sizes[1:])
+            ),
+        ),
+        min_residual=min_residual,
+    )
+
+
+@pytest.fixture(scope="module")
+def relu_linear_inclusion() -> LinearInclusion:
+    return _deep_linear_inclusion(ReLU)
+
+
+def test_tighten_bounds_in_all() -> None:
+    assert tighten_bounds.__name__ in bound_tightening.__all__
+
+
+def test_tighten_bounds_narrows_deep_layers(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    tightened = tighten_bounds(relu_linear_inclusion)
+    assert_array_equal(tightened.z_arrays[0].lo, relu_linear_inclusion.z_arrays[0].lo)
+    for z_i, tightened_z_i in zip(
+        relu_linear_inclusion.z_arrays[1:], tightened.z_arrays[1:]
+    ):
+        assert np.all(tightened_z_i.lo >= z_i.lo)
+        assert np.all(tightened_z_i.hi <= z_i.hi)
+    assert np.sum(tightened.z_arrays[-1].hi - tightened.z_arrays[-1].lo) < 0.5 * (
+        np.sum(
+            relu_linear_inclusion.z_arrays[-1].hi
+            - relu_linear_inclusion.z_arrays[-1].lo
+        )
+    )
+
+
+@pytest.mark.parametrize("activation", [ReLU, Sigmoid])
+def test_tighten_bounds_encloses_sampled_pre_activations(
+    activation: ActivationFunc,
+) -> None:
+    linear_inclusion = _deep_linear_inclusion(activation, min_residual=True)
+    tightened = tighten_bounds(linear_inclusion)
+    x_i = np.random.default_rng(0).uniform(
+        linear_inclusion.theta_arrays[0].lo,
+        linear_inclusion.theta_arrays[0].hi,
+        (1000, 6),
+    )
+    for (biases, weight_matrix), z_i in zip(
+        linear_inclusion.nn_params, tightened.z_arrays
+    ):
+        pre_activations = x_i @ weight_matrix.T + biases
+        assert np.all(pre_activations >= z_i.lo)
+        assert np.all(pre_activations <= z_i.hi)
+        x_i = np.broadcast_to(activation.func(pre_activations), pre_activations.shape)
+
+
+def test_tighten_bounds_in_worker_processes_matches_sequential(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    for z_i, parallel_z_i in zip(
+        tighten_bounds(relu_linear_inclusion).z_arrays,
+        tighten_bounds(relu_linear_inclusion, n_workers=2).z_arrays,
+    ):
+        assert_array_equal(parallel_z_i.lo, z_i.lo)
+        assert_array_equal(parallel_z_i.hi, z_i.hi)
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_tighten_bounds_without_time_keeps_bounds(
+    relu_linear_inclusion: LinearInclusion, n_workers: int
+) -> None:
+    tightened = tighten_bounds(
+        relu_linear_inclusion, n_workers=n_workers, time_budget=0.0
+    )
+    for z_i, tightened_z_i in zip(relu_linear_inclusion.z_arrays, tightened.z_arrays):
+        assert_array_equal(tightened_z_i.lo, z_i.lo)
+        assert_array_equal(tightened_z_i.hi, z_i.hi)
+
+
+def test_bound_pre_activations_keeps_bounds_of_solves_running_at_deadline(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    lo, hi = bound_tightening._bound_pre_activations(
+        assemble_lp_matrices(relu_linear_inclusion), 2, 1.0, SlowBackend
+    )
+    assert np.isfinite(lo).any()
+    assert not np.isfinite(hi).any()
@@ -0,0 +1,143 @@
+from typing import Callable
+
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_equal
+
+from lp_nn_robustness_verification import certificates
+from lp_nn_robustness_verification.certificates import (
+    certified_margins,
+    check_certificate,
+)
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    ReLU,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    DualCertificate,
+    NNParams,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import (
+    assemble_lp_matrices,
+    RobustVerifier,
+)
+from lp_nn_robustness_verification.lp_backends import (
+    HiGHSBackend,
+    LPBackend,
+    SCIPBackend,
+)
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+def _linear_inclusion(
+    uncertainty: float, activation: ActivationFunc = Sigmoid
+) -> LinearInclusion:
+    rng = np.random.default_rng(3)
+    sizes = [6, 8, 8, 3]
+    return LinearInclusion(
+        UncertainInputs(
+            UncertainArray(np.linspace(0.0, 1.0, 6), np.full(6, uncertainty))
+        ),
+        activation,
+        NNParams(
+            tuple(0.3 * rng.normal(size=n_out) for n_out in sizes[1:]),
+            tuple(
+                rng.normal(size=(n_out, n_in)) for n_in, n_out in zip(sizes, sizes[1:])
+            ),
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def robust_certificate() -> DualCertificate:
+    return RobustVerifier(_linear_inclusion(0.02), HiGHSBackend()).dual_certificate()
+
+
+def test_check_certificate_in_all() -> None:
+    assert check_certificate.__name__ in certificates.__all__
+
+
+@pytest.mark.parametrize("activation", [Sigmoid, ReLU])
+@pytest.mark.parametrize(
+    "backend, reduce",
+    [
+        (HiGHSBackend, False),
+        (HiGHSBackend, True),
+        (lambda: SCIPBackend(presolve=False), False),
+    ],
+)
+def test_certified_margins_reproduce_solved_margins(
+    activation: ActivationFunc, backend: Callable[[], LPBackend], reduce: bool
+) -> None:
+    linear_inclusion = _linear_inclusion(0.02, activation)
+    optimization = RobustVerifier(linear_inclusion, backend(), reduce=reduce)
+    if isinstance(optimization.backend, SCIPBackend):
+        optimization.model.hideOutput()
+    certificate = optimization.dual_certificate()
+    assert_almost_equal(
+        certified_margins(linear_inclusion, certificate),
+        optimization.solve_all_margins(stop_early=False),
+        decimal=6,
+    )
+
+
+def test_check_certificate_proves_robustness(
+    robust_certificate: DualCertificate,
+) -> None:
+    assert check_certificate(_linear_inclusion(0.02), robust_certificate)
+
+
+def test_check_certificate_proves_robustness_of_shrunk_input_region(
+    robust_certificate: DualCertificate,
+) -> None:
+    linear_inclusion = _linear_inclusion(0.01)
+    assert check_certificate(linear_inclusion, robust_certificate)
+    assert np.all(
+        certified_margins(linear_inclusion, robust_certificate)[
+            robust_certificate.competitors
+        ]
+        >= certified_margins(_linear_inclusion(0.02), robust_certificate)[
+            robust_certificate.competitors
+        ]
+    )
+
+
+def test_check_certificate_rejects_grown_input_region(
+    robust_certificate: DualCertificate,
+) -> None:
+    assert not check_certificate(_linear_inclusion(0.1), robust_certificate)
+
+
+def test_certified_margins_without_duals_are_valid() -> None:
+    linear_inclusion = _linear_inclusion(0.02)
+    margins = certified_margins(
+        linear_inclusion,
+        DualCertificate(
+            2,
+            np.array([0, 1]),
+            np.zeros((2, assemble_lp_matrices(linear_inclusion).shape[0])),
+        ),
+    )
+    assert np.all(margins[:2] <= np.array([0.19142306, 0.53363107]))
+    assert np.all(np.isfinite(margins[:2]))
+
+
+def test_certified_margins_of_mismatched_certificate_are_infinite() -> None:
+    assert_equal(
+        certified_margins(
+            _linear_inclusion(0.02),
+            DualCertificate(2, np.array([0, 1]), np.zeros((2, 3))),
+        ),
+        [-np.inf, -np.inf, np.nan],
+    )
+
+
+def test_dual_certificate_requires_duals() -> None:
+    optimization = RobustVerifier(_linear_inclusion(0.02))
+    with pytest.raises(AssertionError):
+        optimization.dual_certificate()
@@ -0,0 +1,172 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from hypothesis import given, strategies as hst
+from hypothesis.extra import numpy as hnp
+from interval import interval
+from numpy.testing import assert_equal
+from scipy.sparse import coo_matrix, csr_matrix  # type: ignore[import]
+
+from lp_nn_robustness_verification import data_types
+from lp_nn_robustness_verification.data_types import (
+    DualCertificate,
+    IntervalArray,
+    NNParams,
+    RealVector,
+    VerificationResult,
+)
+
+
+@pytest.fixture
+def interval_array() -> IntervalArray:
+    return IntervalArray(np.array([-1.0, 0.5, 2.0]), np.array([1.0, 1.5, 4.0]))
+
+
+def test_interval_array_in_all() -> None:
+    assert IntervalArray.__name__ in data_types.__all__
+
+
+def test_interval_array_stores_contiguous_float64_bounds(
+    interval_array: IntervalArray,
+) -> None:
+    for bounds in (interval_array.lo, interval_array.hi):
+        assert bounds.dtype == np.float64
+        assert bounds.flags["C_CONTIGUOUS"]
+
+
+def test_interval_array_is_sound_by_default(interval_array: IntervalArray) -> None:
+    assert interval_array.sound
+
+
+def test_interval_array_midpoint_is_correct(interval_array: IntervalArray) -> None:
+    assert_equal(interval_array.midpoint, np.array([0.0, 1.0, 3.0]))
+
+
+def test_interval_array_width_is_correct(interval_array: IntervalArray) -> None:
+    assert_equal(interval_array.width, np.array([2.0, 1.0, 2.0]))
+
+
+def test_interval_array_add_is_correct(interval_array: IntervalArray) -> None:
+    assert (interval_array + interval_array) == IntervalArray(
+        np.array([-2.0, 1.0, 4.0]), np.array([2.0, 3.0, 8.0])
+    )
+
+
+def test_interval_array_scale_is_correct(interval_array: IntervalArray) -> None:
+    assert interval_array.scale(np.array([-1.0, 2.0, 0.5])) == IntervalArray(
+        np.array([-1.0, 1.0, 1.0]), np.array([1.0, 3.0, 2.0])
+    )
+
+
+def test_interval_array_intersection_is_correct(
+    interval_array: IntervalArray,
+) -> None:
+    assert interval_array.intersection(
+        IntervalArray(np.array([0.0, 0.0, 3.0]), np.array([2.0, 1.0, 5.0]))
+    ) == IntervalArray(np.array([0.0, 0.5, 3.0]), np.array([1.0, 1.0, 4.0]))
+
+
+def test_interval_array_matmul_is_correct(interval_array: IntervalArray) -> None:
+    assert np.array([[1.0, -1.0, 0.0], [0.0, 2.0, 1.0]]) @ interval_array == (
+        IntervalArray(np.array([-2.5, 3.0]), np.array([0.5, 7.0]))
+    )
+
+
+def test_interval_array_to_intervals_is_correct(
+    interval_array: IntervalArray,
+) -> None:
+    assert interval_array.to_intervals() == (
+        interval([-1.0, 1.0]),
+        interval([0.5, 1.5]),
+        interval([2.0, 4.0]),
+    )
+
+
+def test_interval_array_from_intervals_inverts_to_intervals(
+    interval_array: IntervalArray,
+) -> None:
+    assert IntervalArray.from_intervals(interval_array.to_intervals()) == (
+        interval_array
+    )
+
+
+def test_sound_interval_array_rounds_outwards() -> None:
+    inexact_sum = IntervalArray(np.array([0.1]), np.array([0.1])) + 0.2
+    assert inexact_sum.lo[0] < inexact_sum.hi[0]
+
+
+def test_fast_interval_array_rounds_to_nearest() -> None:
+    inexact_sum = IntervalArray(np.array([0.1]), np.array([0.1]), sound=False) + 0.2
+    assert_equal(inexact_sum.lo, inexact_sum.hi)
+
+
+@given(
+    hnp.arrays(np.float64, 5, elements=hst.floats(-1e3, 1e3)),
+    hnp.arrays(np.float64, 5, elements=hst.floats(0.0, 1e3)),
+    hnp.arrays(np.float64, (3, 5), elements=hst.floats(-1e3, 1e3)),
+)
+def test_sound_interval_array_matmul_encloses_scalar_interval_arithmetic(
+    centers: RealVector, radii: RealVector, matrix: RealVector
+) -> None:
+    interval_array = IntervalArray.from_center_and_radius(centers, radii)
+    image = matrix @ interval_array
+    for row, image_k in zip(matrix, image.to_intervals()):
+        scalar_image_k = interval(0.0)
+        for weight, interval_j in zip(row, interval_array.to_intervals()):
+            scalar_image_k += float(weight) * interval_j
+        assert image_k[0].inf <= scalar_image_k[0].sup
+        assert scalar_image_k[0].inf <= image_k[0].sup
+        assert image_k[0].inf <= (row @ centers) <= image_k[0].sup
+
+
+def test_nn_params_stores_sparse_weights_in_csr_format() -> None:
+    nn_params = NNParams((np.zeros(2),), (coo_matrix(np.array([[1.0, 0.0]] * 2)),))
+    assert isinstance(nn_params.weights[0], csr_matrix)
+
+
+def test_nn_params_keeps_dense_weights() -> None:
+    assert isinstance(NNParams().weights[0], np.ndarray)
+
+
+def test_sparse_matrix_product_with_interval_array_matches_dense(
+    interval_array: IntervalArray,
+) -> None:
+    matrix = np.array([[1.0, 0.0, -2.0], [0.0, 0.0, 0.5]])
+    assert csr_matrix(matrix) @ interval_array == matrix @ interval_array
+
+
+def test_verification_result_survives_npz_round_trip(tmp_path: Path) -> None:
+    result = VerificationResult(
+        label=0,
+        competitor=1,
+        margins=np.array([np.nan, -0.5]),
+        neurons=(np.arange(2), np.array([1])),
+        x_values=(np.array([1.0, 2.0]), np.array([0.5])),
+        z_values=(np.array([0.25]),),
+        residual_lo=(np.array([-0.1]),),
+        residual_hi=(np.array([0.1]),),
+        half_space_duals=(np.array([np.nan]),),
+        statistics={"lp_iterations": 3.0, "total_time": 0.01},
+    )
+    result.save(tmp_path / "result.npz")
+    loaded_result = VerificationResult.load(tmp_path / "result.npz")
+    for name in ("label", "competitor", "margins", "statistics"):
+        assert_equal(getattr(loaded_result, name), getattr(result, name))
+    for name in VerificationResult._LAYERED_FIELDS:
+        assert_equal(len(getattr(loaded_result, name)), len(getattr(result, name)))
+        for loaded_array, array in zip(
+            getattr(loaded_result, name), getattr(result, name)
+        ):
+            assert_equal(loaded_array, array)
+
+
+def test_dual_certificate_survives_npz_round_trip(tmp_path: Path) -> None:
+    certificate = DualCertificate(
+        2, np.array([0, 1]), np.array([[0.5, -1.0, 0.0], [0.0, 2.0, -0.25]])
+    )
+    certificate.save(tmp_path / "certificate.npz")
+    loaded_certificate = DualCertificate.load(tmp_path / "certificate.npz")
+    assert_equal(loaded_certificate.label, 2)
+    assert_equal(loaded_certificate.competitors, certificate.competitors)
+    assert_equal(loaded_certificate.row_duals, certificate.row_duals)
@@ -0,0 +1,248 @@
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+from scipy.sparse import csr_matrix  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Identity,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import NNParams, UncertainArray
+from lp_nn_robustness_verification.inclusion_cache import InclusionCache
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+@pytest.fixture
+def uncertain_inputs() -> UncertainInputs:
+    return UncertainInputs(UncertainArray(np.array([1.0, 0.5]), np.array([0.2, 0.1])))
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> InclusionCache:
+    return InclusionCache(tmp_path)
+
+
+def test_inclusion_cache_creates_directory(tmp_path: Path) -> None:
+    InclusionCache(tmp_path / "cache")
+    assert (tmp_path / "cache").is_dir()
+
+
+def test_inclusion_cache_key_is_deterministic(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert_equal(
+        cache.key(uncertain_inputs, Sigmoid, NNParams(), True),
+        cache.key(uncertain_inputs, Sigmoid, NNParams(), True),
+    )
+
+
+def test_inclusion_cache_key_depends_on_activation(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs, Identity, NNParams(), True
+    )
+
+
+def test_inclusion_cache_key_depends_on_convexity(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs, Sigmoid._replace(convexity=()), NNParams(), True
+    )
+
+
+def test_inclusion_cache_key_depends_on_fused_kernel(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Identity, NNParams(), True) != cache.key(
+        uncertain_inputs, Identity._replace(fused=None), NNParams(), True
+    )
+
+
+def test_inclusion_cache_key_depends_on_chord_point(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs, Sigmoid._replace(chord_point=None), NNParams(), True
+    )
+
+
+def test_inclusion_cache_key_accepts_partial_functions(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    halved = Identity._replace(func=partial(np.multiply, 0.5))
+    doubled = Identity._replace(func=partial(np.multiply, 2.0))
+    assert cache.key(uncertain_inputs, halved, NNParams(), True) != cache.key(
+        uncertain_inputs, doubled, NNParams(), True
+    )
+
+
+def test_inclusion_cache_key_depends_on_rounding(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs, Sigmoid, NNParams(), False
+    )
+
+
+def test_inclusion_cache_key_depends_on_symbolic_propagation(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs, Sigmoid, NNParams(), True, symbolic=True
+    )
+
+
+def test_inclusion_cache_key_depends_on_expansion_points(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs, Sigmoid, NNParams(), True, min_residual=True
+    )
+
+
+def test_inclusion_cache_key_depends_on_correlation(cache: InclusionCache) -> None:
+    values = np.array([1.0, 0.5])
+    assert cache.key(
+        UncertainInputs(UncertainArray(values, np.array([[0.04, 0.0], [0.0, 0.01]]))),
+        Sigmoid,
+        NNParams(),
+        True,
+        symbolic=True,
+    ) != cache.key(
+        UncertainInputs(UncertainArray(values, np.array([[0.04, 0.01], [0.01, 0.01]]))),
+        Sigmoid,
+        NNParams(),
+        True,
+        symbolic=True,
+    )
+
+
+def test_inclusion_cache_key_depends_on_weights(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        uncertain_inputs,
+        Sigmoid,
+        NNParams((np.zeros(2),), (2 * np.eye(2),)),
+        True,
+    )
+
+
+def test_inclusion_cache_key_depends_on_inputs(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(uncertain_inputs, Sigmoid, NNParams(), True) != cache.key(
+        UncertainInputs(UncertainArray(np.array([1.0, 0.5]), np.array([0.2, 0.2]))),
+        Sigmoid,
+        NNParams(),
+        True,
+    )
+
+
+def test_inclusion_cache_load_misses_unknown_key(cache: InclusionCache) -> None:
+    assert cache.load("unknown") is None
+
+
+def test_linear_inclusion_stores_bounds_in_cache(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    assert cache.load(cache.key(uncertain_inputs, Sigmoid, NNParams(), True))
+
+
+def test_linear_inclusion_loads_equal_bounds_from_cache(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    computed = LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    loaded = LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    assert_equal(loaded.z_arrays, computed.z_arrays)
+    assert_equal(loaded.theta_arrays, computed.theta_arrays)
+    assert_equal(loaded.xi_is, computed.xi_is)
+    assert_equal(loaded.r_arrays, computed.r_arrays)
+
+
+def test_linear_inclusion_loads_bounds_memory_mapped(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    loaded = LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    assert isinstance(loaded.r_arrays[0].lo.base, np.memmap)
+    assert not loaded.r_arrays[0].lo.flags.writeable
+
+
+def test_linear_inclusion_loads_rounding_mode_from_cache(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), sound=False, cache=cache)
+    loaded = LinearInclusion(
+        uncertain_inputs, Sigmoid, NNParams(), sound=False, cache=cache
+    )
+    assert not loaded.theta_arrays[-1].sound
+
+
+def test_robust_verifier_solves_cached_linear_inclusion(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    optimization = RobustVerifier(
+        LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    )
+    optimization.model.hideOutput()
+    optimization.solve()
+    assert_equal(round(optimization.objective_value, 10), 0.044318174900)
+
+
+def test_inclusion_cache_evicts_least_recently_used_entries(
+    uncertain_inputs: UncertainInputs, tmp_path: Path
+) -> None:
+    cache = InclusionCache(tmp_path, max_bytes=1)
+    LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    LinearInclusion(uncertain_inputs, Identity, NNParams(), cache=cache)
+    assert_equal(len(list(tmp_path.iterdir())), 0)
+
+
+def test_inclusion_cache_keeps_entries_within_size_cap(
+    uncertain_inputs: UncertainInputs, tmp_path: Path
+) -> None:
+    cache = InclusionCache(tmp_path)
+    LinearInclusion(uncertain_inputs, Sigmoid, NNParams(), cache=cache)
+    LinearInclusion(uncertain_inputs, Identity, NNParams(), cache=cache)
+    assert_equal(len(list(tmp_path.iterdir())), 2)
+
+
+def test_inclusion_cache_key_notices_other_network_instances(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    first_key = cache.key(uncertain_inputs, Sigmoid, NNParams(), True)
+    assert first_key != cache.key(
+        uncertain_inputs,
+        Sigmoid,
+        NNParams((np.ones(2),), (np.eye(2),)),
+        True,
+    )
+    assert_equal(cache.key(uncertain_inputs, Sigmoid, NNParams(), True), first_key)
+
+
+def test_inclusion_cache_key_depends_on_sparsity_pattern(
+    uncertain_inputs: UncertainInputs, cache: InclusionCache
+) -> None:
+    assert cache.key(
+        uncertain_inputs,
+        Sigmoid,
+        NNParams((np.zeros(2),), (csr_matrix(np.eye(2)),)),
+        True,
+    ) != cache.key(
+        uncertain_inputs,
+        Sigmoid,
+        NNParams((np.zeros(2),), (csr_matrix(np.eye(2)[::-1]),)),
+        True,
+    )
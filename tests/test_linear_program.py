@@ -1,16 +1,22 @@
-from typing import Callable, NamedTuple
+import sys
+from multiprocessing import active_children
+from time import perf_counter, sleep
+from typing import Any, Callable, NamedTuple
 
 import numpy as np
 import pytest
 from _pytest.capture import CaptureFixture
 from numpy.ma.testutils import assert_almost_equal
 from numpy.testing import assert_equal
+from scipy.sparse import csr_matrix  # type: ignore[import]
 from zema_emc_annotated.data_types import SampleSize  # type: ignore[import]
 from zema_emc_annotated.dataset import ZeMASamples  # type: ignore[import]
 
+from lp_nn_robustness_verification import linear_program
 from lp_nn_robustness_verification.data_acquisition.activation_functions import (
     Identity,
     QuadLU,
+    ReLU,
     Sigmoid,
 )
 from lp_nn_robustness_verification.data_acquisition.generate_nn_params import (
@@ -20,9 +26,28 @@ from lp_nn_robustness_verification.data_acquisition.generate_nn_params import (
 from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
     UncertainInputs,
 )
-from lp_nn_robustness_verification.data_types import NNParams, UncertainArray
-from lp_nn_robustness_verification.linear_program import RobustVerifier
-from lp_nn_robustness_verification.pre_processing import LinearInclusion
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    IntervalArray,
+    LPMatrices,
+    NNParams,
+    RealVector,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import (
+    assemble_lp_matrices,
+    RobustVerifier,
+)
+from lp_nn_robustness_verification.lp_backends import (
+    HiGHSBackend,
+    LPBackend,
+    SCIPBackend,
+    SolveLimits,
+)
+from lp_nn_robustness_verification.pre_processing import (
+    BatchedLinearInclusion,
+    LinearInclusion,
+)
 
 
 class ScalerAndLayers(NamedTuple):
@@ -47,6 +72,46 @@ class IndexAndSeed(NamedTuple):
     """the NumPy seed to be used when creating the weight and bias matrices"""
 
 
+class OffsetBackend(HiGHSBackend):
+    """HiGHS with all objective values shifted to tell configurations apart"""
+
+    def __init__(self, offset: float = 0.0):
+        super().__init__()
+        self.offset = offset
+
+    @property
+    def configuration(self) -> dict[str, Any]:
+        return {"offset": self.offset}
+
+    def get_objective_value(self) -> float:
+        return super().get_objective_value() + self.offset
+
+
+class SlowBackend(HiGHSBackend):
+    """HiGHS, which takes a minute for one output neuron's margin and a second
+    for all others, such that the slow solve runs, when the others finish"""
+
+    def __init__(self, slow_competitor: int = 2):
+        super().__init__()
+        self.slow_competitor = slow_competitor
+
+    @property
+    def configuration(self) -> dict[str, Any]:
+        return {"slow_competitor": self.slow_competitor}
+
+    def build(self, lp_matrices: LPMatrices) -> None:
+        self.slow_column = lp_matrices.x_is[-1][self.slow_competitor]
+        super().build(lp_matrices)
+
+    def set_objective(self, objective: RealVector) -> None:
+        self.is_slow = objective[self.slow_column] < 0
+        super().set_objective(objective)
+
+    def solve(self) -> None:
+        sleep(60.0 if self.is_slow else 1.0)
+        super().solve()
+
+
 @pytest.fixture(scope="session")
 def custom_linear_inclusion() -> LinearInclusion:
     return LinearInclusion(
@@ -62,9 +127,9 @@ def custom_linear_inclusion() -> LinearInclusion:
 
 
 @pytest.fixture(scope="session")
-def compute_linear_inclusion_for_instance() -> Callable[
-    [int, int, int, int], LinearInclusion
-]:
+def compute_linear_inclusion_for_instance() -> (
+    Callable[[int, int, int, int], LinearInclusion]
+):
     def compute_linear_inclusion(
         size_scaler: int, depth: int, sample_idx: int, seed: int
     ) -> LinearInclusion:
@@ -222,3 +287,577 @@ def test_robust_verifier_solve_solves_known_to_work_instances(
             "SCIP Status        : problem is solved [optimal solution found]"
             in capfd.readouterr().out
         )
+
+
+def test_robust_verifier_solves_linear_inclusion_of_batch() -> None:
+    batched_linear_inclusion = BatchedLinearInclusion(
+        UncertainArray(
+            np.array([[1.0, 0.5], [1.5, 0.5]]), np.array([[0.2, 0.1], [0.5, 0.6]])
+        ),
+        Identity,
+        NNParams(),
+    )
+    objective_values = []
+    for linear_inclusion in batched_linear_inclusion:
+        optimization = RobustVerifier(linear_inclusion)
+        optimization.model.hideOutput()
+        optimization.solve()
+        objective_values.append(optimization.model.getObjVal())
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        np.array(objective_values), np.array([0.2, -0.1])
+    )
+
+
+def test_assemble_lp_matrices_has_one_column_per_variable(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(custom_linear_inclusion)
+    assert_equal(lp_matrices.shape, (4, 2 + 2 + 2))
+    assert_equal(len(lp_matrices.lb), lp_matrices.shape[1])
+    assert_equal(len(lp_matrices.lhs), lp_matrices.shape[0])
+
+
+def test_assemble_lp_matrices_contains_only_non_zero_weights(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    assert_equal(assemble_lp_matrices(custom_linear_inclusion).constraint_matrix.nnz, 8)
+
+
+def test_assemble_lp_matrices_affine_rows_are_equalities(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(custom_linear_inclusion)
+    for affine_rows in lp_matrices.affine_rows:
+        assert_equal(lp_matrices.lhs[affine_rows], lp_matrices.rhs[affine_rows])
+
+
+def test_assemble_lp_matrices_bounds_x_is_by_thetas(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(custom_linear_inclusion)
+    for x_i, theta_i, neurons_i in zip(
+        lp_matrices.x_is, custom_linear_inclusion.theta_arrays, lp_matrices.neurons
+    ):
+        assert_equal(lp_matrices.lb[x_i], theta_i.lo[neurons_i])
+        assert_equal(lp_matrices.ub[x_i], theta_i.hi[neurons_i])
+
+
+def test_assemble_lp_matrices_leaves_out_unused_inputs(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    assert_equal(
+        assemble_lp_matrices(custom_linear_inclusion).neurons[0], np.array([0, 1])
+    )
+
+
+def test_assemble_lp_matrices_leaves_out_neurons_without_path_to_outputs() -> None:
+    lp_matrices = assemble_lp_matrices(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array([1.0, 2.0]), np.full(2, 0.1))),
+            Sigmoid,
+            NNParams(
+                (np.zeros(3), np.zeros(2)),
+                (np.ones((3, 2)), np.array([[1.0, 0.0, 1.0], [0.0, 0.0, -1.0]])),
+            ),
+        )
+    )
+    assert_equal(lp_matrices.neurons[1], np.array([0, 2]))
+    assert_equal(lp_matrices.shape, (2 * 2 + 2 * 2, 2 + 2 + 2 + 2 + 2))
+
+
+@pytest.fixture
+def constant_neuron_linear_inclusion() -> LinearInclusion:
+    return LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([1.0, 2.0]), np.full(2, 0.1))),
+        Sigmoid,
+        NNParams(
+            (np.array([0.0, 0.5]), np.zeros(2)),
+            (np.array([[1.0, -1.0], [0.0, 0.0]]), np.array([[1.0, 1.0], [1.0, -1.0]])),
+        ),
+    )
+
+
+def test_assemble_lp_matrices_leaves_out_neurons_without_inputs(
+    constant_neuron_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(constant_neuron_linear_inclusion)
+    assert_equal(lp_matrices.neurons[1], np.array([0]))
+    assert_equal(lp_matrices.shape, (1 * 2 + 2 * 2, 2 + 1 + 2 + 1 + 2))
+
+
+def test_assemble_lp_matrices_adds_neurons_without_inputs_to_biases(
+    constant_neuron_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(constant_neuron_linear_inclusion)
+    constant = constant_neuron_linear_inclusion.theta_arrays[1].lo[1]
+    assert_equal(lp_matrices.lhs[lp_matrices.affine_rows[1]], [constant, -constant])
+
+
+def test_robust_verifier_solves_neurons_without_inputs_unreduced(
+    constant_neuron_linear_inclusion: LinearInclusion,
+) -> None:
+    unreduced, reduced = (
+        RobustVerifier(constant_neuron_linear_inclusion, HiGHSBackend(), reduce=reduce)
+        for reduce in (False, True)
+    )
+    assert reduced.reduction is not None
+    assert unreduced.lp_matrices.shape[0] > reduced.reduction.lp_matrices.shape[0]
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        unreduced.solve_all_margins(stop_early=False),
+        reduced.solve_all_margins(stop_early=False),
+    )
+
+
+def test_assemble_lp_matrices_is_identical_for_sparse_weights() -> None:
+    weights = (np.array([[1.0, 0.0, -2.0], [0.0, 0.5, 0.0]]), np.eye(2)[::-1])
+    uncertain_inputs = UncertainInputs(
+        UncertainArray(np.array([0.5, 1.0, -0.5]), np.full(3, 0.2))
+    )
+    dense_lp_matrices, sparse_lp_matrices = (
+        assemble_lp_matrices(
+            LinearInclusion(
+                uncertain_inputs,
+                Sigmoid,
+                NNParams((np.zeros(2), np.zeros(2)), weight_matrices),
+            )
+        )
+        for weight_matrices in (weights, tuple(map(csr_matrix, weights)))
+    )
+    assert_equal(
+        sparse_lp_matrices.constraint_matrix.toarray(),
+        dense_lp_matrices.constraint_matrix.toarray(),
+    )
+    assert_equal(sparse_lp_matrices.lhs, dense_lp_matrices.lhs)
+    assert_equal(sparse_lp_matrices.lb, dense_lp_matrices.lb)
+
+
+def test_robust_verifier_stores_variables_in_index_arrays(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(custom_linear_inclusion)
+    assert_equal(len(optimization.variables), 6)
+    assert_equal(optimization.x_is[0], np.arange(2))
+
+
+def test_robust_verifier_names_variables_on_demand(
+    custom_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(custom_linear_inclusion, names=True)
+    assert_equal(
+        [variable.name for variable in optimization.variables[optimization.x_is[1]]],
+        ["x_0^(1)", "x_1^(1)"],
+    )
+
+
+def test_robust_verifier_names_variables_by_neuron_indices() -> None:
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array([6.0, 3.0, 0.0]), np.ones(3))),
+            Identity,
+            NNParams((np.zeros(2),), (np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]),)),
+        ),
+        names=True,
+    )
+    assert_equal(
+        [variable.name for variable in optimization.variables[optimization.x_is[0]]],
+        ["x_0^(0)", "x_2^(0)"],
+    )
+
+
+@pytest.fixture
+def three_class_linear_inclusion() -> LinearInclusion:
+    return LinearInclusion(
+        uncertain_inputs=UncertainInputs(
+            UncertainArray(np.array([3.0, 2.9, 0.0]), np.array([0.5, 0.5, 0.5]))
+        ),
+        activation=Identity,
+        nn_params=NNParams((np.zeros(3),), (np.eye(3),)),
+    )
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [SCIPBackend(), SCIPBackend(reoptimize=True), HiGHSBackend()],
+)
+def test_robust_verifier_solves_all_margins(
+    three_class_linear_inclusion: LinearInclusion, backend: LPBackend
+) -> None:
+    if isinstance(backend, SCIPBackend):
+        backend.model.hideOutput()
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        RobustVerifier(three_class_linear_inclusion, backend).solve_all_margins(
+            stop_early=False
+        ),
+        np.array([np.nan, -0.9, 2.0]),
+    )
+
+
+def test_robust_verifier_statistics_sum_up_all_solves(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.model.hideOutput()
+    assert list(optimization.statistics) == ["build_time"]
+    optimization.solve_all_margins(stop_early=False)
+    single_solve_iterations = optimization.backend.get_statistics()["lp_iterations"]
+    assert {
+        "build_time",
+        "solving_time",
+        "presolving_time",
+        "lp_iterations",
+        "n_rows",
+        "n_columns",
+    } <= optimization.statistics.keys()
+    assert optimization.statistics["lp_iterations"] >= single_solve_iterations
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows reports no peak memory")
+def test_robust_verifier_statistics_record_peak_memory_for_all_backends(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    for backend in (SCIPBackend(), HiGHSBackend()):
+        optimization = RobustVerifier(three_class_linear_inclusion, backend)
+        if isinstance(backend, SCIPBackend):
+            optimization.model.hideOutput()
+        optimization.solve_all_margins(stop_early=False)
+        assert optimization.statistics["peak_memory"] > 2**20
+
+
+def test_robust_verifier_solve_all_margins_stops_early(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.model.hideOutput()
+    assert_equal(np.isnan(optimization.solve_all_margins()), [True, False, True])
+
+
+def test_robust_verifier_solve_all_margins_reuses_one_model(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.model.hideOutput()
+    model = optimization.model
+    optimization.solve_all_margins(stop_early=False)
+    assert optimization.model is model
+
+
+def test_robust_verifier_solve_keeps_last_competitor_margin(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.model.hideOutput()
+    optimization.solve()
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.objective_value, 2.0
+    )
+
+
+def test_robust_verifier_solve_returns_bounds_of_optimal_solution(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion, HiGHSBackend())
+    result = optimization.solve()
+    assert_equal(result.status, "optimal")
+    assert_almost_equal(result.primal_value, 2.0)  # type: ignore[no-untyped-call]
+    assert_almost_equal(result.dual_bound, 2.0)  # type: ignore[no-untyped-call]
+
+
+def test_robust_verifier_solve_all_margins_falls_back_to_dual_bounds(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(
+        three_class_linear_inclusion, HiGHSBackend(), limits=SolveLimits(time=0.0)
+    )
+    assert_equal(optimization.solve().status, "timelimit")
+    assert_equal(
+        optimization.solve_all_margins(stop_early=False), [np.nan, -np.inf, -np.inf]
+    )
+
+
+def test_robust_verifier_verification_result_splits_solution_into_layers(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    result = RobustVerifier(
+        three_class_linear_inclusion, HiGHSBackend()
+    ).verification_result(stop_early=False)
+    assert_equal(result.competitor, 1)
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        result.x_values[-1][result.label] - result.x_values[-1][1], -0.9
+    )
+    assert_equal([len(z_i) for z_i in result.z_values], [3])
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        result.residual_lo[0], three_class_linear_inclusion.r_arrays[0].lo
+    )
+    assert not np.any(np.isnan(result.half_space_duals[0]))
+    assert "total_time" in result.statistics
+
+
+def test_robust_verifier_verification_result_resolves_smallest_margin(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion, HiGHSBackend())
+    result = optimization.verification_result(stop_early=False)
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.objective_value, result.margins[result.competitor]
+    )
+
+
+def test_robust_verifier_verification_result_without_duals(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.model.hideOutput()
+    result = optimization.verification_result()
+    assert np.all(np.isnan(result.half_space_duals[0]))
+    assert {"solving_time", "lp_iterations", "nodes"} <= result.statistics.keys()
+
+
+def test_robust_verifier_verification_result_restores_duals_of_reduction() -> None:
+    linear_inclusion = LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([1.0, 0.5]), np.array([0.2, 0.1]))),
+        Sigmoid,
+    )
+    results = [
+        RobustVerifier(
+            linear_inclusion, HiGHSBackend(), reduce=reduce
+        ).verification_result()
+        for reduce in (False, True)
+    ]
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        results[1].half_space_duals[0], results[0].half_space_duals[0]
+    )
+
+
+def test_robust_verifier_solves_all_margins_in_worker_processes(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        RobustVerifier(three_class_linear_inclusion, HiGHSBackend()).solve_all_margins(
+            stop_early=False, n_workers=2
+        ),
+        np.array([np.nan, -0.9, 2.0]),
+    )
+
+
+def test_robust_verifier_solve_all_margins_in_worker_processes_stops_early(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    margins = RobustVerifier(
+        three_class_linear_inclusion, HiGHSBackend()
+    ).solve_all_margins(n_workers=2)
+    assert np.nanmin(margins) < 0
+    assert np.isnan(margins[0])
+
+
+def test_robust_verifier_solve_all_margins_terminates_running_solves(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    start = perf_counter()
+    margins = RobustVerifier(
+        three_class_linear_inclusion, SlowBackend()
+    ).solve_all_margins(n_workers=2)
+    assert perf_counter() - start < 30.0
+    assert not active_children()
+    assert_equal(np.isnan(margins), [True, False, True])
+
+
+def test_robust_verifier_solve_all_margins_configures_workers_alike(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion, OffsetBackend(10.0))
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.solve_all_margins(stop_early=False, n_workers=2),
+        optimization.solve_all_margins(stop_early=False),
+    )
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.solve_all_margins(stop_early=False, n_workers=2),
+        np.array([np.nan, 9.1, 12.0]),
+    )
+
+
+@pytest.mark.parametrize(
+    "activation, values, uncertainties, new_values, new_uncertainties, value",
+    [
+        (Sigmoid, [-1.2, 0.2], [0.5, 1.0], [1.0, 0.5], [0.2, 0.1], 0.04431817490181711),
+        (QuadLU, [2.0, 1.5], [0.2, 0.1], [0.0, 0.25], [0.1, 0.25], -0.06),
+        (QuadLU, [0.0, 0.25], [0.1, 0.25], [2.0, 1.5], [0.2, 0.1], 0.2),
+    ],
+)
+@pytest.mark.parametrize("backend", [SCIPBackend(), HiGHSBackend()])
+def test_robust_verifier_update_inputs_solves_to_known_value(
+    activation: ActivationFunc,
+    values: list[float],
+    uncertainties: list[float],
+    new_values: list[float],
+    new_uncertainties: list[float],
+    value: float,
+    backend: LPBackend,
+) -> None:
+    if isinstance(backend, SCIPBackend):
+        backend = SCIPBackend()
+        backend.model.hideOutput()
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array(values), np.array(uncertainties))),
+            activation,
+            NNParams(),
+        ),
+        backend,
+    )
+    optimization.solve()
+    optimization.update_inputs(
+        UncertainInputs(
+            UncertainArray(np.array(new_values), np.array(new_uncertainties))
+        )
+    )
+    optimization.solve()
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.objective_value, value
+    )
+
+
+def test_robust_verifier_update_inputs_keeps_model(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.model.hideOutput()
+    model, variables = optimization.model, optimization.variables
+    optimization.solve()
+    optimization.update_inputs(IntervalArray(np.zeros(3), np.ones(3)))
+    assert optimization.model is model
+    assert all(
+        new is old for new, old in zip(optimization.variables.tolist(), variables)
+    )
+
+
+def test_robust_verifier_update_inputs_moves_bounds(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(three_class_linear_inclusion)
+    optimization.update_inputs(IntervalArray(np.zeros(3), np.ones(3)))
+    assert_equal(
+        [variable.getLbOriginal() for variable in optimization.variables[:3]],
+        np.zeros(3),
+    )
+
+
+def test_robust_verifier_update_linear_inclusion_refuses_reoptimization(
+    three_class_linear_inclusion: LinearInclusion,
+) -> None:
+    backend = SCIPBackend(reoptimize=True)
+    backend.model.hideOutput()
+    optimization = RobustVerifier(three_class_linear_inclusion, backend)
+    optimization.solve()
+    with pytest.raises(AssertionError):
+        optimization.update_linear_inclusion(three_class_linear_inclusion)
+
+
+def test_robust_verifier_update_linear_inclusion_iterates_batch() -> None:
+    batched_linear_inclusion = BatchedLinearInclusion(
+        UncertainArray(
+            np.array([[2.0, 1.5], [0.0, 0.25]]), np.array([[0.2, 0.1], [0.1, 0.25]])
+        ),
+        QuadLU,
+        NNParams(),
+    )
+    optimization = RobustVerifier(batched_linear_inclusion[0])
+    optimization.model.hideOutput()
+    objective_values = []
+    for linear_inclusion in batched_linear_inclusion:
+        optimization.update_linear_inclusion(linear_inclusion)
+        optimization.solve()
+        objective_values.append(optimization.objective_value)
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        np.array(objective_values), np.array([0.2, -0.06])
+    )
+
+
+def test_robust_verifier_update_linear_inclusion_patches_problem(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    batched_linear_inclusion = BatchedLinearInclusion(
+        UncertainArray(
+            np.array([[2.0, -3.0], [0.0, 0.25]]), np.array([[0.2, 0.1], [0.1, 0.25]])
+        ),
+        QuadLU,
+        NNParams(),
+    )
+    optimization = RobustVerifier(batched_linear_inclusion[0], HiGHSBackend())
+    expected = assemble_lp_matrices(batched_linear_inclusion[1])
+    monkeypatch.setattr(linear_program, "assemble_lp_matrices", None)
+    optimization.update_linear_inclusion(batched_linear_inclusion[1])
+    lp_matrices = optimization.lp_matrices
+    assert_equal(
+        lp_matrices.constraint_matrix.toarray(), expected.constraint_matrix.toarray()
+    )
+    for name in ("lhs", "rhs", "lb", "ub"):
+        assert_equal(getattr(lp_matrices, name), getattr(expected, name))
+
+
+@pytest.fixture
+def relu_linear_inclusion() -> LinearInclusion:
+    """The hidden neurons are stably active, stably inactive and unstable"""
+    return LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([1.0, -1.0]), np.full(2, 0.1))),
+        ReLU,
+        NNParams(
+            (np.zeros(3), np.zeros(2)),
+            (
+                np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]),
+                np.array([[1.0, 1.0, 1.0], [-1.0, 2.0, 1.0]]),
+            ),
+        ),
+    )
+
+
+def test_assemble_lp_matrices_leaves_out_stably_inactive_relus(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    assert_equal(assemble_lp_matrices(relu_linear_inclusion).neurons[1], [0, 2])
+
+
+def test_assemble_lp_matrices_relaxes_only_unstable_relus(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(relu_linear_inclusion)
+    half_space_rows = lp_matrices.half_space_rows[0]
+    assert_equal(len(half_space_rows), 1 + 2)
+    assert_equal(lp_matrices.lhs[half_space_rows[0]], 0.0)
+    assert_equal(lp_matrices.rhs[half_space_rows[0]], 0.0)
+
+
+def test_robust_verifier_encodes_stable_relus_exactly() -> None:
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array([3.0, 1.0]), np.full(2, 0.4))),
+            ReLU,
+            NNParams((np.zeros(2),), (np.eye(2),)),
+        ),
+        HiGHSBackend(),
+    )
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.solve_all_margins(), np.array([np.nan, 1.2])
+    )
+
+
+def test_robust_verifier_bounds_relu_margins_from_below(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    margins = RobustVerifier(relu_linear_inclusion, HiGHSBackend()).solve_all_margins()
+    rng = np.random.default_rng(0)
+    inputs = rng.uniform(
+        relu_linear_inclusion.theta_arrays[0].lo,
+        relu_linear_inclusion.theta_arrays[0].hi,
+        (1000, 2),
+    )
+    hidden = np.maximum(inputs @ relu_linear_inclusion.nn_params.weights[0].T, 0.0)
+    outputs = np.maximum(hidden @ relu_linear_inclusion.nn_params.weights[1].T, 0.0)
+    assert margins[1] <= np.min(outputs[:, 0] - outputs[:, 1])
+
+
+def test_robust_verifier_requires_new_set_up_for_changed_relu_bounds(
+    relu_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(relu_linear_inclusion, HiGHSBackend())
+    with pytest.raises(AssertionError):
+        optimization.update_linear_inclusion(relu_linear_inclusion)
@@ -0,0 +1,253 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from numpy.ma.testutils import assert_almost_equal
+from numpy.testing import assert_equal
+from scipy.sparse import csr_matrix  # type: ignore[import]
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Identity,
+    QuadLU,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    LPMatrices,
+    NNParams,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification import lp_backends
+from lp_nn_robustness_verification.lp_backends import (
+    HiGHSBackend,
+    LPBackend,
+    SCIP_PROFILES,
+    SCIPBackend,
+    SolveLimits,
+    SolveResult,
+)
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+@pytest.fixture
+def ranged_lp_matrices() -> LPMatrices:
+    """min -v_0 subject to -1 <= v_0 - v_1 <= 1, v_1 = 0 and 0 <= v_0, v_1 <= 2"""
+    return LPMatrices(
+        constraint_matrix=csr_matrix(np.array([[1.0, -1.0], [0.0, 1.0]])),
+        lhs=np.array([-1.0, 0.0]),
+        rhs=np.array([1.0, 0.0]),
+        lb=np.zeros(2),
+        ub=np.full(2, 2.0),
+        objective=np.array([-1.0, 0.0]),
+        x_is=(np.array([0]), np.array([1])),
+        z_is=(np.array([], dtype=np.int64),),
+        neurons=(np.array([0]), np.array([0])),
+        affine_rows=(np.array([1]),),
+        half_space_rows=(np.array([0]),),
+    )
+
+
+def _quiet_backends() -> list[LPBackend]:
+    scip_backend = SCIPBackend(presolve=False)
+    scip_backend.model.hideOutput()
+    return [scip_backend, HiGHSBackend()]
+
+
+def test_lp_backend_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        LPBackend()  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize("backend", _quiet_backends())
+def test_lp_backends_solve_ranged_problem(
+    backend: LPBackend, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_equal(backend.get_status(), "optimal")
+    assert_almost_equal(backend.get_objective_value(), -1.0)  # type: ignore
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        backend.get_primal_values(), np.array([1.0, 0.0])
+    )
+
+
+@pytest.mark.parametrize("backend", _quiet_backends())
+def test_lp_backends_agree_on_dual_signs(
+    backend: LPBackend, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_almost_equal(backend.get_dual_values()[0], -1.0)  # type: ignore
+
+
+@pytest.mark.parametrize("backend", _quiet_backends())
+def test_lp_backends_replace_objective_after_solve(
+    backend: LPBackend, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    backend.set_objective(np.array([1.0, 0.0]))
+    backend.solve()
+    assert_almost_equal(backend.get_objective_value(), 0.0)  # type: ignore
+
+
+def test_scip_backend_refuses_duals_after_presolve(
+    ranged_lp_matrices: LPMatrices,
+) -> None:
+    backend = SCIPBackend()
+    backend.model.hideOutput()
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    with pytest.raises(AssertionError):
+        backend.get_dual_values()
+
+
+@pytest.mark.parametrize("profile", SCIP_PROFILES)
+def test_scip_backend_profiles_solve_ranged_problem(
+    profile: str, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend = SCIPBackend(profile=profile)
+    backend.model.hideOutput()
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_almost_equal(backend.get_objective_value(), -1.0)  # type: ignore
+
+
+def test_scip_backend_refuses_unknown_profile() -> None:
+    with pytest.raises(AssertionError):
+        SCIPBackend(profile="fastest")
+
+
+def test_pure_lp_profile_switches_off_integer_programming_machinery(
+    ranged_lp_matrices: LPMatrices,
+) -> None:
+    backend = SCIPBackend(profile="pure_lp")
+    backend.build(ranged_lp_matrices)
+    assert_equal(backend.model.getParam("heuristics/rounding/freq"), -1)
+    assert_equal(backend.model.getParam("separating/gomory/freq"), -1)
+    assert_equal(backend.model.getParam("lp/initalgorithm"), "d")
+
+
+def test_lp_algorithm_depends_on_problem_shape(
+    ranged_lp_matrices: LPMatrices,
+) -> None:
+    assert_equal(lp_backends._lp_algorithm(ranged_lp_matrices), "d")
+    wide_lp_matrices = replace(
+        ranged_lp_matrices,
+        constraint_matrix=ranged_lp_matrices.constraint_matrix[:1],
+        lhs=ranged_lp_matrices.lhs[:1],
+        rhs=ranged_lp_matrices.rhs[:1],
+    )
+    assert_equal(lp_backends._lp_algorithm(wide_lp_matrices), "p")
+
+
+@pytest.mark.parametrize("backend", _quiet_backends())
+def test_lp_backends_report_bounds_of_optimal_solves(
+    backend: LPBackend, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_almost_equal(np.array(backend.get_bounds()), [-1.0, -1.0])  # type: ignore
+
+
+@pytest.mark.parametrize("backend", _quiet_backends())
+def test_lp_backends_report_time_limit_without_bounds(
+    backend: LPBackend, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend.set_limits(SolveLimits(time=0.0))
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_equal(backend.get_status(), "timelimit")
+    assert_equal(backend.get_bounds(), (np.inf, -np.inf))
+
+
+@pytest.mark.parametrize("backend", _quiet_backends())
+def test_lp_backends_lift_limits_set_to_none(
+    backend: LPBackend, ranged_lp_matrices: LPMatrices
+) -> None:
+    backend.set_limits(SolveLimits(time=0.0, iterations=10))
+    backend.set_limits(SolveLimits())
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_equal(backend.get_status(), "optimal")
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        SCIPBackend(names=True, presolve=False, reoptimize=True, profile="pure_lp"),
+        HiGHSBackend("highs-ds", {"presolve": False}),
+    ],
+)
+def test_lp_backends_configuration_recreates_backend(backend: LPBackend) -> None:
+    assert_equal(
+        type(backend)(**backend.configuration).configuration, backend.configuration
+    )
+
+
+def test_solve_result_gap_is_difference_of_bounds() -> None:
+    assert_equal(SolveResult("optimal", 1.0, 0.25).gap, 0.75)
+    assert_equal(SolveResult("infeasible", np.inf, np.inf).gap, 0.0)
+    assert_equal(SolveResult("timelimit", np.inf, -np.inf).gap, np.inf)
+
+
+def test_highs_backend_refuses_results_before_solve(
+    ranged_lp_matrices: LPMatrices,
+) -> None:
+    backend = HiGHSBackend()
+    backend.build(ranged_lp_matrices)
+    with pytest.raises(AssertionError):
+        backend.get_objective_value()
+
+
+def test_highs_backend_reports_infeasibility(ranged_lp_matrices: LPMatrices) -> None:
+    ranged_lp_matrices.lhs[1] = ranged_lp_matrices.rhs[1] = 3.0
+    backend = HiGHSBackend()
+    backend.build(ranged_lp_matrices)
+    backend.solve()
+    assert_equal(backend.get_status(), "infeasible")
+
+
+@pytest.mark.parametrize(
+    "values, uncertainties, activation, objective_value",
+    [
+        ([1.5, 0.5], [0.5, 0.6], Identity, -0.1),
+        ([-1.2, 0.2], [0.5, 1.0], Sigmoid, -0.021786708959446344),
+        ([1.0, 0.5], [0.2, 0.1], Sigmoid, 0.04431817490181711),
+        ([2.0, 1.5], [0.2, 0.1], QuadLU, 0.2),
+        ([0.0, 0.25], [0.1, 0.25], QuadLU, -0.06),
+    ],
+)
+def test_highs_backend_solves_robust_verifier_to_known_values(
+    values: list[float],
+    uncertainties: list[float],
+    activation: ActivationFunc,
+    objective_value: float,
+) -> None:
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array(values), np.array(uncertainties))),
+            activation,
+            NNParams(),
+        ),
+        backend=HiGHSBackend(),
+    )
+    optimization.solve()
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.objective_value, objective_value
+    )
+
+
+def test_robust_verifier_refuses_model_of_other_backends() -> None:
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array([1.0, 0.5]), np.array([0.2, 0.1])))
+        ),
+        backend=HiGHSBackend(),
+    )
+    with pytest.raises(AssertionError):
+        optimization.model
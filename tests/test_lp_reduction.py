@@ -0,0 +1,202 @@
+import numpy as np
+import pytest
+from numpy.ma.testutils import assert_almost_equal
+from numpy.testing import assert_equal
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Identity,
+    QuadLU,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    NNParams,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import (
+    assemble_lp_matrices,
+    RobustVerifier,
+)
+from lp_nn_robustness_verification.lp_backends import HiGHSBackend, SCIPBackend
+from lp_nn_robustness_verification.lp_reduction import (
+    LPReduction,
+    reduce_lp_matrices,
+)
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+
+
+@pytest.fixture
+def sigmoid_linear_inclusion() -> LinearInclusion:
+    return LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([-1.2, 0.2]), np.array([0.5, 1.0]))),
+        Sigmoid,
+        NNParams(),
+    )
+
+
+@pytest.fixture
+def degenerate_linear_inclusion() -> LinearInclusion:
+    return LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([1.0, 0.5]), np.array([0.0, 0.1]))),
+        Sigmoid,
+        NNParams(),
+    )
+
+
+def test_reduce_lp_matrices_returns_reduction(
+    sigmoid_linear_inclusion: LinearInclusion,
+) -> None:
+    assert isinstance(
+        reduce_lp_matrices(assemble_lp_matrices(sigmoid_linear_inclusion)),
+        LPReduction,
+    )
+
+
+def test_reduce_lp_matrices_substitutes_all_z_is(
+    sigmoid_linear_inclusion: LinearInclusion,
+) -> None:
+    reduction = reduce_lp_matrices(assemble_lp_matrices(sigmoid_linear_inclusion))
+    assert_equal(reduction.n_substituted_columns, 2)
+    assert_equal(reduction.lp_matrices.shape[1], 4)
+    assert_equal(
+        [len(z_i) for z_i in reduction.lp_matrices.z_is],
+        [0],
+    )
+
+
+def test_reduce_lp_matrices_removes_affine_and_implied_rows(
+    sigmoid_linear_inclusion: LinearInclusion,
+) -> None:
+    reduction = reduce_lp_matrices(assemble_lp_matrices(sigmoid_linear_inclusion))
+    # both half-space rows' activities meet their sides, rounding decides the ties
+    assert 1 <= reduction.n_implied_rows <= 2
+    assert_equal(reduction.n_removed_rows, 2 + reduction.n_implied_rows)
+
+
+def test_reduce_lp_matrices_fixes_degenerate_columns(
+    degenerate_linear_inclusion: LinearInclusion,
+) -> None:
+    reduction = reduce_lp_matrices(assemble_lp_matrices(degenerate_linear_inclusion))
+    assert_equal(reduction.n_fixed_columns, 2)
+    assert_equal(reduction.offset[0], 1.0)
+
+
+def test_reduce_lp_matrices_fixes_narrow_columns_on_demand(
+    degenerate_linear_inclusion: LinearInclusion,
+) -> None:
+    assert_equal(
+        reduce_lp_matrices(
+            assemble_lp_matrices(degenerate_linear_inclusion), degenerate_width=1.0
+        ).n_fixed_columns,
+        4,
+    )
+
+
+def test_lp_reduction_reports_removed_counts(
+    degenerate_linear_inclusion: LinearInclusion,
+) -> None:
+    assert_equal(
+        str(reduce_lp_matrices(assemble_lp_matrices(degenerate_linear_inclusion))),
+        "Removed 4 of 6 variables (2 substituted, 2 fixed) and 3 of 4 constraints "
+        "(1 implied by bounds)",
+    )
+
+
+def test_lp_reduction_restores_feasible_primal_values(
+    sigmoid_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(sigmoid_linear_inclusion)
+    reduction = reduce_lp_matrices(lp_matrices)
+    primal_values = reduction.restore_primal_values(
+        (reduction.lp_matrices.lb + reduction.lp_matrices.ub) / 2
+    )
+    activities = lp_matrices.constraint_matrix @ primal_values
+    assert np.all(activities >= lp_matrices.lhs - 1e-12)
+    assert np.all(activities <= lp_matrices.rhs + 1e-12)
+
+
+def test_lp_reduction_reduce_objective_keeps_objective_values(
+    degenerate_linear_inclusion: LinearInclusion,
+) -> None:
+    lp_matrices = assemble_lp_matrices(degenerate_linear_inclusion)
+    reduction = reduce_lp_matrices(lp_matrices)
+    objective = np.arange(lp_matrices.shape[1], dtype=np.float64)
+    reduced_primal_values = reduction.lp_matrices.lb
+    reduced_objective, offset = reduction.reduce_objective(objective)
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        reduced_objective @ reduced_primal_values + offset,
+        objective @ reduction.restore_primal_values(reduced_primal_values),
+    )
+
+
+@pytest.mark.parametrize(
+    "values, uncertainties, activation, objective_value",
+    [
+        ([1.5, 0.5], [0.5, 0.6], Identity, -0.1),
+        ([-1.2, 0.2], [0.5, 1.0], Sigmoid, -0.021786708959446344),
+        ([1.0, 0.5], [0.2, 0.1], Sigmoid, 0.04431817490181711),
+        ([2.0, 1.5], [0.2, 0.1], QuadLU, 0.2),
+        ([0.0, 0.25], [0.1, 0.25], QuadLU, -0.06),
+    ],
+)
+@pytest.mark.parametrize("backend_type", [SCIPBackend, HiGHSBackend])
+def test_reduced_robust_verifier_solves_to_known_values(
+    values: list[float],
+    uncertainties: list[float],
+    activation: ActivationFunc,
+    objective_value: float,
+    backend_type: type[SCIPBackend] | type[HiGHSBackend],
+) -> None:
+    backend = backend_type()
+    if isinstance(backend, SCIPBackend):
+        backend.model.hideOutput()
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array(values), np.array(uncertainties))),
+            activation,
+            NNParams(),
+        ),
+        backend,
+        reduce=True,
+    )
+    optimization.solve()
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.objective_value, objective_value
+    )
+
+
+def test_reduced_robust_verifier_restores_all_primal_values(
+    sigmoid_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(sigmoid_linear_inclusion, HiGHSBackend(), reduce=True)
+    optimization.solve()
+    assert_equal(len(optimization.primal_values), 6)
+
+
+def test_reduced_robust_verifier_solves_all_margins() -> None:
+    optimization = RobustVerifier(
+        LinearInclusion(
+            UncertainInputs(
+                UncertainArray(np.array([3.0, 2.9, 0.0]), np.array([0.5, 0.5, 0.5]))
+            ),
+            Identity,
+            NNParams((np.zeros(3),), (np.eye(3),)),
+        ),
+        HiGHSBackend(),
+        reduce=True,
+    )
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        optimization.solve_all_margins(stop_early=False),
+        np.array([np.nan, -0.9, 2.0]),
+    )
+
+
+def test_reduced_robust_verifier_refuses_update_of_linear_inclusion(
+    sigmoid_linear_inclusion: LinearInclusion,
+) -> None:
+    optimization = RobustVerifier(sigmoid_linear_inclusion, HiGHSBackend(), reduce=True)
+    with pytest.raises(AssertionError):
+        optimization.update_linear_inclusion(sigmoid_linear_inclusion)
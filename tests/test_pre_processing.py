@@ -4,19 +4,27 @@ from hypothesis import given, settings, strategies as hst
 from hypothesis.extra import numpy as hnp
 from interval import interval
 from numpy.testing import assert_almost_equal, assert_equal
+from scipy.sparse import csr_matrix  # type: ignore[import]
 
 from lp_nn_robustness_verification import pre_processing
-from lp_nn_robustness_verification.data_acquisition.activation_functions import Sigmoid
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Identity,
+    QuadLU,
+    Sigmoid,
+)
 from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
     UncertainInputs,
 )
 from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    IntervalArray,
     NNParams,
     RealMatrix,
     RealVector,
     UncertainArray,
 )
 from lp_nn_robustness_verification.pre_processing import (
+    BatchedLinearInclusion,
     compute_values_label,
     LinearInclusion,
 )
@@ -262,3 +270,390 @@ def test_compute_values_label_for_random_inputs_of_zema_shape_is_correct(
         ),
         (weights @ values + biases).argmax(),
     )
+
+
+def test_linear_inclusion_z_is_match_scalar_interval_arithmetic() -> None:
+    rng = np.random.default_rng(0)
+    uncertain_inputs = UncertainInputs(
+        UncertainArray(rng.uniform(-1.0, 1.0, 7), rng.uniform(0.0, 0.1, 7))
+    )
+    nn_params = NNParams((rng.uniform(-1.0, 1.0, 3),), (rng.uniform(-1, 1, (3, 7)),))
+    linear_inclusion = LinearInclusion(uncertain_inputs, Sigmoid, nn_params)
+    for (bias, weight_vector), z_k in zip(
+        zip(*next(iter(nn_params))), linear_inclusion.z_is[0]
+    ):
+        scalar_z_k = interval(float(bias))
+        for weight, theta_j in zip(weight_vector, uncertain_inputs.theta_0):
+            scalar_z_k += float(weight) * theta_j
+        assert_almost_equal(z_k[0].inf, scalar_z_k[0].inf, decimal=14)
+        assert_almost_equal(z_k[0].sup, scalar_z_k[0].sup, decimal=14)
+
+
+def test_linear_inclusion_accepts_interval_array() -> None:
+    assert (
+        LinearInclusion(
+            IntervalArray(np.array([0.0, 0.0]), np.array([1.0, 1.0])), Sigmoid
+        ).r_is
+        == LinearInclusion(activation=Sigmoid).r_is
+    )
+
+
+def test_fast_linear_inclusion_is_close_to_sound_one(
+    custom_linear_inclusion_instance: LinearInclusion,
+) -> None:
+    fast_linear_inclusion = LinearInclusion(
+        custom_linear_inclusion_instance.uncertain_inputs,
+        custom_linear_inclusion_instance.activation,
+        custom_linear_inclusion_instance.nn_params,
+        sound=False,
+    )
+    for fast_r_i, sound_r_i in zip(
+        fast_linear_inclusion.r_arrays, custom_linear_inclusion_instance.r_arrays
+    ):
+        assert not fast_r_i.sound
+        assert_almost_equal(fast_r_i.lo, sound_r_i.lo)
+        assert_almost_equal(fast_r_i.hi, sound_r_i.hi)
+
+
+@pytest.fixture(scope="session")
+def deep_nn_params() -> NNParams:
+    rng = np.random.default_rng(2)
+    return NNParams(
+        tuple(rng.uniform(-1.0, 1.0, 6) for _ in range(4)),
+        tuple(rng.uniform(-1.0, 1.0, (6, 6)) for _ in range(4)),
+    )
+
+
+@pytest.fixture(scope="session")
+def deep_uncertain_inputs() -> UncertainInputs:
+    return UncertainInputs(UncertainArray(np.linspace(-1.0, 1.0, 6), np.full(6, 0.5)))
+
+
+@pytest.mark.parametrize("symbolic", [False, True])
+def test_linear_inclusion_is_close_for_sparse_weights(
+    deep_uncertain_inputs: UncertainInputs, deep_nn_params: NNParams, symbolic: bool
+) -> None:
+    dense_weights = tuple(
+        np.where(weight_matrix > 0, weight_matrix, 0.0)
+        for weight_matrix in deep_nn_params.weights
+    )
+    dense_linear_inclusion, sparse_linear_inclusion = (
+        LinearInclusion(
+            deep_uncertain_inputs,
+            Sigmoid,
+            NNParams(deep_nn_params.biases, weights),
+            symbolic=symbolic,
+        )
+        for weights in (dense_weights, tuple(map(csr_matrix, dense_weights)))
+    )
+    for dense_theta_i, sparse_theta_i in zip(
+        dense_linear_inclusion.theta_arrays, sparse_linear_inclusion.theta_arrays
+    ):
+        assert_almost_equal(sparse_theta_i.lo, dense_theta_i.lo)
+        assert_almost_equal(sparse_theta_i.hi, dense_theta_i.hi)
+
+
+def test_symbolic_linear_inclusion_matches_interval_one_for_one_layer(
+    custom_linear_inclusion_instance: LinearInclusion,
+) -> None:
+    symbolic_linear_inclusion = LinearInclusion(
+        custom_linear_inclusion_instance.uncertain_inputs,
+        custom_linear_inclusion_instance.activation,
+        custom_linear_inclusion_instance.nn_params,
+        symbolic=True,
+    )
+    assert (
+        symbolic_linear_inclusion.theta_arrays
+        == custom_linear_inclusion_instance.theta_arrays
+    )
+
+
+@pytest.mark.parametrize("activation", [Sigmoid, QuadLU])
+def test_symbolic_linear_inclusion_is_tighter_for_deep_networks(
+    deep_uncertain_inputs: UncertainInputs,
+    deep_nn_params: NNParams,
+    activation: ActivationFunc,
+) -> None:
+    interval_linear_inclusion = LinearInclusion(
+        deep_uncertain_inputs, activation, deep_nn_params
+    )
+    symbolic_linear_inclusion = LinearInclusion(
+        deep_uncertain_inputs, activation, deep_nn_params, symbolic=True
+    )
+    for interval_z_i, symbolic_z_i in zip(
+        interval_linear_inclusion.z_arrays, symbolic_linear_inclusion.z_arrays
+    ):
+        # center/radius products of nested intervals may differ in the last bits
+        assert np.all(symbolic_z_i.lo >= interval_z_i.lo - 1e-12)
+        assert np.all(symbolic_z_i.hi <= interval_z_i.hi + 1e-12)
+    assert np.sum(symbolic_linear_inclusion.r_arrays[-1].width) < np.sum(
+        interval_linear_inclusion.r_arrays[-1].width
+    )
+
+
+@pytest.mark.parametrize("activation", [Sigmoid, QuadLU])
+def test_symbolic_linear_inclusion_encloses_sampled_forward_passes(
+    deep_uncertain_inputs: UncertainInputs,
+    deep_nn_params: NNParams,
+    activation: ActivationFunc,
+) -> None:
+    linear_inclusion = LinearInclusion(
+        deep_uncertain_inputs, activation, deep_nn_params, symbolic=True
+    )
+    theta_0 = linear_inclusion.theta_arrays[0]
+    x_i = np.random.default_rng(3).uniform(theta_0.lo, theta_0.hi, (1000, 6))
+    for (biases, weight_matrix), theta_i in zip(
+        deep_nn_params, linear_inclusion.theta_arrays[1:]
+    ):
+        x_i = np.asarray(activation.func(x_i @ weight_matrix.T + biases))
+        assert np.all(x_i >= theta_i.lo)
+        assert np.all(x_i <= theta_i.hi)
+
+
+@pytest.mark.parametrize("activation", [Sigmoid, QuadLU])
+@pytest.mark.parametrize("symbolic", [False, True])
+def test_min_residual_linear_inclusion_has_narrower_residuals(
+    deep_uncertain_inputs: UncertainInputs,
+    deep_nn_params: NNParams,
+    activation: ActivationFunc,
+    symbolic: bool,
+) -> None:
+    midpoint_linear_inclusion, min_residual_linear_inclusion = (
+        LinearInclusion(
+            deep_uncertain_inputs,
+            activation,
+            deep_nn_params,
+            symbolic=symbolic,
+            min_residual=min_residual,
+        )
+        for min_residual in (False, True)
+    )
+    for midpoint_r_i, min_residual_r_i in zip(
+        midpoint_linear_inclusion.r_arrays, min_residual_linear_inclusion.r_arrays
+    ):
+        assert np.sum(min_residual_r_i.width) < np.sum(midpoint_r_i.width)
+
+
+def test_symbolic_min_residual_linear_inclusion_searches_each_layer_once(
+    deep_uncertain_inputs: UncertainInputs,
+    deep_nn_params: NNParams,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    searched_layers = []
+
+    def counting_min_residual_points(
+        activation: ActivationFunc, theta_i: IntervalArray, z_i: IntervalArray
+    ) -> RealVector:
+        searched_layers.append(len(z_i))
+        return min_residual_points(activation, theta_i, z_i)
+
+    min_residual_points = pre_processing._min_residual_points
+    monkeypatch.setattr(
+        pre_processing, "_min_residual_points", counting_min_residual_points
+    )
+    linear_inclusion = LinearInclusion(
+        deep_uncertain_inputs,
+        Sigmoid,
+        deep_nn_params,
+        symbolic=True,
+        min_residual=True,
+    )
+    assert len(searched_layers) == len(linear_inclusion.xi_is)
+
+
+@pytest.mark.parametrize("activation", [Identity, Sigmoid, QuadLU])
+def test_min_residual_linear_inclusion_encloses_sampled_residuals(
+    deep_uncertain_inputs: UncertainInputs,
+    deep_nn_params: NNParams,
+    activation: ActivationFunc,
+) -> None:
+    linear_inclusion = LinearInclusion(
+        deep_uncertain_inputs, activation, deep_nn_params, min_residual=True
+    )
+    for z_i, xi_i, r_i in zip(
+        linear_inclusion.z_arrays, linear_inclusion.xi_is, linear_inclusion.r_arrays
+    ):
+        z_samples = np.random.default_rng(4).uniform(z_i.lo, z_i.hi, (1000, 6))
+        residuals = (
+            activation.func(z_samples)
+            - activation.func(xi_i)
+            - activation.deriv(xi_i) * (z_samples - xi_i)
+        )
+        assert np.all(residuals >= r_i.lo)
+        assert np.all(residuals <= r_i.hi)
+
+
+def test_golden_section_search_finds_minima_componentwise() -> None:
+    minima = np.array([-1.0, 0.5, 3.0])
+    assert_almost_equal(
+        pre_processing._golden_section_search(
+            lambda points: (points - minima) ** 2, np.full(3, -2.0), np.full(3, 2.0)
+        ),
+        np.array([-1.0, 0.5, 2.0]),
+        decimal=5,
+    )
+
+
+@pytest.fixture(scope="session")
+def correlated_uncertain_inputs() -> UncertainInputs:
+    factor = np.linspace(-1.0, 1.0, 12).reshape(6, 2) * 0.5
+    return UncertainInputs(
+        UncertainArray(np.linspace(-1.0, 1.0, 6), factor @ factor.T + 1e-4 * np.eye(6))
+    )
+
+
+def test_correlated_linear_inclusion_is_symbolic(
+    correlated_uncertain_inputs: UncertainInputs, deep_nn_params: NNParams
+) -> None:
+    assert LinearInclusion(
+        correlated_uncertain_inputs, Sigmoid, deep_nn_params
+    ).symbolic
+
+
+def test_correlated_linear_inclusion_is_tighter_than_box(
+    correlated_uncertain_inputs: UncertainInputs, deep_nn_params: NNParams
+) -> None:
+    box_linear_inclusion = LinearInclusion(
+        correlated_uncertain_inputs.theta_0_array,
+        Sigmoid,
+        deep_nn_params,
+        symbolic=True,
+    )
+    correlated_linear_inclusion = LinearInclusion(
+        correlated_uncertain_inputs, Sigmoid, deep_nn_params
+    )
+    for box_theta_i, correlated_theta_i in zip(
+        box_linear_inclusion.theta_arrays[1:],
+        correlated_linear_inclusion.theta_arrays[1:],
+    ):
+        assert np.sum(correlated_theta_i.width) < np.sum(box_theta_i.width)
+
+
+@pytest.mark.parametrize("max_generators", [None, 1])
+def test_correlated_linear_inclusion_encloses_sampled_forward_passes(
+    correlated_uncertain_inputs: UncertainInputs,
+    deep_nn_params: NNParams,
+    max_generators: int | None,
+) -> None:
+    linear_inclusion = LinearInclusion(
+        correlated_uncertain_inputs,
+        Sigmoid,
+        deep_nn_params,
+        max_generators=max_generators,
+    )
+    generators = correlated_uncertain_inputs.generators
+    directions = np.random.default_rng(4).normal(size=(1000, generators.shape[1]))
+    x_i = (
+        correlated_uncertain_inputs.values
+        + (directions / np.linalg.norm(directions, axis=1, keepdims=True))
+        @ generators.T
+    )
+    for (biases, weight_matrix), theta_i in zip(
+        deep_nn_params, linear_inclusion.theta_arrays[1:]
+    ):
+        x_i = Sigmoid.func(x_i @ weight_matrix.T + biases)
+        assert np.all(x_i >= theta_i.lo)
+        assert np.all(x_i <= theta_i.hi)
+
+
+@pytest.fixture(scope="session")
+def batched_linear_inclusion_instance() -> BatchedLinearInclusion:
+    rng = np.random.default_rng(1)
+    return BatchedLinearInclusion(
+        UncertainArray(rng.uniform(-1.0, 1.0, (5, 4)), rng.uniform(0.0, 0.2, (5, 4))),
+        Sigmoid,
+        NNParams(
+            (rng.uniform(-1.0, 1.0, 3), rng.uniform(-1.0, 1.0, 2)),
+            (rng.uniform(-1.0, 1.0, (3, 4)), rng.uniform(-1.0, 1.0, (2, 3))),
+        ),
+    )
+
+
+def test_batched_linear_inclusion_has_one_row_per_sample(
+    batched_linear_inclusion_instance: BatchedLinearInclusion,
+) -> None:
+    assert_equal(len(batched_linear_inclusion_instance), 5)
+    for z_i, r_i in zip(
+        batched_linear_inclusion_instance.z_arrays,
+        batched_linear_inclusion_instance.r_arrays,
+    ):
+        assert_equal(z_i.shape[0], 5)
+        assert_equal(r_i.shape, z_i.shape)
+
+
+def test_batched_linear_inclusion_matches_linear_inclusion_per_sample(
+    batched_linear_inclusion_instance: BatchedLinearInclusion,
+) -> None:
+    for sample_idx, sample_linear_inclusion in enumerate(
+        batched_linear_inclusion_instance
+    ):
+        linear_inclusion = LinearInclusion(
+            UncertainInputs(
+                UncertainArray(
+                    batched_linear_inclusion_instance.uncertain_values.values[
+                        sample_idx
+                    ],
+                    batched_linear_inclusion_instance.uncertain_values.uncertainties[
+                        sample_idx
+                    ],
+                )
+            ),
+            batched_linear_inclusion_instance.activation,
+            batched_linear_inclusion_instance.nn_params,
+        )
+        for batched_r_i, r_i in zip(
+            sample_linear_inclusion.r_arrays, linear_inclusion.r_arrays
+        ):
+            assert_almost_equal(batched_r_i.lo, r_i.lo, decimal=12)
+            assert_almost_equal(batched_r_i.hi, r_i.hi, decimal=12)
+        assert_almost_equal(
+            sample_linear_inclusion.xi_is[-1], linear_inclusion.xi_is[-1], decimal=12
+        )
+
+
+def test_min_residual_batched_linear_inclusion_matches_linear_inclusion(
+    batched_linear_inclusion_instance: BatchedLinearInclusion,
+) -> None:
+    uncertain_values = batched_linear_inclusion_instance.uncertain_values
+    batched_linear_inclusion = BatchedLinearInclusion(
+        uncertain_values,
+        batched_linear_inclusion_instance.activation,
+        batched_linear_inclusion_instance.nn_params,
+        min_residual=True,
+    )
+    linear_inclusion = LinearInclusion(
+        UncertainInputs(
+            UncertainArray(
+                uncertain_values.values[0], uncertain_values.uncertainties[0]
+            )
+        ),
+        batched_linear_inclusion_instance.activation,
+        batched_linear_inclusion_instance.nn_params,
+        min_residual=True,
+    )
+    assert batched_linear_inclusion[0].min_residual
+    for batched_r_i, r_i in zip(
+        batched_linear_inclusion[0].r_arrays, linear_inclusion.r_arrays
+    ):
+        assert_almost_equal(batched_r_i.lo, r_i.lo, decimal=12)
+        assert_almost_equal(batched_r_i.hi, r_i.hi, decimal=12)
+
+
+def test_tighten_layer_propagates_to_following_layers() -> None:
+    linear_inclusion = LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([0.0, 0.0]), np.array([1.0, 1.0]))),
+        Identity,
+        NNParams(
+            (np.zeros(2), np.zeros(1)),
+            (np.array([[1.0, 1.0], [1.0, -1.0]]), np.array([[1.0, 1.0]])),
+        ),
+    )
+    tightened = linear_inclusion.tighten_layer(
+        1, IntervalArray(np.array([-0.5, -3.0]), np.array([0.5, 3.0]))
+    )
+    assert_almost_equal(tightened.z_arrays[0].lo, [-0.5, -2.0])
+    assert_almost_equal(tightened.z_arrays[0].hi, [0.5, 2.0])
+    assert_almost_equal(tightened.theta_arrays[1].hi, [0.5, 2.0])
+    assert_almost_equal(tightened.z_arrays[1].hi, [2.5])
+    assert_almost_equal(tightened.xi_is[0], [0.0, 0.0])
+    assert_almost_equal(linear_inclusion.z_arrays[1].hi, [4.0])
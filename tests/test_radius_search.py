@@ -0,0 +1,159 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from lp_nn_robustness_verification import radius_search
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    ReLU,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    NNParams,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.linear_program import RobustVerifier
+from lp_nn_robustness_verification.lp_backends import HiGHSBackend
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+from lp_nn_robustness_verification.radius_search import (
+    certify_scales,
+    RadiusBracket,
+    search_radius,
+)
+from lp_nn_robustness_verification.verification_pipeline import verify
+
+
+@pytest.fixture(scope="module")
+def nn_params() -> NNParams:
+    rng = np.random.default_rng(3)
+    sizes = [6, 8, 8, 3]
+    return NNParams(
+        tuple(0.3 * rng.normal(size=n_out) for n_out in sizes[1:]),
+        tuple(rng.normal(size=(n_out, n_in)) for n_in, n_out in zip(sizes, sizes[1:])),
+    )
+
+
+@pytest.fixture(scope="module")
+def uncertain_inputs() -> UncertainInputs:
+    return UncertainInputs(UncertainArray(np.linspace(0.0, 1.0, 6), np.ones(6)))
+
+
+def _robust(
+    uncertain_inputs: UncertainInputs,
+    activation: ActivationFunc,
+    nn_params: NNParams,
+    scale: float,
+) -> bool | None:
+    return verify(
+        LinearInclusion(
+            UncertainInputs(
+                UncertainArray(
+                    uncertain_inputs.values, scale * uncertain_inputs.uncertainties
+                )
+            ),
+            activation,
+            nn_params,
+        ),
+        HiGHSBackend(),
+    ).robust
+
+
+def test_search_radius_in_all() -> None:
+    assert search_radius.__name__ in radius_search.__all__
+
+
+@pytest.mark.parametrize("activation", [Sigmoid, ReLU])
+def test_search_radius_brackets_certified_scales(
+    uncertain_inputs: UncertainInputs, nn_params: NNParams, activation: ActivationFunc
+) -> None:
+    bracket = search_radius(
+        uncertain_inputs,
+        activation,
+        nn_params,
+        max_scale=0.2,
+        backend_factory=HiGHSBackend,
+    )
+    assert bracket.uncertified_scale is not None
+    assert 0 < bracket.uncertified_scale - bracket.certified_scale <= 1e-3
+    assert _robust(uncertain_inputs, activation, nn_params, bracket.certified_scale)
+    assert not _robust(
+        uncertain_inputs, activation, nn_params, bracket.uncertified_scale
+    )
+
+
+def test_search_radius_reports_counterexamples(
+    uncertain_inputs: UncertainInputs, nn_params: NNParams
+) -> None:
+    bracket = search_radius(
+        uncertain_inputs, ReLU, nn_params, max_scale=0.2, backend_factory=HiGHSBackend
+    )
+    assert bracket.refuted_scale is not None
+    assert _robust(uncertain_inputs, ReLU, nn_params, bracket.refuted_scale) is False
+
+
+def test_search_radius_certifies_all_scales(
+    uncertain_inputs: UncertainInputs, nn_params: NNParams
+) -> None:
+    assert_equal(
+        search_radius(
+            uncertain_inputs,
+            Sigmoid,
+            nn_params,
+            max_scale=0.01,
+            backend_factory=HiGHSBackend,
+        )[:3],
+        (0.01, None, None),
+    )
+
+
+def test_search_radius_sets_up_smooth_problem_once(
+    uncertain_inputs: UncertainInputs,
+    nn_params: NNParams,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    verifiers = []
+
+    class CountingVerifier(RobustVerifier):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            verifiers.append(self)
+
+    monkeypatch.setattr(radius_search, "RobustVerifier", CountingVerifier)
+    bracket = search_radius(
+        uncertain_inputs,
+        Sigmoid,
+        nn_params,
+        max_scale=0.2,
+        backend_factory=HiGHSBackend,
+    )
+    assert isinstance(bracket, RadiusBracket)
+    assert bracket.n_linear_programs > 1
+    assert len(verifiers) == 1
+
+
+def test_certify_scales_matches_single_verifications(
+    uncertain_inputs: UncertainInputs, nn_params: NNParams
+) -> None:
+    scales = np.linspace(0.01, 0.2, 20)
+    assert_equal(
+        certify_scales(uncertain_inputs, Sigmoid, nn_params, scales, HiGHSBackend),
+        [
+            _robust(uncertain_inputs, Sigmoid, nn_params, scale) is True
+            for scale in scales
+        ],
+    )
+
+
+def test_certify_scales_rejects_correlated_inputs(nn_params: NNParams) -> None:
+    with pytest.raises(AssertionError):
+        certify_scales(
+            UncertainInputs(UncertainArray(np.zeros(6), np.eye(6))),
+            Sigmoid,
+            nn_params,
+            np.array([0.5, 1.0]),
+        )
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import UncertainArray
+from lp_nn_robustness_verification.lp_backends import SCIP_PROFILES
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+from lp_nn_robustness_verification.solver_tuning import (
+    load_scip_profile,
+    ProfileTuning,
+    tune_scip_profile,
+)
+
+
+@pytest.fixture(scope="module")
+def linear_inclusions() -> list[LinearInclusion]:
+    return [
+        LinearInclusion(
+            UncertainInputs(UncertainArray(np.array(values), np.array([0.2, 0.1]))),
+            Sigmoid,
+        )
+        for values in ([1.0, 0.5], [-1.2, 0.2])
+    ]
+
+
+def test_tune_scip_profile_times_all_profiles(
+    linear_inclusions: list[LinearInclusion],
+) -> None:
+    tuning = tune_scip_profile(linear_inclusions)
+    assert isinstance(tuning, ProfileTuning)
+    assert_equal(tuple(tuning.seconds), SCIP_PROFILES)
+    assert tuning.seconds[tuning.profile] == min(tuning.seconds.values())
+
+
+def test_tune_scip_profile_stores_winner(
+    linear_inclusions: list[LinearInclusion], tmp_path: Path
+) -> None:
+    path = tmp_path / "scip_profile.json"
+    tuning = tune_scip_profile(linear_inclusions, ("default", "pure_lp"), path=path)
+    assert_equal(load_scip_profile(path), tuning.profile)
+
+
+def test_tune_scip_profile_refuses_empty_sample() -> None:
+    with pytest.raises(AssertionError):
+        tune_scip_profile([])
@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_equal
+from scipy.sparse import csr_matrix  # type: ignore[import]
+
+from lp_nn_robustness_verification import symbolic_bounds
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import IntervalArray
+from lp_nn_robustness_verification.symbolic_bounds import SymbolicBounds
+
+
+@pytest.fixture
+def theta_0() -> IntervalArray:
+    return IntervalArray(np.array([0.5, 1.0, 2.0]), np.array([1.5, 1.0, 2.5]))
+
+
+def test_symbolic_bounds_in_all() -> None:
+    assert SymbolicBounds.__name__ in symbolic_bounds.__all__
+
+
+def test_symbolic_bounds_from_box_skips_degenerate_inputs(
+    theta_0: IntervalArray,
+) -> None:
+    assert_equal(SymbolicBounds.from_box(theta_0).coefficients.shape, (2,))
+
+
+def test_symbolic_bounds_from_box_assigns_generators_to_inputs(
+    theta_0: IntervalArray,
+) -> None:
+    assert_equal(SymbolicBounds.from_box(theta_0).generator_neurons, np.array([0, 2]))
+
+
+def test_symbolic_bounds_from_box_affine_equals_dense_generators(
+    theta_0: IntervalArray,
+) -> None:
+    weight_matrix = np.array([[1.0, -1.0, 2.0], [0.5, 0.0, -1.0]])
+    biases = np.array([0.5, -0.5])
+    dense_bounds = SymbolicBounds.from_generators(
+        theta_0.midpoint, np.diag(theta_0.radius)[:, [0, 2]]
+    ).affine(weight_matrix, biases)
+    box_bounds = SymbolicBounds.from_box(theta_0).affine(weight_matrix, biases)
+    assert box_bounds.generator_neurons is None
+    assert box_bounds.coefficients == dense_bounds.coefficients
+    assert box_bounds.offsets == dense_bounds.offsets
+
+
+def test_symbolic_bounds_from_box_affine_accepts_sparse_weights(
+    theta_0: IntervalArray,
+) -> None:
+    weight_matrix = np.array([[1.0, -1.0, 2.0], [0.5, 0.0, -1.0]])
+    biases = np.array([0.5, -0.5])
+    assert (
+        SymbolicBounds.from_box(theta_0)
+        .affine(csr_matrix(weight_matrix), biases)
+        .concretize()
+        == SymbolicBounds.from_box(theta_0).affine(weight_matrix, biases).concretize()
+    )
+
+
+def test_symbolic_bounds_from_box_concretizes_to_box(theta_0: IntervalArray) -> None:
+    assert SymbolicBounds.from_box(theta_0).concretize() == theta_0
+
+
+def test_symbolic_bounds_from_sparse_diagonal_generators_stay_diagonal(
+    theta_0: IntervalArray,
+) -> None:
+    bounds = SymbolicBounds.from_generators(
+        theta_0.midpoint, UncertainInputs(theta_0).generators
+    )
+    assert_equal(bounds.generator_neurons, np.array([0, 2]))
+    assert bounds.concretize() == theta_0
+
+
+def test_symbolic_bounds_from_sparse_generators_densify_shared_columns() -> None:
+    bounds = SymbolicBounds.from_generators(
+        np.zeros(2), csr_matrix(np.array([[1.0, 0.0], [1.0, 2.0]]))
+    )
+    assert bounds.generator_neurons is None
+    assert_equal(bounds.coefficients.lo, np.array([[1.0, 0.0], [1.0, 2.0]]))
+
+
+def test_symbolic_bounds_affine_concretizes_to_interval_image(
+    theta_0: IntervalArray,
+) -> None:
+    weight_matrix = np.array([[1.0, -1.0, 2.0], [0.5, 0.0, -1.0]])
+    biases = np.array([0.5, -0.5])
+    assert (
+        SymbolicBounds.from_box(theta_0).affine(weight_matrix, biases).concretize()
+        == weight_matrix @ theta_0 + biases
+    )
+
+
+def test_symbolic_bounds_keep_dependencies_across_layers(
+    theta_0: IntervalArray,
+) -> None:
+    difference = (
+        SymbolicBounds.from_box(theta_0)
+        .affine(np.array([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]), np.zeros(2))
+        .affine(np.array([[1.0, -1.0]]), np.zeros(1))
+        .concretize()
+    )
+    assert_equal(difference.lo, np.zeros(1))
+    assert_equal(difference.hi, np.zeros(1))
+
+
+def test_symbolic_bounds_linearize_shifts_and_scales(theta_0: IntervalArray) -> None:
+    linearized = (
+        SymbolicBounds.from_box(theta_0)
+        .linearize(
+            np.array([2.0, 1.0, 0.0]),
+            IntervalArray(np.array([0.0, -1.0, 0.5]), np.array([0.0, 1.0, 0.5])),
+        )
+        .concretize()
+    )
+    assert_almost_equal(linearized.lo, np.array([1.0, 0.0, 0.5]))
+    assert_almost_equal(linearized.hi, np.array([3.0, 2.0, 0.5]))
+
+
+def test_symbolic_bounds_reduce_order_limits_generators(
+    theta_0: IntervalArray,
+) -> None:
+    assert_equal(
+        SymbolicBounds.from_box(theta_0).reduce_order(1).coefficients.shape, (1,)
+    )
+
+
+def test_symbolic_bounds_reduce_order_keeps_largest_generators(
+    theta_0: IntervalArray,
+) -> None:
+    reduced = SymbolicBounds.from_box(theta_0).reduce_order(1)
+    assert_equal(reduced.coefficients.lo, np.array([0.5]))
+    assert_equal(reduced.generator_neurons, np.array([0]))
+
+
+def test_symbolic_bounds_reduce_order_of_box_keeps_concretization(
+    theta_0: IntervalArray,
+) -> None:
+    assert SymbolicBounds.from_box(theta_0).reduce_order(1).concretize() == theta_0
+
+
+def test_symbolic_bounds_reduce_order_keeps_concretization(
+    theta_0: IntervalArray,
+) -> None:
+    bounds = SymbolicBounds.from_box(theta_0).affine(
+        np.array([[1.0, -1.0, 2.0], [0.5, 0.0, -1.0]]), np.zeros(2)
+    )
+    assert bounds.reduce_order(1).concretize() == bounds.concretize()
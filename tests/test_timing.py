@@ -1,3 +1,4 @@
+import json
 import os
 from inspect import signature
 from pathlib import Path
@@ -7,7 +8,10 @@ import pytest
 import yappi  # type: ignore[import]
 
 from lp_nn_robustness_verification import timing
-from lp_nn_robustness_verification.timing import write_current_timing_stats
+from lp_nn_robustness_verification.timing import (
+    write_current_timing_stats,
+    write_statistics_record,
+)
 
 
 @pytest.fixture
@@ -106,3 +110,21 @@ def test_print_current_timing_stats_creates_file_with_stats(
         assert (
             "Clock type: CPU\nOrdered by: totaltime, desc\n\nname" in read_file.read()
         )
+
+
+def test_write_statistics_record_in_all() -> None:
+    assert write_statistics_record.__name__ in timing.__all__
+
+
+def test_write_statistics_record_appends_one_json_line_per_call(
+    tmp_path: Path,
+) -> None:
+    filename = str(tmp_path.joinpath("statistics.jsonl"))
+    write_statistics_record({"build_time": 0.5}, filename, network="small")
+    write_statistics_record({"build_time": 1.5, "n_rows": 3.0}, filename)
+    with open(filename, "r") as read_file:
+        records = [json.loads(line) for line in read_file]
+    assert records == [
+        {"network": "small", "build_time": 0.5},
+        {"build_time": 1.5, "n_rows": 3.0},
+    ]
@@ -1,9 +1,16 @@
+import numpy as np
 import pytest
+from numpy.testing import assert_almost_equal, assert_equal
+from scipy.sparse import csr_matrix  # type: ignore[import]
 
 from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
     UncertainInputs,
 )
-from lp_nn_robustness_verification.data_types import UncertainArray
+from lp_nn_robustness_verification.data_types import (
+    IntervalArray,
+    RealMatrix,
+    UncertainArray,
+)
 
 
 @pytest.fixture(scope="session")
@@ -43,3 +50,94 @@ def test_default_init_uncertain_inputs_has_intervals(
 
 def test_default_init_intervals_are_tuple(uncertain_inputs: UncertainInputs) -> None:
     assert isinstance(uncertain_inputs.theta_0, tuple)
+
+
+def test_default_init_uncertain_inputs_has_interval_array(
+    uncertain_inputs: UncertainInputs,
+) -> None:
+    assert isinstance(uncertain_inputs.theta_0_array, IntervalArray)
+
+
+def test_uncertain_inputs_accepts_interval_array() -> None:
+    theta_0 = IntervalArray(np.array([0.0, 1.0]), np.array([1.0, 3.0]))
+    uncertain_inputs = UncertainInputs(theta_0)
+    assert uncertain_inputs.theta_0_array is theta_0
+    assert_equal(uncertain_inputs.values, np.array([0.5, 2.0]))
+    assert_equal(uncertain_inputs.uncertainties, np.array([0.5, 1.0]))
+
+
+@pytest.fixture(scope="session")
+def covariance() -> RealMatrix:
+    return np.array([[1.0, 0.9, 0.0], [0.9, 1.0, 0.0], [0.0, 0.0, 0.25]])
+
+
+@pytest.fixture(scope="session")
+def correlated_uncertain_inputs(covariance: RealMatrix) -> UncertainInputs:
+    return UncertainInputs(UncertainArray(np.array([1.0, 2.0, 3.0]), covariance))
+
+
+def test_uncertain_inputs_are_uncorrelated_by_default(
+    uncertain_inputs: UncertainInputs,
+) -> None:
+    assert not uncertain_inputs.correlated
+
+
+def test_uncertain_inputs_accepts_covariance_matrix(
+    correlated_uncertain_inputs: UncertainInputs,
+) -> None:
+    assert correlated_uncertain_inputs.correlated
+
+
+def test_uncertain_inputs_rejects_non_square_uncertainties() -> None:
+    with pytest.raises(AssertionError):
+        UncertainInputs(UncertainArray(np.array([1.0, 2.0]), np.ones((2, 3))))
+
+
+def test_correlated_uncertain_inputs_theta_0_has_standard_uncertainties_as_radii(
+    correlated_uncertain_inputs: UncertainInputs,
+) -> None:
+    assert_almost_equal(
+        correlated_uncertain_inputs.theta_0_array.radius, np.array([1.0, 1.0, 0.5])
+    )
+
+
+def test_correlated_uncertain_inputs_generators_factor_covariance(
+    correlated_uncertain_inputs: UncertainInputs, covariance: RealMatrix
+) -> None:
+    generators = correlated_uncertain_inputs.generators
+    assert_almost_equal(generators @ generators.T, covariance)
+
+
+def test_correlated_uncertain_inputs_generators_skip_null_directions() -> None:
+    assert_equal(
+        UncertainInputs(
+            UncertainArray(np.zeros(2), np.array([[1.0, 1.0], [1.0, 1.0]]))
+        ).generators.shape,
+        (2, 1),
+    )
+
+
+def test_uncorrelated_uncertain_inputs_generators_are_sparse_diagonal() -> None:
+    generators = UncertainInputs(
+        UncertainArray(np.zeros(3), np.array([0.5, 0.0, 2.0]))
+    ).generators
+    assert isinstance(generators, csr_matrix)
+    assert_equal(generators.toarray(), np.array([[0.5, 0.0], [0.0, 0.0], [0.0, 2.0]]))
+
+
+def test_uncertain_inputs_from_covariance_factor_keeps_factor() -> None:
+    factor = np.array([[1.0, 0.0], [0.5, 0.5], [0.0, 2.0]])
+    uncertain_inputs = UncertainInputs.from_covariance_factor(np.zeros(3), factor)
+    assert uncertain_inputs.generators is factor
+    assert_almost_equal(uncertain_inputs.uncertainties, factor @ factor.T)
+
+
+def test_uncertain_inputs_with_diagonal_covariance_has_same_theta_0() -> None:
+    assert (
+        UncertainInputs(
+            UncertainArray(np.array([1.0, 2.0]), np.diag([0.25, 0.04]))
+        ).theta_0_array
+        == UncertainInputs(
+            UncertainArray(np.array([1.0, 2.0]), np.array([0.5, 0.2]))
+        ).theta_0_array
+    )
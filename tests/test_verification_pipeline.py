@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+from numpy.ma.testutils import assert_almost_equal
+from numpy.testing import assert_equal
+
+from lp_nn_robustness_verification.data_acquisition.activation_functions import (
+    Identity,
+    QuadLU,
+    Sigmoid,
+)
+from lp_nn_robustness_verification.data_acquisition.uncertain_inputs import (
+    UncertainInputs,
+)
+from lp_nn_robustness_verification.data_types import (
+    ActivationFunc,
+    NNParams,
+    UncertainArray,
+)
+from lp_nn_robustness_verification.lp_backends import HiGHSBackend
+from lp_nn_robustness_verification.pre_processing import LinearInclusion
+from lp_nn_robustness_verification.verification_pipeline import (
+    check_interval_dominance,
+    PipelineDecision,
+    search_counterexample,
+    Tier,
+    verify,
+)
+
+
+def _linear_inclusion(
+    values: list[float],
+    uncertainties: list[float],
+    activation: ActivationFunc = Sigmoid,
+    nn_params: NNParams = NNParams(),
+) -> LinearInclusion:
+    return LinearInclusion(
+        UncertainInputs(UncertainArray(np.array(values), np.array(uncertainties))),
+        activation,
+        nn_params,
+    )
+
+
+@pytest.fixture
+def undecided_linear_inclusion() -> LinearInclusion:
+    """Neither the output intervals nor any vertex decide robustness"""
+    return _linear_inclusion(
+        [3.0, 1.0],
+        [0.4, 0.4],
+        Identity,
+        NNParams((np.zeros(2),), (np.array([[1.0, 0.0], [1.0, -1.0]]),)),
+    )
+
+
+def test_check_interval_dominance_bounds_margin() -> None:
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        check_interval_dominance(_linear_inclusion([2.0, 1.5], [0.2, 0.1], QuadLU), 0),
+        0.2,
+    )
+
+
+def test_search_counterexample_finds_vertex() -> None:
+    margin, counterexample = search_counterexample(
+        _linear_inclusion([1.5, 0.5], [0.5, 0.6], Identity), 0
+    )
+    assert_almost_equal(margin, -0.1)  # type: ignore[no-untyped-call]
+    assert_almost_equal(  # type: ignore[no-untyped-call]
+        counterexample, np.array([1.0, 1.1])
+    )
+
+
+def test_search_counterexample_stays_within_input_region() -> None:
+    linear_inclusion = _linear_inclusion([1.0, 0.5], [0.2, 0.1])
+    _, candidate = search_counterexample(linear_inclusion, 0)
+    assert np.all(candidate >= linear_inclusion.theta_arrays[0].lo)
+    assert np.all(candidate <= linear_inclusion.theta_arrays[0].hi)
+
+
+def test_search_counterexample_stays_within_correlated_input_region() -> None:
+    covariance = np.array([[0.25, 0.2], [0.2, 0.25]])
+    linear_inclusion = LinearInclusion(
+        UncertainInputs(UncertainArray(np.array([1.0, 0.9]), covariance)), Identity
+    )
+    _, candidate = search_counterexample(linear_inclusion, 0)
+    deviation = candidate - np.array([1.0, 0.9])
+    assert deviation @ np.linalg.solve(covariance, deviation) <= 1.0 + 1e-12
+
+
+def test_verify_returns_decision() -> None:
+    assert isinstance(
+        verify(_linear_inclusion([1.0, 0.5], [0.2, 0.1])), PipelineDecision
+    )
+
+
+def test_verify_decides_by_interval_dominance() -> None:
+    decision = verify(_linear_inclusion([1.0, 0.5], [0.2, 0.1]))
+    assert decision.robust
+    assert_equal(decision.tier, Tier.INTERVAL_DOMINANCE)
+    assert decision.verifier is None
+
+
+def test_verify_decides_by_falsification() -> None:
+    decision = verify(_linear_inclusion([-1.2, 0.2], [0.5, 1.0]))
+    assert decision.robust is False
+    assert_equal(decision.tier, Tier.FALSIFICATION)
+    assert decision.counterexample is not None
+
+
+def test_verify_falls_back_to_linear_program(
+    undecided_linear_inclusion: LinearInclusion,
+) -> None:
+    decision = verify(undecided_linear_inclusion, HiGHSBackend())
+    assert decision.robust is None
+    assert_equal(decision.tier, Tier.LINEAR_PROGRAM)
+    assert_almost_equal(decision.margin, -0.2)  # type: ignore[no-untyped-call]
+    assert decision.verifier is not None
+
+
+def test_verify_solves_reduced_linear_program(
+    undecided_linear_inclusion: LinearInclusion,
+) -> None:
+    decision = verify(undecided_linear_inclusion, HiGHSBackend(), reduce=True)
+    assert_almost_equal(decision.margin, -0.2)  # type: ignore[no-untyped-call]